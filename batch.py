@@ -0,0 +1,214 @@
+# Word Search Mania is under the MIT License
+#
+# Copyright (c) 2018 Mihir Patel
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Generate packs of puzzles from the command line without starting the GUI.
+
+Puzzles are spread over a multiprocessing pool. Puzzle i is generated from
+its own random.Random(seed + i), so a pack is reproducible and identical no
+matter how many workers built it. Workers serialize their puzzles
+themselves, leaving the parent process to stream the results to disk.
+
+Pack format: MAGIC, then for every puzzle its seed, the byte length of the
+packed puzzle and the bytes from Puzzle.toBytes.
+
+Usage:
+    python3 source1.py generate --count 1000 --size 20 --out pack.jsonl
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import struct
+import sys
+import time
+
+import dictionary
+import generator
+import solver
+
+
+PACK_MAGIC = b'WSMP\x01'
+
+_RECORD = struct.Struct('<QI')
+
+DIRECTION_OPTIONS = {
+    'rows': (generator.ROW,),
+    'columns': (generator.COLUMN,),
+    'diagonals': (generator.FORWARD_DIAGONAL, generator.BACKWARD_DIAGONAL),
+}
+
+# Set in each worker by _initWorker
+_worker = {}
+
+
+def parseDirections(text):
+    """Return the generator directions for a comma separated list such as 'rows,diagonals'."""
+    directions = []
+    for name in text.split(','):
+        name = name.strip()
+        if name not in DIRECTION_OPTIONS:
+            raise argparse.ArgumentTypeError('unknown direction ' + repr(name) + '; choose from '
+                                             + ', '.join(DIRECTION_OPTIONS))
+        directions.extend(DIRECTION_OPTIONS[name])
+    return tuple(sorted(set(directions)))
+
+
+def _initWorker(wordsPath, nElements, directions, outputFormat, dense, wordCount, density, verify):
+    """Load the shared dictionary mapping once per worker."""
+    _worker['verify'] = verify
+    _worker['wordList'] = dictionary.loadDictionary(wordsPath)
+    _worker['nElements'] = nElements
+    _worker['directions'] = directions
+    _worker['format'] = outputFormat
+    _worker['dense'] = dense
+    _worker['wordCount'] = wordCount
+    _worker['density'] = density
+
+
+def _generate(seed):
+    """Generate the puzzle for seed with the worker's settings."""
+    rng = random.Random(seed)
+    if _worker['dense']:
+        return generator.generateDensePuzzle(_worker['nElements'], _worker['wordList'], _worker['directions'], rng,
+                                             _worker['wordCount'], _worker['density'])
+    return generator.generatePuzzle(_worker['nElements'], _worker['wordList'], _worker['directions'], rng)
+
+
+def _extraOccurrences(puzzle):
+    """Return how many times bank words appear in puzzle besides where they were placed."""
+    return len(solver.solvePuzzle(puzzle)) - len(puzzle.placements)
+
+
+def _generateChunk(seeds):
+    """Generate one puzzle per seed and return them serialized with the verified extra occurrences."""
+    records = []
+    extra = 0
+    for seed in seeds:
+        puzzle = _generate(seed)
+        if _worker['verify']:
+            extra += _extraOccurrences(puzzle)
+        if _worker['format'] == 'jsonl':
+            record = puzzle.toDict()
+            record['seed'] = seed
+            records.append((json.dumps(record, separators=(',', ':')) + '\n').encode('ascii'))
+        else:
+            packed = puzzle.toBytes()
+            records.append(_RECORD.pack(seed, len(packed)) + packed)
+    return b''.join(records), extra
+
+
+def _chunks(seeds, size):
+    for start in range(0, len(seeds), size):
+        yield seeds[start:start + size]
+
+
+def readPack(path):
+    """Yield (seed, Puzzle) for every puzzle in the pack at path."""
+    with open(path, 'rb') as packFile:
+        if packFile.read(len(PACK_MAGIC)) != PACK_MAGIC:
+            raise ValueError(path + ' is not a puzzle pack')
+        while True:
+            head = packFile.read(_RECORD.size)
+            if not head:
+                return
+            seed, length = _RECORD.unpack(head)
+            yield seed, generator.Puzzle.fromBytes(packFile.read(length))
+
+
+def main(argv=None):
+    """Run the generate command and return the process exit code."""
+    parser = argparse.ArgumentParser(prog='source1.py generate', description='Generate a pack of puzzles.')
+    parser.add_argument('--count', type=int, required=True, help='number of puzzles to generate')
+    parser.add_argument('--size', type=int, default=20, help='number of rows and columns (default 20)')
+    parser.add_argument('--directions', type=parseDirections, default=generator.ALL_DIRECTIONS,
+                        help='comma separated rows, columns, diagonals (default all)')
+    parser.add_argument('--words', default='words_alpha.txt', help='word list to draw words from')
+    parser.add_argument('--dense', action='store_true',
+                        help='pack crossing words until --word-count or --density is reached')
+    parser.add_argument('--word-count', type=int, default=None, help='words per dense puzzle')
+    parser.add_argument('--density', type=float, default=None,
+                        help='fraction of cells covered by words in a dense puzzle (default {})'.format(
+                            generator.DEFAULT_DENSITY))
+    parser.add_argument('--seed', type=int, default=None, help='seed of the first puzzle (default random)')
+    parser.add_argument('--format', choices=('jsonl', 'pack'), default='jsonl', help='output format')
+    parser.add_argument('--out', default='-', help="output file, or '-' for stdout (jsonl only)")
+    parser.add_argument('--verify', action='store_true',
+                        help='solve every puzzle and report bank words that appear more than once')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='worker processes (default all cores)')
+    args = parser.parse_args(argv)
+
+    if not 1 <= args.size <= generator.MAX_ELEMENTS:
+        parser.error('--size must be between 1 and ' + str(generator.MAX_ELEMENTS))
+    if args.count < 1:
+        parser.error('--count must be at least 1')
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+    if args.word_count is not None and args.word_count < 1:
+        parser.error('--word-count must be at least 1')
+    if args.density is not None and not 0 < args.density <= 1:
+        parser.error('--density must be above 0 and at most 1')
+    if args.out == '-' and args.format == 'pack':
+        parser.error('--format pack needs --out')
+    if not args.dense and (args.word_count is not None or args.density is not None):
+        parser.error('--word-count and --density need --dense')
+    if args.seed is None:
+        args.seed = random.randrange(2 ** 32)
+    # Pack records store every seed as an unsigned 64-bit integer
+    if args.seed < 0 or args.seed + args.count > 2 ** 64:
+        parser.error('--seed must be at least 0 and leave room for --count seeds below 2**64')
+
+    # Compile the index up front so workers only map it
+    dictionary.loadDictionary(args.words)
+
+    seeds = range(args.seed, args.seed + args.count)
+    chunkSize = max(1, min(64, args.count // (args.workers * 8)))
+    start = time.perf_counter()
+
+    out = sys.stdout.buffer if args.out == '-' else open(args.out, 'wb')
+    try:
+        if args.format == 'pack':
+            out.write(PACK_MAGIC)
+        initArgs = (args.words, args.size, args.directions, args.format, args.dense, args.word_count, args.density,
+                    args.verify)
+        extra = 0
+        with multiprocessing.Pool(args.workers, _initWorker, initArgs) as pool:
+            for data, chunkExtra in pool.imap(_generateChunk, _chunks(seeds, chunkSize)):
+                out.write(data)
+                extra += chunkExtra
+    except BaseException:
+        if out is not sys.stdout.buffer:
+            # A pack cut short would read as a smaller valid one
+            out.close()
+            os.remove(args.out)
+        raise
+    finally:
+        if out is not sys.stdout.buffer:
+            out.close()
+
+    elapsed = time.perf_counter() - start
+    print('Generated {} puzzles in {:.2f} s ({:.0f} puzzles/s) from seed {}'.format(
+        args.count, elapsed, args.count / elapsed, args.seed), file=sys.stderr)
+    if args.verify:
+        print('Verified: {} extra occurrences of bank words'.format(extra), file=sys.stderr)
+    return 0
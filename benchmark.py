@@ -0,0 +1,711 @@
+# Word Search Mania is under the MIT License
+#
+# Copyright (c) 2018 Mihir Patel
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark puzzle generation and the game board.
+
+Usage:
+    python3 benchmark.py generation [--dictionary words_alpha.txt] [--sizes 10 20 40 100 200] [--repeat 3]
+    python3 benchmark.py board [--size 40] [--clicks 500]
+    python3 benchmark.py hover [--dictionary words_alpha.txt] [--size 40] [--moves 5000]
+    python3 benchmark.py solver [--dictionary words_alpha.txt] [--size 500] [--words 5000]
+    python3 benchmark.py clicks [--dictionary words_alpha.txt] [--size 40] [--selections 2000000]
+    python3 benchmark.py server [--sessions 1000] [--concurrency 50] [--size 20] [--port PORT]
+    python3 benchmark.py suite [--dictionary words_alpha.txt] [--repeat 3] [--scores 100000] [--out results.json]
+
+The board, hover and suite benchmarks run headless on Qt's offscreen platform.
+Each board variant runs in its own process so the resident memory numbers do
+not mix. The server benchmark plays whole games against server.py, started
+in a child process unless --port names one already running. The suite runs
+every measurement the game depends on and writes them as JSON, so runs on
+different versions can be compared.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import dictionary
+import gamestate
+import generator
+import solver
+
+
+class _RedrawBuilder(generator._Builder):
+    """Builder drawing words the way createTable did before WordSampler.
+
+    Every attempt draws from the whole word list, redrawing words under 3
+    letters, and throws the word away if it is already hidden or too long
+    for the slot.
+    """
+
+    def __init__(self, nElements, wordList, rng):
+        super().__init__(nElements, wordList, rng)
+        self.wordList = wordList
+        self.usedWords = set()
+        self.draws = 0
+
+    def drawWord(self, maxLength):
+        last = len(self.wordList) - 1
+        word = self.wordList[self.rng.randint(0, last)]
+        self.draws += 1
+        while len(word) < 3:
+            word = self.wordList[self.rng.randint(0, last)]
+            self.draws += 1
+        if self.isDuplicate(word) or len(word) > maxLength:
+            return None
+        return word
+
+    def slotChance(self, maxLength):
+        # drawWord throws away the words that do not fit
+        return 1.0
+
+    def isDuplicate(self, word):
+        return word in self.usedWords
+
+    def place(self, word, row, col, direction):
+        super().place(word, row, col, direction)
+        self.usedWords.add(word)
+
+
+class _LinearScanBuilder(_RedrawBuilder):
+    """Builder using the duplicate check createTable had before usedWords.
+
+    Every candidate word re-splits the whole word bank string and compares
+    against each placed word, which is what the set lookup replaced.
+    """
+
+    def __init__(self, nElements, wordList, rng):
+        super().__init__(nElements, wordList, rng)
+        self.wordBank = ""
+
+    def isDuplicate(self, word):
+        wordDuplicate = False
+        for x in self.wordBank.split():
+            if x == word:
+                wordDuplicate = True
+        return wordDuplicate
+
+    def place(self, word, row, col, direction):
+        super().place(word, row, col, direction)
+        self.wordBank += word + "\n"
+
+
+def _timeBuild(builderClass, nElements, wordList, seed, repeat):
+    """Return the median seconds of building one puzzle and the last builder."""
+    timings = []
+    for _ in range(repeat):
+        builder = builderClass(nElements, wordList, random.Random(seed))
+        start = time.perf_counter()
+        generator._build(builder, generator.ALL_DIRECTIONS)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), builder
+
+
+def benchGeneration(wordList, sizes, repeat):
+    """Print generation time per grid size for the duplicate checks and for WordSampler.
+
+    The first table compares rescanning the word bank string with the set
+    lookup, both redrawing words until they fit. The second compares the set
+    lookup with WordSampler. Only the placement passes are timed; filling
+    the grid and the uniqueness repair are the same for all and left out.
+    """
+    print('{:>6} {:>7} {:>12} {:>12} {:>8}'.format('rows', 'words', 'scan (ms)', 'set (ms)', 'speedup'))
+    for nElements in sizes:
+        scanTime, scan = _timeBuild(_LinearScanBuilder, nElements, wordList, nElements, repeat)
+        setTime, _ = _timeBuild(_RedrawBuilder, nElements, wordList, nElements, repeat)
+        print('{:>6} {:>7} {:>12.2f} {:>12.2f} {:>7.1f}x'.format(
+            nElements, len(scan.placements), scanTime * 1000, setTime * 1000, scanTime / setTime))
+    print()
+    print('{:>6} {:>7} {:>12} {:>12} {:>7} {:>12} {:>8}'.format('rows', 'words', 'redraw (ms)', 'draws/word',
+                                                                 'words', 'sampler (ms)', 'speedup'))
+    for nElements in sizes:
+        redrawTime, redraw = _timeBuild(_RedrawBuilder, nElements, wordList, nElements, repeat)
+        samplerTime, sampler = _timeBuild(generator._Builder, nElements, wordList, nElements, repeat)
+        print('{:>6} {:>7} {:>12.2f} {:>12.1f} {:>7} {:>12.2f} {:>7.1f}x'.format(
+            nElements, len(redraw.placements), redrawTime * 1000, redraw.draws / max(1, len(redraw.placements)),
+            len(sampler.placements), samplerTime * 1000, redrawTime / samplerTime))
+    print('Median of {} builds per size, placement passes only'.format(repeat))
+
+
+def _rssBytes():
+    """Return the resident memory of this process in bytes."""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _boardPuzzle(nElements):
+    """Return a puzzle of random letters; the board cost does not depend on the words."""
+    rng = random.Random(nElements)
+    grid = bytearray(rng.choice(generator.FILLER_LETTERS) for _ in range(nElements * nElements))
+    return generator.Puzzle(nElements, grid, [])
+
+
+def _runBoardVariant(variant, nElements, clicks):
+    """Build one board variant, click it and return its measurements."""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    import PyQt5.QtCore
+    from PyQt5.QtGui import QColor
+    from PyQt5.QtWidgets import QApplication, QTableView, QTableWidget, QTableWidgetItem
+    import source1
+
+    app = QApplication.instance() or QApplication([])
+    puzzle = _boardPuzzle(nElements)
+    rng = random.Random(0)
+    baseline = _rssBytes()
+    start = time.perf_counter()
+
+    if variant == 'widget':
+        # The QTableWidget path App used before BoardModel
+        table = QTableWidget()
+        table.setRowCount(nElements)
+        table.setColumnCount(nElements)
+        for y in range(0, nElements):
+            for x in range(0, nElements):
+                table.setItem(x, y, QTableWidgetItem(puzzle.letter(x, y)))
+                table.item(x, y).setTextAlignment(PyQt5.QtCore.Qt.AlignCenter)
+                table.setColumnWidth(x, 20)
+                table.setRowHeight(y, 20)
+
+        def click(row, col):
+            letter = table.item(row, col).text()
+            if letter.isupper():
+                table.setItem(row, col, QTableWidgetItem(letter.lower()))
+            else:
+                table.setItem(row, col, QTableWidgetItem(letter.upper()))
+                table.item(row, col).setBackground(QColor(216, 191, 216))
+            table.item(row, col).setTextAlignment(PyQt5.QtCore.Qt.AlignCenter)
+            wordSelected = ""
+            for x in range(0, nElements):
+                for y in range(0, nElements):
+                    if table.item(x, y).text().isupper():
+                        wordSelected += table.item(x, y).text()
+            return wordSelected
+    else:
+        table = QTableView()
+        model = source1.BoardModel(gamestate.GameState(puzzle))
+        table.setModel(model)
+        for x in range(0, nElements):
+            table.setColumnWidth(x, 20)
+            table.setRowHeight(x, 20)
+
+        def click(row, col):
+            model.setFlag(row, col, model.SELECTED, not model.hasFlag(row, col, model.SELECTED))
+            return "".join(puzzle.letter(x, y) for x, y in model.selectedCells())
+
+    table.resize(nElements * 20 + 40, nElements * 20 + 40)
+    table.show()
+    app.processEvents()
+    buildTime = time.perf_counter() - start
+    memory = _rssBytes() - baseline
+
+    timings = []
+    for _ in range(clicks):
+        row, col = rng.randrange(nElements), rng.randrange(nElements)
+        start = time.perf_counter()
+        click(row, col)
+        app.processEvents()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+
+    return {
+        'variant': variant,
+        'nElements': nElements,
+        'buildSeconds': buildTime,
+        'memoryBytes': memory,
+        'clickMedianSeconds': statistics.median(timings),
+        'clickP99Seconds': timings[int(len(timings) * 0.99) - 1],
+    }
+
+
+def benchBoard(nElements, clicks):
+    """Print build time, memory and click latency of the QTableWidget and BoardModel boards."""
+    print('{:>8} {:>10} {:>12} {:>14} {:>14}'.format('board', 'build (ms)', 'memory (KB)', 'click p50 (ms)',
+                                                     'click p99 (ms)'))
+    for variant in ('widget', 'model'):
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), '_board', variant,
+                                 '--size', str(nElements), '--clicks', str(clicks)],
+                                check=True, stdout=subprocess.PIPE).stdout
+        result = json.loads(output.decode().splitlines()[-1])
+        print('{:>8} {:>10.1f} {:>12.0f} {:>14.3f} {:>14.3f}'.format(
+            variant, result['buildSeconds'] * 1000, result['memoryBytes'] / 1024,
+            result['clickMedianSeconds'] * 1000, result['clickP99Seconds'] * 1000))
+
+
+def benchHover(wordsPath, nElements, moves):
+    """Print the latency of App.cellHover on a board with every word found."""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt5.QtWidgets import QApplication
+    import source1
+
+    app = QApplication.instance() or QApplication([])
+    source1.DICTIONARY_FILE = wordsPath
+    source1.nElements = nElements
+    window = source1.MainWindow()
+    window.showScreen(source1.App)
+    game = window.screens[source1.App]
+    puzzle = game.puzzle
+    found = [cell for placement in puzzle.placements for cell in puzzle.cells(placement)]
+    game.boardModel.updateCells(found, source1.BoardModel.FOUND)
+    app.processEvents()
+
+    rng = random.Random(0)
+    row, col = 0, 0
+    timings = []
+    for _ in range(moves):
+        row = min(nElements - 1, max(0, row + rng.choice((-1, 0, 1))))
+        col = min(nElements - 1, max(0, col + rng.choice((-1, 0, 1))))
+        start = time.perf_counter()
+        game.cellHover(row, col)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+
+    print('{} rows, {} found cells, {} moves: p50 {:.1f} us, p99 {:.1f} us, max {:.1f} us'.format(
+        nElements, len(found), moves, statistics.median(timings) * 1e6,
+        timings[int(len(timings) * 0.99) - 1] * 1e6, timings[-1] * 1e6))
+
+
+def benchClicks(wordList, nElements, selections):
+    """Print how many clicks per second GameState selects and validates, without Qt.
+
+    The clicks solve the whole puzzle, word by word, with a stray click on
+    and off a random cell before each word, and start over on a fresh
+    GameState once every word is found.
+    """
+    puzzle = generator.generatePuzzle(nElements, wordList, rng=random.Random(nElements))
+    rng = random.Random(0)
+    script = []
+    for placement in puzzle.placements:
+        stray = (rng.randrange(nElements), rng.randrange(nElements))
+        script += [stray, stray] + puzzle.cells(placement)
+
+    games = -(-selections // len(script))
+    found = 0
+    start = time.perf_counter()
+    for _ in range(games):
+        state = gamestate.GameState(puzzle)
+        toggle = state.toggle
+        checkSelection = state.checkSelection
+        for row, col in script:
+            toggle(row, col)
+            if checkSelection() is not None:
+                found += 1
+    elapsed = time.perf_counter() - start
+    clicks = games * len(script)
+    assert found == games * len(puzzle.placements)
+
+    print('{} rows, {} words, {} clicks: {:.2f} million clicks/s, {:.0f} ns per click'.format(
+        nElements, len(puzzle.placements), clicks, clicks / elapsed / 1e6, elapsed / clicks * 1e9))
+
+
+async def _request(reader, writer, request):
+    """Send one request to the game server and return its reply."""
+    writer.write(json.dumps(request).encode('ascii') + b'\n')
+    await writer.drain()
+    reply = json.loads(await reader.readline())
+    if not reply['ok']:
+        raise RuntimeError(reply['error'])
+    return reply
+
+
+async def _playSessions(host, port, count, newGame, moveTimings, gameTimings):
+    """Play count games to the end over one connection, timing every request."""
+    reader, writer = await asyncio.open_connection(host, port, limit=1 << 24)
+    try:
+        for _ in range(count):
+            start = time.perf_counter()
+            game = await _request(reader, writer, newGame)
+            gameTimings.append(time.perf_counter() - start)
+
+            # A word can show up more than once; try each occurrence until the server takes one
+            nElements = len(game['rows'])
+            grid = ''.join(game['rows']).encode('ascii')
+            occurrences = {}
+            for occurrence in solver.Solver(game['words']).findAll(grid, nElements):
+                occurrences.setdefault(occurrence.word, []).append(occurrence)
+            for word in game['words']:
+                for occurrence in occurrences[word]:
+                    for row, col in occurrence.cells():
+                        start = time.perf_counter()
+                        reply = await _request(reader, writer, {'op': 'click', 'session': game['session'],
+                                                                'row': row, 'col': col})
+                        moveTimings.append(time.perf_counter() - start)
+                    if reply['found'] == word:
+                        break
+                    await _request(reader, writer, {'op': 'clear', 'session': game['session']})
+            reply = await _request(reader, writer, {'op': 'end', 'session': game['session']})
+            assert reply['complete']
+    finally:
+        writer.close()
+
+
+async def _loadTest(host, port, sessions, concurrency, newGame):
+    """Play sessions games over concurrency connections and return the timings."""
+    moveTimings = []
+    gameTimings = []
+    counts = [sessions // concurrency + (i < sessions % concurrency) for i in range(concurrency)]
+    start = time.perf_counter()
+    await asyncio.gather(*(_playSessions(host, port, count, newGame, moveTimings, gameTimings)
+                           for count in counts if count))
+    return time.perf_counter() - start, moveTimings, gameTimings
+
+
+def benchServer(wordsPath, host, port, sessions, concurrency, nElements, directions, dense):
+    """Print sessions per second and the move latency of server.py under concurrent players."""
+    process = None
+    workDir = None
+    if port is None:
+        workDir = tempfile.mkdtemp(prefix='wsm-server-')
+        serverPath = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'server.py')
+        process = subprocess.Popen([sys.executable, serverPath, '--host', host, '--port', '0', '--words', wordsPath,
+                                    '--cache', os.path.join(workDir, 'puzzle_cache')],
+                                   stdout=subprocess.PIPE)
+        port = int(process.stdout.readline().decode().rsplit(':', 1)[1])
+    try:
+        newGame = {'op': 'new', 'size': nElements, 'directions': directions, 'dense': dense}
+        elapsed, moveTimings, gameTimings = asyncio.run(_loadTest(host, port, sessions, concurrency, newGame))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+            shutil.rmtree(workDir, ignore_errors=True)
+
+    moves = _latency(moveTimings)
+    games = _latency(gameTimings)
+    print('{} sessions of {} rows over {} connections in {:.2f} s: {:.1f} sessions/s'.format(
+        sessions, nElements, concurrency, elapsed, sessions / elapsed))
+    print('new game: p50 {:.2f} ms, p99 {:.2f} ms'.format(games['medianSeconds'] * 1000, games['p99Seconds'] * 1000))
+    print('{} moves, {:.0f} moves/s: p50 {:.3f} ms, p99 {:.3f} ms'.format(
+        moves['samples'], moves['samples'] / elapsed, moves['medianSeconds'] * 1000, moves['p99Seconds'] * 1000))
+
+
+def benchSolver(wordList, nElements, wordCount):
+    """Print the time to build a Solver for wordCount bank words and scan a grid with it."""
+    puzzle = generator.generatePuzzle(nElements, wordList, rng=random.Random(nElements))
+    words = puzzle.wordBank[:wordCount]
+
+    start = time.perf_counter()
+    wordSolver = solver.Solver(words)
+    buildTime = time.perf_counter() - start
+    start = time.perf_counter()
+    occurrences = wordSolver.findAll(puzzle.grid, nElements)
+    coldTime = time.perf_counter() - start
+    start = time.perf_counter()
+    wordSolver.findAll(puzzle.grid, nElements)
+    warmTime = time.perf_counter() - start
+
+    print('{} rows, {} words, {} occurrences: build {:.0f} ms, first scan {:.0f} ms, next scan {:.0f} ms'.format(
+        nElements, len(words), len(occurrences), buildTime * 1000, coldTime * 1000, warmTime * 1000))
+
+
+SUITE_SIZES = (10, 20, 40, 200)
+# Marathon boards are timed once with every direction; the game no longer offers dense boards this large
+SUITE_MARATHON_SIZES = (500,)
+SUITE_DIRECTION_MODES = {
+    'rows': (generator.ROW,),
+    'columns': (generator.COLUMN,),
+    'diagonals': (generator.FORWARD_DIAGONAL, generator.BACKWARD_DIAGONAL),
+    'all': generator.ALL_DIRECTIONS,
+}
+
+
+def _latency(timings):
+    """Return the median, 99th percentile and maximum of timings in seconds."""
+    timings = sorted(timings)
+    return {
+        'medianSeconds': statistics.median(timings),
+        'p99Seconds': timings[max(0, int(len(timings) * 0.99) - 1)],
+        'maxSeconds': timings[-1],
+        'samples': len(timings),
+    }
+
+
+def _median(function, repeat):
+    """Return the median seconds of repeat calls of function and its last result."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def _suiteDictionary(wordsPath, workDir, repeat):
+    """Measure compiling the dictionary index, opening it and drawing words from it."""
+    indexPath = os.path.join(workDir, 'words.idx')
+    compileTime, _ = _median(lambda: dictionary.compileIndex(wordsPath, indexPath), repeat)
+
+    def openIndex():
+        index = dictionary.WordIndex(indexPath)
+        index.close()
+    openTime, _ = _median(openIndex, repeat)
+
+    index = dictionary.WordIndex(indexPath)
+    rng = random.Random(0)
+    draws = [rng.randrange(len(index)) for _ in range(100000)]
+    start = time.perf_counter()
+    for i in draws:
+        index[i]
+    drawTime = (time.perf_counter() - start) / len(draws)
+    words = len(index)
+    index.close()
+    return [{'name': 'dictionary', 'params': {'words': words},
+             'metrics': {'compileSeconds': compileTime, 'openSeconds': openTime, 'drawSeconds': drawTime}}]
+
+
+def _suiteGeneration(wordList, repeat):
+    """Measure both engines at every suite size and direction mode, and once at marathon sizes."""
+    results = []
+    for nElements in SUITE_SIZES:
+        for mode, directions in SUITE_DIRECTION_MODES.items():
+            for engine, generate in (('standard', generator.generatePuzzle),
+                                     ('dense', generator.generateDensePuzzle)):
+                seconds, puzzle = _median(
+                    lambda: generate(nElements, wordList, directions, random.Random(nElements)), repeat)
+                results.append({'name': 'generation',
+                                'params': {'nElements': nElements, 'directions': mode, 'engine': engine},
+                                'metrics': {'seconds': seconds, 'words': len(puzzle.placements)}})
+    for nElements in SUITE_MARATHON_SIZES:
+        for engine, generate in (('standard', generator.generatePuzzle), ('dense', generator.generateDensePuzzle)):
+            seconds, puzzle = _median(
+                lambda: generate(nElements, wordList, generator.ALL_DIRECTIONS, random.Random(nElements)), 1)
+            results.append({'name': 'generation',
+                            'params': {'nElements': nElements, 'directions': 'all', 'engine': engine},
+                            'metrics': {'seconds': seconds, 'words': len(puzzle.placements)}})
+    return results
+
+
+def _suiteGame(wordsPath, nElements, moves):
+    """Measure createTable, selection validation, hover handling and word bank updates on one game."""
+    from PyQt5.QtCore import QItemSelectionModel
+    from PyQt5.QtWidgets import QApplication
+    import source1
+
+    app = QApplication.instance() or QApplication([])
+    source1.DICTIONARY_FILE = wordsPath
+    source1.replaySettings = source1.GameSettings(nElements, generator.ALL_DIRECTIONS, wordsPath, False, nElements)
+    # A next game built on the prefetch thread would compete with the timed loops for the interpreter
+    prefetchNextGame = source1.prefetchNextGame
+    source1.prefetchNextGame = lambda: None
+    window = source1.MainWindow()
+    start = time.perf_counter()
+    window.showScreen(source1.App)
+    app.processEvents()
+    createTime = time.perf_counter() - start
+    game = window.screens[source1.App]
+    puzzle = game.puzzle
+    params = {'nElements': nElements, 'words': len(puzzle.placements)}
+
+    # Select every word a cell at a time, so each click is validated
+    clickTimings = []
+    for placement in puzzle.placements:
+        for row, col in puzzle.cells(placement):
+            game.tableView.selectionModel().select(game.boardModel.index(row, col), QItemSelectionModel.Select)
+            start = time.perf_counter()
+            game.onClickLetter()
+            clickTimings.append(time.perf_counter() - start)
+    assert game.gameState.complete
+
+    rng = random.Random(0)
+    row, col = 0, 0
+    hoverTimings = []
+    for _ in range(moves):
+        row = min(nElements - 1, max(0, row + rng.choice((-1, 0, 1))))
+        col = min(nElements - 1, max(0, col + rng.choice((-1, 0, 1))))
+        start = time.perf_counter()
+        game.cellHover(row, col)
+        hoverTimings.append(time.perf_counter() - start)
+
+    # Strike every word again on a fresh bank
+    game.wordBankModel = source1.WordBankModel(game.puzzle.wordBank, game.wordBankBox)
+    game.wordBankBox.setModel(game.wordBankModel)
+    strikeTimings = []
+    for word in game.wordBankModel.words:
+        start = time.perf_counter()
+        game.strikeWord(word)
+        strikeTimings.append(time.perf_counter() - start)
+    game.timer.stop()
+    window.close()
+    app.processEvents()
+    source1.prefetchNextGame = prefetchNextGame
+
+    return [{'name': 'createTable', 'params': params, 'metrics': {'seconds': createTime}},
+            {'name': 'validation', 'params': params, 'metrics': _latency(clickTimings)},
+            {'name': 'hover', 'params': params, 'metrics': _latency(hoverTimings)},
+            {'name': 'wordBank', 'params': params, 'metrics': _latency(strikeTimings)}]
+
+
+def _suiteHighScores(workDir, scoreCount, repeat):
+    """Measure importing and displaying a history of scoreCount high scores."""
+    from PyQt5.QtWidgets import QApplication
+    import scores
+    import source1
+
+    app = QApplication.instance() or QApplication([])
+    rng = random.Random(0)
+    legacyPath = os.path.join(workDir, 'highscores.txt')
+    with open(legacyPath, 'w') as legacyFile:
+        for _ in range(scoreCount):
+            legacyFile.write(rng.choice(scores.MODES) + '\n' + scores.formatTime(rng.randrange(30, 7200)) + '\n')
+
+    def importHistory():
+        store = scores.ScoreStore(os.path.join(workDir, 'import.db'))
+        store.connection.execute('DELETE FROM imports')
+        store.importTextFile(legacyPath)
+        store.close()
+    importTime, _ = _median(importHistory, 1)
+
+    source1._scoreStore = scores.ScoreStore(os.path.join(workDir, 'import.db'))
+    menu = source1.HighScoreMenu(None)
+    displayTime, _ = _median(menu.reset, repeat)
+    scoreCount = source1._scoreStore.connection.execute('SELECT COUNT(*) FROM scores').fetchone()[0]
+    source1._scoreStore.close()
+    source1._scoreStore = None
+    app.processEvents()
+    return [{'name': 'highScores', 'params': {'scores': scoreCount},
+             'metrics': {'importSeconds': importTime, 'displaySeconds': displayTime}}]
+
+
+def runSuite(wordsPath, repeat, scoreCount):
+    """Run every suite measurement and return the results with a description of the run."""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    import PyQt5.QtCore
+    import cache
+    import source1
+
+    workDir = tempfile.mkdtemp(prefix='wsm-benchmark-')
+    try:
+        # Keep the suite from reading or filling the player's puzzle cache
+        source1._puzzleCache = cache.PuzzleCache(os.path.join(workDir, 'puzzle_cache'))
+        wordList = dictionary.loadDictionary(wordsPath)
+        results = _suiteDictionary(wordsPath, workDir, repeat)
+        results += _suiteGeneration(wordList, repeat)
+        for nElements in (20, 40):
+            results += _suiteGame(wordsPath, nElements, 5000)
+        results += _suiteHighScores(workDir, scoreCount, repeat)
+    finally:
+        shutil.rmtree(workDir, ignore_errors=True)
+
+    return {
+        'recordedAt': time.time(),
+        'python': platform.python_version(),
+        'qt': PyQt5.QtCore.QT_VERSION_STR,
+        'numpy': generator.numpy.__version__ if generator.numpy is not None else None,
+        'platform': platform.platform(),
+        'dictionaryHash': wordList.sourceHash,
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark puzzle generation and the game board.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    generation = commands.add_parser('generation', help='time puzzle generation per grid size')
+    generation.add_argument('--dictionary', default='words_alpha.txt', help='word list to draw words from')
+    generation.add_argument('--sizes', type=int, nargs='+', default=[10, 20, 40, 100, 200],
+                            help='grid sizes to run')
+    generation.add_argument('--repeat', type=int, default=3, help='runs per size; the median is reported')
+
+    board = commands.add_parser('board', help='compare the QTableWidget and BoardModel boards')
+    board.add_argument('--size', type=int, default=40, help='number of rows and columns (default 40)')
+    board.add_argument('--clicks', type=int, default=500, help='number of simulated clicks')
+
+    hover = commands.add_parser('hover', help='time mouse hover handling with every word found')
+    hover.add_argument('--dictionary', default='words_alpha.txt', help='word list to draw words from')
+    hover.add_argument('--size', type=int, default=40, help='number of rows and columns (default 40)')
+    hover.add_argument('--moves', type=int, default=5000, help='number of simulated mouse moves')
+
+    solverCommand = commands.add_parser('solver', help='time the all-direction solver on a large grid')
+    solverCommand.add_argument('--dictionary', default='words_alpha.txt', help='word list to draw words from')
+    solverCommand.add_argument('--size', type=int, default=500, help='number of rows and columns (default 500)')
+    solverCommand.add_argument('--words', type=int, default=5000, help='number of bank words to search for')
+
+    clicks = commands.add_parser('clicks', help='time selection and validation in GameState without Qt')
+    clicks.add_argument('--dictionary', default='words_alpha.txt', help='word list to draw words from')
+    clicks.add_argument('--size', type=int, default=40, help='number of rows and columns (default 40)')
+    clicks.add_argument('--selections', type=int, default=2000000, help='number of simulated clicks')
+
+    serverCommand = commands.add_parser('server', help='play concurrent games against the game server')
+    serverCommand.add_argument('--dictionary', default='words_alpha.txt', help='word list the started server uses')
+    serverCommand.add_argument('--host', default='127.0.0.1', help='address of the server (default 127.0.0.1)')
+    serverCommand.add_argument('--port', type=int, default=None,
+                               help='port of a running server (default start one)')
+    serverCommand.add_argument('--sessions', type=int, default=1000, help='number of games to play')
+    serverCommand.add_argument('--concurrency', type=int, default=50, help='number of simultaneous players')
+    serverCommand.add_argument('--size', type=int, default=20, help='number of rows and columns (default 20)')
+    serverCommand.add_argument('--directions', default='rows,columns,diagonals',
+                               help='comma separated rows, columns, diagonals (default all)')
+    serverCommand.add_argument('--dense', action='store_true', help='play dense puzzles')
+
+    suite = commands.add_parser('suite', help='run every benchmark and write the results as JSON')
+    suite.add_argument('--dictionary', default='words_alpha.txt', help='word list to draw words from')
+    suite.add_argument('--repeat', type=int, default=3, help='runs per measurement; the median is reported')
+    suite.add_argument('--scores', type=int, default=100000, help='number of high scores in the history')
+    suite.add_argument('--out', help='JSON file to write instead of standard output')
+
+    variant = commands.add_parser('_board')
+    variant.add_argument('variant', choices=('widget', 'model'))
+    variant.add_argument('--size', type=int, default=40)
+    variant.add_argument('--clicks', type=int, default=500)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'generation':
+        benchGeneration(dictionary.loadDictionary(args.dictionary), args.sizes, args.repeat)
+    elif args.command == 'board':
+        benchBoard(args.size, args.clicks)
+    elif args.command == 'hover':
+        benchHover(args.dictionary, args.size, args.moves)
+    elif args.command == 'solver':
+        benchSolver(dictionary.loadDictionary(args.dictionary), args.size, args.words)
+    elif args.command == 'clicks':
+        benchClicks(dictionary.loadDictionary(args.dictionary), args.size, args.selections)
+    elif args.command == 'server':
+        benchServer(args.dictionary, args.host, args.port, args.sessions, args.concurrency, args.size,
+                    args.directions, args.dense)
+    elif args.command == 'suite':
+        report = runSuite(args.dictionary, args.repeat, args.scores)
+        if args.out:
+            with open(args.out, 'w') as out:
+                json.dump(report, out, indent=2)
+        else:
+            print(json.dumps(report, indent=2))
+    else:
+        print(json.dumps(_runBoardVariant(args.variant, args.size, args.clicks)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+# Word Search Mania is under the MIT License
+#
+# Copyright (c) 2018 Mihir Patel
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Keep generated puzzles on disk so the same game code loads instead of regenerating.
+
+Each puzzle is stored in its own file, named by the SHA-1 of its game code,
+as zlib-compressed Puzzle.toBytes(). Reading a puzzle touches its file, and
+when the files outgrow the size cap the least recently used are deleted
+first. The cap is MAX_BYTES unless the WSM_CACHE_BYTES environment variable
+sets another.
+"""
+
+import hashlib
+import os
+import struct
+import threading
+import zlib
+
+import gamecode
+import generator
+
+
+DEFAULT_DIRECTORY = 'puzzle_cache'
+MAX_BYTES = 64 * 1024 * 1024
+
+# Bump when the generator or the stored format changes so old entries are never read
+CACHE_VERSION = 6
+_SUFFIX = '.wsp'
+
+
+def entryName(code):
+    """Return the file name of the puzzle of code."""
+    key = 'v{}:{}'.format(CACHE_VERSION, gamecode.formatCode(code))
+    return hashlib.sha1(key.encode('ascii')).hexdigest() + _SUFFIX
+
+
+class PuzzleCache:
+    """A directory of generated puzzles with least recently used eviction.
+
+    Attributes:
+        directory: A string path of the directory holding the puzzles.
+        maxBytes: An integer cap on the total size of the stored puzzles.
+    """
+
+    def __init__(self, directory=DEFAULT_DIRECTORY, maxBytes=None):
+        """Open the cache in directory, creating it if needed."""
+        if maxBytes is None:
+            maxBytes = int(os.environ.get('WSM_CACHE_BYTES', MAX_BYTES))
+        self.directory = directory
+        self.maxBytes = maxBytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._totalBytes = sum(size for path, size, used in self._entries())
+
+    def get(self, code):
+        """Return the stored Puzzle of code, or None if it is not stored."""
+        path = os.path.join(self.directory, entryName(code))
+        with self._lock:
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+                os.utime(path)
+            except FileNotFoundError:
+                return None
+            try:
+                return generator.Puzzle.fromBytes(zlib.decompress(data))
+            except (zlib.error, struct.error, ValueError):
+                # A damaged entry is dropped and regenerated
+                self._remove(path, len(data))
+                return None
+
+    def put(self, code, puzzle):
+        """Store puzzle as the puzzle of code and evict old puzzles beyond the size cap."""
+        data = zlib.compress(puzzle.toBytes())
+        path = os.path.join(self.directory, entryName(code))
+        temporary = path + '.' + str(os.getpid()) + '.' + str(threading.get_ident()) + '.tmp'
+        with self._lock:
+            try:
+                self._totalBytes -= os.path.getsize(path)
+            except FileNotFoundError:
+                pass
+            with open(temporary, 'wb') as f:
+                f.write(data)
+            os.replace(temporary, path)
+            self._totalBytes += len(data)
+            if self._totalBytes > self.maxBytes:
+                self._evict()
+
+    def load(self, code, wordList):
+        """Return the puzzle of code, generating it from wordList and storing it if it is not stored.
+
+        The cache is only an accelerator: if the disk fails, the puzzle is
+        generated and returned all the same.
+        """
+        try:
+            puzzle = self.get(code)
+        except OSError:
+            puzzle = None
+        if puzzle is None:
+            puzzle = gamecode.generate(code, wordList)
+            try:
+                self.put(code, puzzle)
+            except OSError:
+                pass
+        return puzzle
+
+    def clear(self):
+        """Delete every stored puzzle."""
+        with self._lock:
+            for path, size, used in self._entries():
+                self._remove(path, size)
+
+    def _entries(self):
+        """Return (path, size, last use) of every stored puzzle."""
+        entries = []
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if entry.name.endswith(_SUFFIX):
+                    stat = entry.stat()
+                    entries.append((entry.path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict(self):
+        # Rescan so puzzles stored by other processes count too
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        self._totalBytes = sum(size for path, size, used in entries)
+        for path, size, used in entries:
+            if self._totalBytes <= self.maxBytes:
+                break
+            self._remove(path, size)
+
+    def _remove(self, path, size):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            return
+        self._totalBytes -= size
@@ -0,0 +1,230 @@
+# Word Search Mania is under the MIT License
+#
+# Copyright (c) 2018 Mihir Patel
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Compile the word list into a length-bucketed index and read it via mmap.
+
+Index layout (all integers little-endian):
+    header: magic, version, maxLength, source size, source mtime, source sha1
+    table:  (count, offset) for every word length 0..maxLength
+    data:   the words of each length concatenated without separators
+
+Since every word in a bucket has the same length, word i of length L lives at
+offset + i * L and no per-word offsets are needed. Loading an index only maps
+the file, so it is close to instant and the pages are shared by every process
+that opens it.
+
+Usage:
+    python3 dictionary.py [words_alpha.txt]
+"""
+
+import bisect
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import threading
+
+import tracing
+
+
+MAGIC = b'WSMI'
+VERSION = 1
+MAX_LENGTH = 255
+
+_HEADER = struct.Struct('<4sBBxxQQ20s')
+_BUCKET = struct.Struct('<IQ')
+
+_loaded = {}
+# Held while loading, so the prefetch thread and the GUI thread never compile the same index at once
+_loadLock = threading.Lock()
+
+
+def indexPath(sourcePath):
+    """Return the index file path used for sourcePath."""
+    return os.path.splitext(sourcePath)[0] + '.idx'
+
+
+@tracing.span('compileIndex')
+def compileIndex(sourcePath, targetPath=None):
+    """Compile the word list at sourcePath into a binary index.
+
+    Words are stripped and lowercased; blank lines, duplicates and words that
+    are not purely ASCII letters are dropped.
+
+    Returns:
+        The path of the written index.
+    """
+    if targetPath is None:
+        targetPath = indexPath(sourcePath)
+
+    with open(sourcePath, 'rb') as sourceFile:
+        content = sourceFile.read()
+    stat = os.stat(sourcePath)
+
+    buckets = {}
+    for line in content.split():
+        word = line.strip().lower()
+        if 0 < len(word) <= MAX_LENGTH and word.isalpha() and word.isascii():
+            buckets.setdefault(len(word), set()).add(word)
+
+    maxLength = max(buckets) if buckets else 0
+    offset = _HEADER.size + _BUCKET.size * (maxLength + 1)
+    table = []
+    data = []
+    for length in range(maxLength + 1):
+        words = sorted(buckets.get(length, ()))
+        table.append(_BUCKET.pack(len(words), offset))
+        data.append(b''.join(words))
+        offset += len(words) * length
+
+    header = _HEADER.pack(MAGIC, VERSION, maxLength, stat.st_size, stat.st_mtime_ns,
+                          hashlib.sha1(content).digest())
+    # One temp file per process, so batch workers compiling at once never replace each other's
+    tempPath = targetPath + '.' + str(os.getpid()) + '.tmp'
+    with open(tempPath, 'wb') as indexFile:
+        indexFile.write(header)
+        indexFile.writelines(table)
+        indexFile.writelines(data)
+    os.replace(tempPath, targetPath)
+    return targetPath
+
+
+class WordIndex:
+    """Read-only view of a compiled word index.
+
+    Behaves like a sequence of words ordered by length, then alphabetically.
+
+    Attributes:
+        maxLength: An integer for the length of the longest word.
+        sourceSize: An integer for the size in bytes of the compiled word list.
+        sourceMtime: An integer for the modification time in ns of the compiled word list.
+        sourceHash: A hex string of the sha1 of the compiled word list.
+    """
+
+    def __init__(self, path):
+        """Map the index at path into memory.
+
+        Raises:
+            ValueError: The file at path is not a word index or is cut short.
+        """
+        with open(path, 'rb') as indexFile:
+            self._map = mmap.mmap(indexFile.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._readHeader(path)
+        except ValueError:
+            self._map.close()
+            raise
+
+    def _readHeader(self, path):
+        """Read the header and bucket table, checking that the file holds all of them and the words."""
+        if len(self._map) < _HEADER.size:
+            raise ValueError(path + ' is not a word index')
+        magic, version, self.maxLength, self.sourceSize, self.sourceMtime, digest = \
+            _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(path + ' is not a word index')
+        if len(self._map) < _HEADER.size + (self.maxLength + 1) * _BUCKET.size:
+            raise ValueError(path + ' is truncated')
+        self.sourceHash = digest.hex()
+
+        self._counts = []
+        self._offsets = []
+        self._starts = []
+        total = 0
+        for length in range(self.maxLength + 1):
+            count, offset = _BUCKET.unpack_from(self._map, _HEADER.size + length * _BUCKET.size)
+            if offset + count * length > len(self._map):
+                raise ValueError(path + ' is truncated')
+            self._counts.append(count)
+            self._offsets.append(offset)
+            self._starts.append(total)
+            total += count
+        self._total = total
+
+    def __len__(self):
+        return self._total
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self._total
+        if not 0 <= i < self._total:
+            raise IndexError('word index out of range')
+        length = bisect.bisect_right(self._starts, i) - 1
+        return self.wordOfLength(length, i - self._starts[length])
+
+    def countOfLength(self, length):
+        """Return the number of words with exactly length letters."""
+        if 0 <= length <= self.maxLength:
+            return self._counts[length]
+        return 0
+
+    def wordOfLength(self, length, i):
+        """Return word i of the words with exactly length letters."""
+        start = self._offsets[length] + i * length
+        return self._map[start:start + length].decode('ascii')
+
+    def isStale(self, sourcePath):
+        """Return True if sourcePath changed since this index was compiled."""
+        stat = os.stat(sourcePath)
+        return stat.st_size != self.sourceSize or stat.st_mtime_ns != self.sourceMtime
+
+    def close(self):
+        """Unmap the index."""
+        self._map.close()
+
+
+@tracing.span('loadDictionary')
+def loadDictionary(sourcePath='words_alpha.txt'):
+    """Return the WordIndex for sourcePath, compiling it first if needed.
+
+    The index is compiled next to the word list on first use and whenever the
+    word list changes. Indexes are cached, so every game in the process shares
+    one mapping. Safe to call from several threads.
+    """
+    with _loadLock:
+        index = _loaded.get(sourcePath)
+        if index is not None and not index.isStale(sourcePath):
+            return index
+
+        path = indexPath(sourcePath)
+        index = None
+        if os.path.exists(path):
+            try:
+                index = WordIndex(path)
+            except ValueError:
+                index = None
+            if index is not None and index.isStale(sourcePath):
+                index.close()
+                index = None
+        if index is None:
+            index = WordIndex(compileIndex(sourcePath, path))
+
+        _loaded[sourcePath] = index
+        return index
+
+
+if __name__ == '__main__':
+    source = sys.argv[1] if len(sys.argv) > 1 else 'words_alpha.txt'
+    target = compileIndex(source)
+    index = WordIndex(target)
+    print('Compiled ' + str(len(index)) + ' words from ' + source + ' into ' + target)
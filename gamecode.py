@@ -0,0 +1,139 @@
+# Word Search Mania is under the MIT License
+#
+# Copyright (c) 2018 Mihir Patel
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Describe a game by a short code that regenerates its puzzle exactly.
+
+A game code holds the version of the generator, the board size, the
+directions words run in, whether the dense engine placed them, the start of
+the word list's SHA-1 and the seed of the random.Random that generated the
+puzzle:
+
+    v2-20-RCFB-S-3f1e0a56-00c0ffee12345678
+
+A seed only makes the same puzzle on the same generator, so codes of any
+other generator.GENERATOR_VERSION are refused rather than replayed.
+
+Direction letters are R (rows), C (columns), F (forward diagonals) and B
+(backward diagonals); S marks the standard engine and D the dense one.
+
+Usage:
+    python3 gamecode.py CODE [words_alpha.txt]
+"""
+
+import random
+import sys
+import time
+from collections import namedtuple
+
+import generator
+
+
+SEED_BITS = 64
+HASH_LENGTH = 8
+
+_DIRECTION_LETTERS = {
+    generator.ROW: 'R',
+    generator.COLUMN: 'C',
+    generator.FORWARD_DIAGONAL: 'F',
+    generator.BACKWARD_DIAGONAL: 'B',
+}
+_LETTER_DIRECTIONS = {letter: direction for direction, letter in _DIRECTION_LETTERS.items()}
+_ENGINES = {False: 'S', True: 'D'}
+
+
+GameCode = namedtuple('GameCode', ['nElements', 'directions', 'dense', 'wordHash', 'seed'])
+
+
+def newSeed():
+    """Return a fresh random seed."""
+    return random.getrandbits(SEED_BITS)
+
+
+def formatCode(code):
+    """Return code as a string."""
+    letters = ''.join(_DIRECTION_LETTERS[direction] for direction in sorted(code.directions))
+    return 'v{}-{}-{}-{}-{}-{:016x}'.format(generator.GENERATOR_VERSION, code.nElements, letters,
+                                           _ENGINES[code.dense], code.wordHash[:HASH_LENGTH], code.seed)
+
+
+def parseCode(text):
+    """Return the GameCode of a string made by formatCode.
+
+    Raises:
+        ValueError: text is not a game code, or was made by another version of the generator.
+    """
+    parts = text.strip().lower().split('-')
+    if len(parts) == 5:
+        raise ValueError('this game code was made by an older version of the game')
+    if len(parts) != 6:
+        raise ValueError('a game code has six parts separated by dashes')
+    version, size, letters, engine, wordHash, seed = parts
+    if version != 'v' + str(generator.GENERATOR_VERSION):
+        if not version.startswith('v') or not version[1:].isdigit():
+            raise ValueError('a game code starts with the generator version, such as v'
+                             + str(generator.GENERATOR_VERSION))
+        raise ValueError('this game code was made by version ' + version[1:] + ' of the generator, not version '
+                         + str(generator.GENERATOR_VERSION))
+    if not size.isdigit() or int(size) < 1:
+        raise ValueError('the board size must be a positive number')
+    directions = []
+    for letter in letters.upper():
+        if letter not in _LETTER_DIRECTIONS or _LETTER_DIRECTIONS[letter] in directions:
+            raise ValueError('unknown or repeated direction ' + repr(letter))
+        directions.append(_LETTER_DIRECTIONS[letter])
+    if not directions:
+        raise ValueError('a game code needs at least one direction')
+    if engine.upper() not in ('S', 'D'):
+        raise ValueError('the engine must be S or D')
+    try:
+        int(wordHash, 16)
+        seed = int(seed, 16)
+    except ValueError:
+        raise ValueError('the word list hash and seed must be hexadecimal') from None
+    if len(wordHash) != HASH_LENGTH or seed >= 1 << SEED_BITS:
+        raise ValueError('the word list hash or seed has the wrong length')
+    return GameCode(int(size), tuple(sorted(directions)), engine.upper() == 'D', wordHash, seed)
+
+
+def generate(code, wordList):
+    """Return the puzzle of code, generated from wordList."""
+    rng = random.Random(code.seed)
+    if code.dense:
+        return generator.generateDensePuzzle(code.nElements, wordList, code.directions, rng)
+    return generator.generatePuzzle(code.nElements, wordList, code.directions, rng)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        sys.exit('usage: python3 gamecode.py CODE [words_alpha.txt]')
+    import dictionary
+
+    gameCode = parseCode(sys.argv[1])
+    wordIndex = dictionary.loadDictionary(sys.argv[2] if len(sys.argv) > 2 else 'words_alpha.txt')
+    if not wordIndex.sourceHash.startswith(gameCode.wordHash):
+        sys.exit('This game code was made with a different word list.')
+    start = time.perf_counter()
+    puzzle = generate(gameCode, wordIndex)
+    elapsed = time.perf_counter() - start
+    for row in puzzle.rows():
+        print(' '.join(row))
+    print('Generated ' + str(len(puzzle.placements)) + ' words in ' + str(round(elapsed * 1000, 1)) + ' ms')
@@ -0,0 +1,200 @@
+# Word Search Mania is under the MIT License
+#
+# Copyright (c) 2018 Mihir Patel
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""The rules of one game, free of Qt so they can run and be measured headless.
+
+GameState keeps the cell flags the board paints, the current selection, the
+words found so far and the time played. The game widget forwards clicks,
+hovers and timer ticks to it and repaints the cells it reports as changed.
+"""
+
+SELECTED = 1
+FOUND = 2
+HOVER = 4
+
+
+class GameState:
+    """Selection, found words, progress and elapsed time of one puzzle.
+
+    Attributes:
+        puzzle: The generator.Puzzle being played.
+        nElements: An integer for the number of rows and columns.
+        state: A bytearray of the SELECTED, FOUND and HOVER flags of every cell in row-major order.
+        selected: A set of the flat indices of the selected cells.
+        foundWords: A list of strings of the words found, in the order they were found.
+        hovered: An integer for the flat index of the cell under the mouse.
+        elapsedSeconds: An integer for the seconds played.
+        paused: A boolean, True while the game is paused.
+    """
+
+    def __init__(self, puzzle):
+        """Start the game with nothing selected or found."""
+        self.puzzle = puzzle
+        self.nElements = puzzle.nElements
+        self.state = bytearray(self.nElements * self.nElements)
+        self.selected = set()
+        # The lowest and highest selected indices, kept up to date on every
+        # click so validating a selection never scans it
+        self._low = len(self.state)
+        self._high = -1
+        self.foundWords = []
+        self._found = set()
+        self.hovered = 0
+        self.elapsedSeconds = 0
+        self.paused = False
+
+    @property
+    def wordCount(self):
+        """Return the number of words to find."""
+        return len(self.puzzle.placements)
+
+    @property
+    def progress(self):
+        """Return the number of words found."""
+        return len(self.foundWords)
+
+    @property
+    def complete(self):
+        """Return True once every word has been found; a puzzle with no words is never complete."""
+        return bool(self.puzzle.placements) and len(self.foundWords) == len(self.puzzle.placements)
+
+    def hasFlag(self, row, col, flag):
+        """Return True if the cell at row, col has flag set."""
+        return bool(self.state[row * self.nElements + col] & flag)
+
+    def updateCells(self, cells, setFlags=0, clearFlags=0):
+        """Set and clear flags on a list of (row, col) cells and return the cells that changed."""
+        n = self.nElements
+        state = self.state
+        changed = []
+        for row, col in cells:
+            i = row * n + col
+            flags = (state[i] & ~clearFlags) | setFlags
+            if flags != state[i]:
+                state[i] = flags
+                changed.append((row, col))
+                if flags & SELECTED:
+                    self._select(i)
+                else:
+                    self._unselect(i)
+        return changed
+
+    def _select(self, i):
+        """Add the flat index i to the selection and its bounds."""
+        self.selected.add(i)
+        if i < self._low:
+            self._low = i
+        if i > self._high:
+            self._high = i
+
+    def _unselect(self, i):
+        """Remove the flat index i from the selection and its bounds."""
+        selected = self.selected
+        selected.discard(i)
+        if i == self._low or i == self._high:
+            if selected:
+                self._low, self._high = min(selected), max(selected)
+            else:
+                self._low, self._high = len(self.state), -1
+
+    def toggle(self, row, col):
+        """Select the cell at row, col, or unselect it if it is selected.
+
+        Found cells stay selectable since dense puzzles share them between words.
+        """
+        i = row * self.nElements + col
+        flags = self.state[i] ^ SELECTED
+        self.state[i] = flags
+        if flags & SELECTED:
+            self._select(i)
+        else:
+            self._unselect(i)
+
+    def selectedCells(self):
+        """Return the (row, col) of every selected cell in row-major order."""
+        n = self.nElements
+        return [divmod(i, n) for i in sorted(self.selected)]
+
+    def selectedWord(self):
+        """Return the letters of the selected cells in row-major order."""
+        grid = self.puzzle.grid
+        return ''.join(chr(grid[i]) for i in sorted(self.selected))
+
+    def checkSelection(self):
+        """Mark the selection found if it is exactly a word not found yet.
+
+        Returns:
+            The Placement of the word found, or None.
+        """
+        selected = self.selected
+        if not selected:
+            return None
+        # Every direction reads in row-major order, so a placed word can only
+        # run from the first to the last selected cell
+        first, last = self._low, self._high
+        placement = self.puzzle.placementIndex.get((first, last))
+        if placement is None or len(placement.word) != len(selected) or placement.word in self._found:
+            return None
+        if len(selected) > 1:
+            cells = range(first, last + 1, (last - first) // (len(selected) - 1))
+            if any(i not in selected for i in cells):
+                return None
+
+        state = self.state
+        for i in selected:
+            state[i] = (state[i] & ~(SELECTED | HOVER)) | FOUND
+        selected.clear()
+        self._low, self._high = len(state), -1
+        self.foundWords.append(placement.word)
+        self._found.add(placement.word)
+        return placement
+
+    def clearSelection(self):
+        """Unselect every cell and return the cells that changed."""
+        return self.updateCells(self.selectedCells(), 0, SELECTED)
+
+    def hover(self, row, col):
+        """Move the hover highlight to the cell at row, col and return the cells that changed.
+
+        Found and selected cells keep their own highlight instead.
+        """
+        i = row * self.nElements + col
+        if i == self.hovered:
+            return []
+        changed = self.updateCells([divmod(self.hovered, self.nElements)], 0, HOVER)
+        if not self.state[i] & (FOUND | SELECTED):
+            changed += self.updateCells([(row, col)], HOVER)
+        self.hovered = i
+        return changed
+
+    def tick(self, seconds=1):
+        """Count seconds of play unless the game is paused."""
+        if not self.paused:
+            self.elapsedSeconds += seconds
+
+    def pause(self):
+        """Stop counting time."""
+        self.paused = True
+
+    def resume(self):
+        """Count time again."""
+        self.paused = False
@@ -0,0 +1,780 @@
+# Word Search Mania is under the MIT License
+#
+# Copyright (c) 2018 Mihir Patel
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Generate word search puzzles without a GUI.
+
+The grid is a flat bytearray of lowercase ASCII letters in row-major order,
+so a puzzle can be built, stored and checked with nothing but the standard
+library. The widgets in source1.py only render the resulting Puzzle.
+
+NumPy is optional: when it is installed, the free runs that decide where
+words fit are computed with whole-array operations. Both paths return the
+same runs, so a seed makes the same puzzle with or without it.
+"""
+
+import bisect
+import itertools
+import random
+import string
+import struct
+from collections import Counter, namedtuple
+
+import solver
+import tracing
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Bump whenever a seed stops making the same puzzle, so game codes from older versions are refused
+GENERATOR_VERSION = 4
+
+ROW = 0
+COLUMN = 1
+FORWARD_DIAGONAL = 2
+BACKWARD_DIAGONAL = 3
+
+ALL_DIRECTIONS = (ROW, COLUMN, FORWARD_DIAGONAL, BACKWARD_DIAGONAL)
+
+# Row and column step taken from one letter of a word to the next
+STEPS = {
+    ROW: (0, 1),
+    COLUMN: (1, 0),
+    FORWARD_DIAGONAL: (1, 1),
+    BACKWARD_DIAGONAL: (1, -1),
+}
+
+FILLER_LETTERS = string.ascii_lowercase.encode()
+
+# Shorter words are never hidden
+MIN_WORD_LENGTH = 3
+
+DIRECTION_NAMES = {
+    ROW: 'row',
+    COLUMN: 'column',
+    FORWARD_DIAGONAL: 'forward-diagonal',
+    BACKWARD_DIAGONAL: 'backward-diagonal',
+}
+
+# Binary layout of a puzzle: nElements and placement count, the grid, then
+# row, col, direction and word length followed by the word for each placement
+_PUZZLE_HEADER = struct.Struct('<HH')
+_PLACEMENT = struct.Struct('<HHBB')
+
+# The largest number of rows and columns Puzzle.toBytes can store
+MAX_ELEMENTS = 0xFFFF
+
+
+Placement = namedtuple('Placement', ['word', 'row', 'col', 'direction'])
+
+
+class Puzzle:
+    """A generated word search grid and the words hidden in it.
+
+    Attributes:
+        nElements: An integer for the number of rows and columns of the grid.
+        grid: A bytearray of nElements * nElements lowercase letters in row-major order.
+        placements: A list of Placements in the order the words were hidden.
+        placementIndex: A dict mapping the flat indices of the first and last letter of
+            each placement, in row-major order, to the Placement.
+    """
+
+    def __init__(self, nElements, grid, placements):
+        """Store the grid and index its placements by their end cells."""
+        self.nElements = nElements
+        self.grid = grid
+        self.placements = placements
+        self.placementIndex = {}
+        for placement in placements:
+            self.placementIndex[self._ends(placement)] = placement
+
+    @property
+    def wordBank(self):
+        """Return a list of the hidden words in placement order."""
+        return [placement.word for placement in self.placements]
+
+    def letter(self, row, col):
+        """Return the letter at row, col."""
+        return chr(self.grid[row * self.nElements + col])
+
+    def rows(self):
+        """Return a list of strings, one per grid row."""
+        n = self.nElements
+        text = self.grid.decode('ascii')
+        return [text[i:i + n] for i in range(0, n * n, n)]
+
+    def _ends(self, placement):
+        dRow, dCol = STEPS[placement.direction]
+        last = len(placement.word) - 1
+        start = placement.row * self.nElements + placement.col
+        end = (placement.row + last * dRow) * self.nElements + placement.col + last * dCol
+        return start, end
+
+    def cells(self, placement):
+        """Return the (row, col) of every letter of placement."""
+        dRow, dCol = STEPS[placement.direction]
+        return [(placement.row + i * dRow, placement.col + i * dCol) for i in range(len(placement.word))]
+
+    def toDict(self):
+        """Return the puzzle as a JSON serializable dict."""
+        return {
+            'nElements': self.nElements,
+            'grid': self.rows(),
+            'words': [{'word': placement.word, 'row': placement.row, 'col': placement.col,
+                       'direction': DIRECTION_NAMES[placement.direction]} for placement in self.placements],
+        }
+
+    def toBytes(self):
+        """Return the puzzle packed into compact bytes."""
+        parts = [_PUZZLE_HEADER.pack(self.nElements, len(self.placements)), bytes(self.grid)]
+        for placement in self.placements:
+            word = placement.word.encode('ascii')
+            parts.append(_PLACEMENT.pack(placement.row, placement.col, placement.direction, len(word)))
+            parts.append(word)
+        return b''.join(parts)
+
+    @classmethod
+    def fromBytes(cls, data):
+        """Return the Puzzle packed into data by toBytes."""
+        nElements, count = _PUZZLE_HEADER.unpack_from(data, 0)
+        offset = _PUZZLE_HEADER.size
+        grid = bytearray(data[offset:offset + nElements * nElements])
+        offset += nElements * nElements
+        placements = []
+        for _ in range(count):
+            row, col, direction, length = _PLACEMENT.unpack_from(data, offset)
+            offset += _PLACEMENT.size
+            word = bytes(data[offset:offset + length]).decode('ascii')
+            offset += length
+            placements.append(Placement(word, row, col, direction))
+        return cls(nElements, grid, placements)
+
+
+class WordSampler:
+    """Words of at least MIN_WORD_LENGTH letters grouped by length, drawn to fit a slot.
+
+    draw takes the words it returns out of the sampler, so one game never
+    hides a word twice, while sample leaves them in. Taking a word is a lazy
+    Fisher-Yates shuffle of its length's bucket: the taken position is
+    refilled from the end of the bucket's remaining range through a dict of
+    moved positions, so a dictionary.WordIndex is never copied.
+
+    Attributes:
+        rng: The random.Random instance words are drawn with.
+        maxLength: An integer for the length of the longest word.
+        remaining: A list of the number of words of each length not taken yet.
+    """
+
+    def __init__(self, wordList, rng):
+        """Group wordList by length; a dictionary.WordIndex is read through its length buckets."""
+        self.rng = rng
+        if hasattr(wordList, 'countOfLength'):
+            self.maxLength = wordList.maxLength
+            self._buckets = [_IndexBucket(wordList, length) for length in range(self.maxLength + 1)]
+        else:
+            grouped = {}
+            for word in wordList:
+                grouped.setdefault(len(word), []).append(word)
+            self.maxLength = max(grouped) if grouped else 0
+            self._buckets = [grouped.get(length, []) for length in range(self.maxLength + 1)]
+        self.remaining = [len(bucket) if length >= MIN_WORD_LENGTH else 0
+                          for length, bucket in enumerate(self._buckets)]
+        self._moved = [{} for _ in self._buckets]
+        # _cumulative[length] is the number of words left of at most length letters; None after a take
+        self._cumulative = None
+
+    def sample(self, maxLength):
+        """Return a random word of MIN_WORD_LENGTH to maxLength letters without taking it, or None."""
+        picked = self._pick(maxLength)
+        if picked is None:
+            return None
+        length, i = picked
+        return self._buckets[length][self._moved[length].get(i, i)]
+
+    def draw(self, maxLength):
+        """Take and return a random word of MIN_WORD_LENGTH to maxLength letters, or None if none is left."""
+        picked = self._pick(maxLength)
+        if picked is None:
+            return None
+        return self._take(*picked)
+
+    def shareOfLength(self, maxLength):
+        """Return the fraction of the words left that have at most maxLength letters."""
+        cumulative = self._counts()
+        if not cumulative[-1]:
+            return 0.0
+        return cumulative[max(0, min(maxLength, self.maxLength))] / cumulative[-1]
+
+    def _pick(self, maxLength):
+        """Return the length and position of a random word left of at most maxLength letters, or None."""
+        maxLength = min(maxLength, self.maxLength)
+        if maxLength < MIN_WORD_LENGTH:
+            return None
+        cumulative = self._counts()
+        if not cumulative[maxLength]:
+            return None
+        i = self.rng.randrange(cumulative[maxLength])
+        length = bisect.bisect_right(cumulative, i)
+        return length, i - cumulative[length - 1]
+
+    def _counts(self):
+        """Return _cumulative, counting it again if a word was taken since."""
+        if self._cumulative is None:
+            self._cumulative = list(itertools.accumulate(self.remaining))
+        return self._cumulative
+
+    def _take(self, length, i):
+        """Take the word at position i of the remaining words of length and return it."""
+        moved = self._moved[length]
+        last = self.remaining[length] - 1
+        word = self._buckets[length][moved.get(i, i)]
+        lastPosition = moved.pop(last, last)
+        if i != last:
+            moved[i] = lastPosition
+        self.remaining[length] = last
+        self._cumulative = None
+        return word
+
+
+class _Builder:
+    """Mutable state shared by the direction passes of generatePuzzle."""
+
+    def __init__(self, nElements, wordList, rng):
+        self.nElements = nElements
+        self.rng = rng
+        self.words = WordSampler(wordList, rng)
+        self.grid = bytearray(rng.choices(FILLER_LETTERS, k=nElements * nElements))
+        self.occupied = bytearray(nElements * nElements)
+        self.placements = []
+
+    def drawWord(self, maxLength):
+        """Take a random unused word of at most maxLength letters, or return None."""
+        return self.words.draw(maxLength)
+
+    def slotChance(self, maxLength):
+        """Return the chance that a diagonal slot of maxLength free cells is given a word."""
+        return self.words.shareOfLength(maxLength)
+
+    def place(self, word, row, col, direction):
+        """Write word into the grid starting at row, col."""
+        n = self.nElements
+        dRow, dCol = STEPS[direction]
+        for i, letter in enumerate(word.encode('ascii')):
+            index = (row + i * dRow) * n + col + i * dCol
+            self.grid[index] = letter
+            self.occupied[index] = 1
+        self.placements.append(Placement(word, row, col, direction))
+
+
+def freeRuns(occupied, nElements, direction):
+    """Return how many free cells run from each cell to the next occupied cell or the edge in direction.
+
+    A word of L letters fits at a start cell without covering another word
+    exactly where its run is at least L, so comparing the runs with L gives
+    the feasibility mask of every start at once, for every word length.
+
+    Args:
+        occupied: A bytes-like object, nonzero on the cells covered by words, in row-major order.
+        nElements: An integer for the number of rows and columns.
+        direction: The direction words would run in.
+
+    Returns:
+        A list of nElements * nElements integers in row-major order.
+    """
+    if numpy is not None:
+        return _freeRunsNumpy(occupied, nElements, direction)
+    n = nElements
+    dRow, dCol = STEPS[direction]
+    # Every step moves to a later cell, so filling backwards has each run's next cell ready
+    step = dRow * n + dCol
+    runs = [0] * (n * n)
+    for row in range(n - 1, -1, -1):
+        lastRow = row + dRow >= n
+        for col in range(n - 1, -1, -1):
+            i = row * n + col
+            if occupied[i]:
+                continue
+            if lastRow or not 0 <= col + dCol < n:
+                runs[i] = 1
+            else:
+                runs[i] = runs[i + step] + 1
+    return runs
+
+
+def _freeRunsNumpy(occupied, nElements, direction):
+    """Return freeRuns computed with NumPy."""
+    n = nElements
+    rows, cols = numpy.indices((n, n))
+    # Lay every line of the direction out as a row of a table, indexed by the position along the line
+    if direction == ROW:
+        line, position = rows, cols
+    elif direction == COLUMN:
+        line, position = cols, rows
+    elif direction == FORWARD_DIAGONAL:
+        line, position = cols - rows + n - 1, rows
+    else:
+        line, position = cols + rows, rows
+    # Positions off the grid, including one past the end of every line, block like occupied cells
+    blocked = numpy.ones((int(line.max()) + 1, n + 1), dtype=bool)
+    blocked[line, position] = numpy.frombuffer(bytes(occupied), dtype=numpy.uint8).reshape(n, n) != 0
+    blockerAt = numpy.where(blocked, numpy.arange(n + 1), n + 1)
+    nextBlocker = numpy.minimum.accumulate(blockerAt[:, ::-1], axis=1)[:, ::-1]
+    return (nextBlocker[line, position] - position).ravel().tolist()
+
+
+# Implements words across rows
+@tracing.span('_generateRow')
+def _generateRow(builder):
+    n = builder.nElements
+    row = 0
+    while row < n:
+        col = 0
+        lastColPosition = 0
+        while col < n:
+            col = builder.rng.randint(lastColPosition, n)
+            word = builder.drawWord(n - col)
+            if word is not None:
+                builder.place(word, row, col, ROW)
+                col = n
+        row += 3
+
+
+# Implements words down each column
+@tracing.span('_generateCol')
+def _generateCol(builder):
+    n = builder.nElements
+    runs = freeRuns(builder.occupied, n, COLUMN)
+    col = 0
+    while col < n:
+        row = 0
+        lastRowPosition = 0
+        while row < n:
+            row = builder.rng.randint(lastRowPosition, n)
+            if row == n:
+                break
+            # Later words in this column start below this one, so its runs need no update
+            word = builder.drawWord(runs[row * n + col])
+            if word is not None:
+                builder.place(word, row, col, COLUMN)
+                lastRowPosition = row + len(word)
+                row = lastRowPosition
+        col += 3
+
+
+# Implements words down each diagonal in forward
+@tracing.span('_generateForwardDiag')
+def _generateForwardDiag(builder):
+    _generateDiag(builder, FORWARD_DIAGONAL)
+
+
+# Implements words down each diagonal in backward
+@tracing.span('_generateBackwardDiag')
+def _generateBackwardDiag(builder):
+    _generateDiag(builder, BACKWARD_DIAGONAL)
+
+
+def _generateDiag(builder, direction):
+    """Give words to start cells, in the order the words would be read, where one can fit.
+
+    A cell gets a word with the chance that a word drawn from the whole bank
+    would fit it, which keeps diagonals as sparse as the other passes. The
+    word is then drawn among those that fit, like in the other passes.
+    """
+    n = builder.nElements
+    dRow, dCol = STEPS[direction]
+    step = dRow * n + dCol
+    runs = freeRuns(builder.occupied, n, direction)
+    for row in range(n):
+        cols = range(n) if dCol > 0 else range(n - 1, -1, -1)
+        for col in cols:
+            start = row * n + col
+            if runs[start] < MIN_WORD_LENGTH or builder.rng.random() >= builder.slotChance(runs[start]):
+                continue
+            word = builder.drawWord(runs[start])
+            if word is None:
+                continue
+            builder.place(word, row, col, direction)
+            # Cells earlier on the line were already tried; only the covered cells change
+            for i in range(start, start + step * len(word), step):
+                runs[i] = 0
+
+
+_PASSES = (
+    (ROW, _generateRow),
+    (COLUMN, _generateCol),
+    (FORWARD_DIAGONAL, _generateForwardDiag),
+    (BACKWARD_DIAGONAL, _generateBackwardDiag),
+)
+
+
+@tracing.span('generatePuzzle')
+def generatePuzzle(nElements, wordList, directions=ALL_DIRECTIONS, rng=random):
+    """Generate a puzzle of nElements rows hiding words from wordList.
+
+    Args:
+        nElements: An integer for the number of rows and columns of the grid.
+        wordList: A sequence of lowercase words to draw from.
+        directions: A collection of the directions words may be hidden in.
+        rng: A random.Random instance, or the random module itself.
+
+    Returns:
+        A Puzzle in which every bank word appears exactly once.
+    """
+    puzzle = _build(_Builder(nElements, wordList, rng), directions)
+    placements = _makeUnique(nElements, puzzle.grid, puzzle.placements, rng)
+    return Puzzle(nElements, puzzle.grid, placements)
+
+
+def _build(builder, directions):
+    """Run the passes for directions over builder and return the Puzzle."""
+    for direction, generatePass in _PASSES:
+        if direction in directions:
+            generatePass(builder)
+    return Puzzle(builder.nElements, builder.grid, builder.placements)
+
+
+DEFAULT_DENSITY = 0.8
+
+# Word draws tried against one slot before moving on to another slot
+_DRAWS_PER_SLOT = 4
+
+# Failed slots in a row after which the latest placement is undone
+_STALL_LIMIT = 64
+
+_MAX_BACKTRACKS = 256
+
+# Words up to this long are kept from being spelled a second time by crossing
+# words while the dense engine packs; longer copies are rare enough for _makeUnique
+_COLLISION_LENGTH = 6
+
+
+class _IndexBucket:
+    """Sequence view of the words of one length in a dictionary.WordIndex."""
+
+    def __init__(self, wordIndex, length):
+        self.wordIndex = wordIndex
+        self.length = length
+        self.count = wordIndex.countOfLength(length)
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        return self.wordIndex.wordOfLength(self.length, i)
+
+
+@tracing.span('generateDensePuzzle')
+def generateDensePuzzle(nElements, wordList, directions=ALL_DIRECTIONS, rng=random, wordCount=None,
+                        density=None, maxAttempts=None):
+    """Generate a puzzle by packing crossing words until a word count or fill density is met.
+
+    Slots are drawn as a random uncovered cell and a direction. Words are
+    drawn only among those short enough for the cells of that line no word
+    in the direction uses yet, and each one is tried at every offset that
+    covers the drawn cell, so it may share cells with words in other
+    directions when the letters agree. When too many slots in a row fail,
+    the latest placement is undone so the search can leave a dead end; the
+    total work is capped by maxAttempts, and the search stops once every
+    word short enough for the grid is placed.
+
+    Args:
+        nElements: An integer for the number of rows and columns of the grid.
+        wordList: A sequence of lowercase words to draw from.
+        directions: A collection of the directions words may be hidden in.
+        rng: A random.Random instance, or the random module itself.
+        wordCount: An integer number of words to hide, or None.
+        density: A float fraction of cells to cover with words, used when
+            wordCount is None; defaults to DEFAULT_DENSITY.
+        maxAttempts: An integer cap on slots tried; defaults to 8 per cell.
+
+    Returns:
+        A Puzzle in which every bank word appears exactly once, holding fewer
+        words than asked if the budget ran out.
+    """
+    n = nElements
+    if wordCount is None and density is None:
+        density = DEFAULT_DENSITY
+    targetCells = int(density * n * n) if wordCount is None else n * n
+    targetWords = wordCount if wordCount is not None else n * n
+    if maxAttempts is None:
+        maxAttempts = 8 * n * n
+
+    words = WordSampler(wordList, rng)
+    # A small word bank runs out long before the grid fills; no line holds a word longer than n
+    targetWords = min(targetWords, sum(words.remaining[:n + 1]))
+    directions = [direction for direction in ALL_DIRECTIONS if direction in directions]
+    grid = bytearray(n * n)
+    # Bit 1 << direction is set on every cell a word in that direction runs through
+    usedDirections = bytearray(n * n)
+    # Uncovered cells, with the position of each one in the list for O(1) removal
+    free = list(range(n * n))
+    freePosition = list(range(n * n))
+    placements = []
+    newCells = []
+    usedWords = set()
+    # Strings of up to _COLLISION_LENGTH covered cells in a line, read forwards, and the short
+    # words placed so far read both ways, so a word that would spell a second copy is never placed
+    coveredWindows = Counter()
+    shortWords = Counter()
+    covered = 0
+    stalled = 0
+    backtracks = 0
+
+    for _ in range(maxAttempts):
+        if covered >= targetCells or len(placements) >= targetWords or not free:
+            break
+
+        cell = free[rng.randrange(len(free))]
+        row, col = divmod(cell, n)
+        direction = rng.choice(directions)
+        bit = 1 << direction
+        dRow, dCol = STEPS[direction]
+        step = dRow * n + dCol
+
+        # The cells of the line through the free cell that no word in this direction uses yet,
+        # up to a word's length either side; a word may cover the free cell with any of its letters
+        reach = words.maxLength - 1
+        before = 0
+        r, c = row - dRow, col - dCol
+        while before < reach and 0 <= r < n and 0 <= c < n and not usedDirections[r * n + c] & bit:
+            before += 1
+            r, c = r - dRow, c - dCol
+        after = 0
+        r, c = row + dRow, col + dCol
+        while after < reach and 0 <= r < n and 0 <= c < n and not usedDirections[r * n + c] & bit:
+            after += 1
+            r, c = r + dRow, c + dCol
+        first = cell - before * step
+        line = grid[first:first + (before + after) * step + 1:step or 1]
+
+        placed = False
+        if len(line) >= MIN_WORD_LENGTH:
+            for _ in range(_DRAWS_PER_SLOT):
+                word = words.sample(len(line))
+                if word is None or word in usedWords:
+                    continue
+                letters = word.encode('ascii')
+                # Every offset of the word along the line at which it covers the free cell
+                for offset in range(max(0, before - len(letters) + 1), min(before, len(line) - len(letters)) + 1):
+                    for letter, existing in zip(letters, line[offset:offset + len(letters)]):
+                        if existing and existing != letter:
+                            break
+                    else:
+                        start = first + offset * step
+                        written = [start + i * step for i in range(len(letters)) if not line[offset + i]]
+                        windows = _writeUnique(grid, n, letters, start, step, written, coveredWindows, shortWords)
+                        if windows is not None:
+                            placed = True
+                            break
+                if placed:
+                    break
+
+        if not placed:
+            stalled += 1
+            if stalled >= _STALL_LIMIT and placements and backtracks < _MAX_BACKTRACKS:
+                # Undo the latest word; only its own new cells are cleared
+                placement = placements.pop()
+                usedWords.discard(placement.word)
+                if len(placement.word) <= _COLLISION_LENGTH:
+                    letters = placement.word.encode('ascii')
+                    shortWords.subtract((letters, letters[::-1]))
+                for text in _coveredWindows(grid, n, newCells[-1], _COLLISION_LENGTH).values():
+                    coveredWindows[text] -= 1
+                dRow, dCol = STEPS[placement.direction]
+                index = placement.row * n + placement.col
+                for _ in placement.word:
+                    usedDirections[index] &= ~(1 << placement.direction)
+                    index += dRow * n + dCol
+                for index in newCells.pop():
+                    grid[index] = 0
+                    freePosition[index] = len(free)
+                    free.append(index)
+                    covered -= 1
+                backtracks += 1
+                stalled = 0
+            continue
+
+        stalled = 0
+        for index in written:
+            # Move the last free cell into the slot of the one just covered
+            last = free.pop()
+            if last != index:
+                free[freePosition[index]] = last
+                freePosition[last] = freePosition[index]
+        for index in range(start, start + step * len(letters), step):
+            usedDirections[index] |= bit
+        covered += len(written)
+        newCells.append(written)
+        placements.append(Placement(word, *divmod(start, n), direction))
+        usedWords.add(word)
+        coveredWindows.update(windows.values())
+        if len(word) <= _COLLISION_LENGTH:
+            shortWords.update((letters, letters[::-1]))
+
+    filler = rng.choices(FILLER_LETTERS, k=n * n)
+    for index in range(n * n):
+        if not grid[index]:
+            grid[index] = filler[index]
+    return Puzzle(n, grid, _makeUnique(n, grid, placements, rng))
+
+
+def _coveredWindows(grid, n, cells, maxLength):
+    """Return the strings of MIN_WORD_LENGTH to maxLength covered cells in a line through any of cells.
+
+    A cell is covered when its grid byte is nonzero.
+
+    Returns:
+        A dict mapping (first flat index, step, length) to the letters read forwards.
+    """
+    windows = {}
+    for index in cells:
+        row, col = divmod(index, n)
+        for dRow, dCol in STEPS.values():
+            step = dRow * n + dCol
+            back = 0
+            r, c = row - dRow, col - dCol
+            while back < maxLength - 1 and 0 <= r < n and 0 <= c < n and grid[r * n + c]:
+                back += 1
+                r, c = r - dRow, c - dCol
+            ahead = 0
+            r, c = row + dRow, col + dCol
+            while ahead < maxLength - 1 and 0 <= r < n and 0 <= c < n and grid[r * n + c]:
+                ahead += 1
+                r, c = r + dRow, c + dCol
+            for k in range(back + 1):
+                first = index - k * step
+                for length in range(max(MIN_WORD_LENGTH, k + 1), min(maxLength, k + 1 + ahead) + 1):
+                    key = (first, step, length)
+                    if key not in windows:
+                        windows[key] = bytes(grid[first:first + (length - 1) * step + 1:step])
+    return windows
+
+
+def _writeUnique(grid, n, letters, start, step, written, coveredWindows, shortWords):
+    """Write letters on the slot at start unless that spells a second copy of a short placed word or of itself.
+
+    Only the cells in written are changed, and they are cleared again when the word is refused.
+
+    Returns:
+        The windows _coveredWindows finds through the written cells, or None if the word was refused.
+    """
+    short = len(letters) <= _COLLISION_LENGTH
+    reverse = letters[::-1]
+    if short and (coveredWindows[letters] or coveredWindows[reverse]):
+        return None
+    for index in written:
+        grid[index] = letters[(index - start) // step]
+    windows = _coveredWindows(grid, n, written, _COLLISION_LENGTH)
+    own = (start, step, len(letters))
+    refused = False
+    for key, text in windows.items():
+        if key != own and (shortWords[text] or (short and (text == letters or text == reverse))):
+            refused = True
+            break
+    if refused:
+        for index in written:
+            grid[index] = 0
+        return None
+    return windows
+
+
+# Rounds of re-rolling filler before words that are still ambiguous are dropped
+_REPAIR_ROUNDS = 8
+
+
+def _ambiguousOccurrences(wordSolver, nElements, grid, placed, throughCells=None):
+    """Return the occurrences of placed words anywhere other than where they were placed.
+
+    placed maps each word to the (row, col, dRow, dCol) it was placed at.
+    """
+    ambiguous = []
+    for occurrence in wordSolver.findAll(grid, nElements, throughCells):
+        where = placed.get(occurrence.word)
+        if where is not None and where != occurrence[1:]:
+            ambiguous.append(occurrence)
+    return ambiguous
+
+
+def _coveredCells(nElements, placements):
+    """Return the set of flat indices of the cells covered by placements."""
+    covered = set()
+    for placement in placements:
+        dRow, dCol = STEPS[placement.direction]
+        step = dRow * nElements + dCol
+        start = placement.row * nElements + placement.col
+        covered.update(range(start, start + step * len(placement.word), step))
+    return covered
+
+
+@tracing.span('_makeUnique')
+def _makeUnique(nElements, grid, placements, rng):
+    """Repair grid so each placed word can be read in exactly one place.
+
+    Filler letters and overlapping words can spell a second copy of a bank
+    word in any of the eight reading directions. For every such copy one of
+    its filler cells is re-rolled. A copy made only of letters of placed
+    words cannot be broken that way, so its word is dropped from the bank.
+
+    Returns:
+        The placements whose words are now unique.
+    """
+    n = nElements
+    if not placements:
+        return placements
+    wordSolver = solver.WindowSolver([placement.word for placement in placements])
+    placed = {placement.word: (placement.row, placement.col) + STEPS[placement.direction]
+              for placement in placements}
+    covered = _coveredCells(n, placements)
+
+    # Only the lines through re-rolled cells can change, so later rounds scan just those
+    changed = None
+    for repairRound in range(_REPAIR_ROUNDS + 1):
+        ambiguous = _ambiguousOccurrences(wordSolver, n, grid, placed, changed)
+        if not ambiguous:
+            break
+        if repairRound == _REPAIR_ROUNDS:
+            for occurrence in ambiguous:
+                placed.pop(occurrence.word, None)
+            break
+
+        changed = set()
+        dropped = False
+        for occurrence in ambiguous:
+            if occurrence.word not in placed:
+                continue
+            filler = [(row, col) for row, col in occurrence.cells() if row * n + col not in covered]
+            if filler:
+                row, col = rng.choice(filler)
+                index = row * n + col
+                shift = rng.randrange(1, len(FILLER_LETTERS))
+                grid[index] = FILLER_LETTERS[(FILLER_LETTERS.index(grid[index]) + shift) % len(FILLER_LETTERS)]
+                changed.add((row, col))
+            else:
+                del placed[occurrence.word]
+                dropped = True
+        if dropped:
+            # Cells only the dropped words used are filler from now on
+            covered = _coveredCells(n, [placement for placement in placements if placement.word in placed])
+
+    return [placement for placement in placements if placement.word in placed]
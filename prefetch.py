@@ -0,0 +1,105 @@
+# Word Search Mania is under the MIT License
+#
+# Copyright (c) 2018 Mihir Patel
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Build the next puzzle on a background thread while the player is busy."""
+
+import queue
+import threading
+
+
+class PuzzlePrefetcher:
+    """Keep a bounded queue of ready puzzles for the most recently requested settings.
+
+    Attributes:
+        build: A callable taking settings and returning a Puzzle.
+        maxSize: An integer for the number of puzzles kept ready.
+    """
+
+    def __init__(self, build, maxSize=1):
+        """Store the build callable; the worker thread starts on the first request."""
+        self.build = build
+        self.maxSize = maxSize
+        self._queue = queue.Queue(maxSize)
+        self._condition = threading.Condition()
+        self._settings = None
+        self._epoch = 0
+        self._thread = None
+
+    def request(self, settings):
+        """Start building puzzles for settings, dropping any built for older settings."""
+        with self._condition:
+            if settings == self._settings:
+                return
+            self._settings = settings
+            self._epoch += 1
+            self._drain()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='PuzzlePrefetcher', daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def take(self, settings):
+        """Return a puzzle for settings, waiting for the worker if it is still building one.
+
+        Settings that were never requested, or whose build on the worker
+        failed, are built on the calling thread.
+        """
+        with self._condition:
+            epoch = self._epoch if settings == self._settings else None
+        if epoch is None:
+            return self.build(settings)
+        while True:
+            itemEpoch, puzzle, error = self._queue.get()
+            if itemEpoch == epoch:
+                if error is not None:
+                    raise error
+                return puzzle
+            if itemEpoch > epoch:
+                # Settings changed while waiting; this puzzle belongs to the new ones
+                return self.build(settings)
+
+    def _drain(self):
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                return
+
+    def _run(self):
+        while True:
+            with self._condition:
+                settings, epoch = self._settings, self._epoch
+            try:
+                item = (epoch, self.build(settings), None)
+            except Exception as error:
+                item = (epoch, None, error)
+            with self._condition:
+                if epoch != self._epoch:
+                    continue
+                if item[2] is not None:
+                    # Only a take already waiting gets the error; later ones build on their own thread
+                    self._settings = None
+            self._queue.put(item)
+            if item[2] is not None:
+                with self._condition:
+                    while epoch == self._epoch:
+                        self._condition.wait()
@@ -0,0 +1,158 @@
+# Word Search Mania is under the MIT License
+#
+# Copyright (c) 2018 Mihir Patel
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Store high scores in SQLite with an index on (mode, seconds).
+
+Every score is inserted in its own transaction with a timestamp, so a crash
+can never leave half a score behind, and best-time and top-K queries read a
+few index entries instead of the whole history.
+
+Usage:
+    python3 scores.py import [highscores.txt]
+"""
+
+import os
+import sqlite3
+import sys
+import time
+from collections import namedtuple
+
+
+DEFAULT_PATH = 'highscores.db'
+LEGACY_PATH = 'highscores.txt'
+
+MODES = ('Easy', 'Medium', 'Hard', 'Marathon')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    mode TEXT NOT NULL,
+    seconds INTEGER NOT NULL,
+    recordedAt REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scoresByModeAndSeconds ON scores (mode, seconds);
+CREATE TABLE IF NOT EXISTS imports (
+    path TEXT PRIMARY KEY,
+    importedAt REAL NOT NULL
+);
+"""
+
+
+Score = namedtuple('Score', ['mode', 'seconds', 'recordedAt'])
+
+
+def formatTime(seconds):
+    """Return seconds as an hh:mm:ss string."""
+    return '{:02d}:{:02d}:{:02d}'.format(seconds // 3600, seconds // 60 % 60, seconds % 60)
+
+
+def parseTime(text):
+    """Return the seconds of an hh:mm:ss string."""
+    hours, minutes, seconds = (int(part) for part in text.split(':'))
+    return hours * 3600 + minutes * 60 + seconds
+
+
+class ScoreStore:
+    """High scores kept in a SQLite database."""
+
+    def __init__(self, path=DEFAULT_PATH):
+        """Open or create the database at path."""
+        self.connection = sqlite3.connect(path)
+        with self.connection:
+            self.connection.executescript(_SCHEMA)
+
+    def addScore(self, mode, seconds, recordedAt=None):
+        """Insert a score and return its id."""
+        if recordedAt is None:
+            recordedAt = time.time()
+        with self.connection:
+            cursor = self.connection.execute('INSERT INTO scores (mode, seconds, recordedAt) VALUES (?, ?, ?)',
+                                             (mode, seconds, recordedAt))
+        return cursor.lastrowid
+
+    def topScores(self, mode, k=10):
+        """Return the k fastest Scores of mode, fastest first."""
+        rows = self.connection.execute('SELECT mode, seconds, recordedAt FROM scores WHERE mode = ? '
+                                       'ORDER BY seconds, id LIMIT ?', (mode, k))
+        return [Score(*row) for row in rows]
+
+    def bestScore(self, mode):
+        """Return the fastest Score of mode, or None."""
+        scores = self.topScores(mode, 1)
+        return scores[0] if scores else None
+
+    def latestScore(self):
+        """Return the most recently added Score, or None."""
+        row = self.connection.execute('SELECT mode, seconds, recordedAt FROM scores '
+                                      'ORDER BY id DESC LIMIT 1').fetchone()
+        return Score(*row) if row else None
+
+    def importTextFile(self, path=LEGACY_PATH):
+        """Import a highscores.txt file of mode and hh:mm:ss line pairs once.
+
+        Malformed pairs, such as a mode left without a time by a truncated
+        write, are skipped. Importing the same file again does nothing.
+
+        Returns:
+            The number of scores imported.
+        """
+        key = os.path.abspath(path)
+        if self.connection.execute('SELECT 1 FROM imports WHERE path = ?', (key,)).fetchone():
+            return 0
+        with open(path, 'r') as highscoreFile:
+            contents = [x.strip() for x in highscoreFile.readlines()]
+
+        rows = []
+        modified = os.path.getmtime(path)
+        for x in range(0, len(contents) - 1, 2):
+            if contents[x] not in MODES:
+                continue
+            try:
+                seconds = parseTime(contents[x + 1])
+            except ValueError:
+                continue
+            rows.append((contents[x], seconds, modified))
+
+        with self.connection:
+            self.connection.executemany('INSERT INTO scores (mode, seconds, recordedAt) VALUES (?, ?, ?)', rows)
+            self.connection.execute('INSERT INTO imports (path, importedAt) VALUES (?, ?)', (key, time.time()))
+        return len(rows)
+
+    def close(self):
+        """Close the database."""
+        self.connection.close()
+
+
+def openScores(path=DEFAULT_PATH, legacyPath=LEGACY_PATH):
+    """Open the score store, importing the legacy text file the first time it is seen."""
+    store = ScoreStore(path)
+    if os.path.exists(legacyPath):
+        store.importTextFile(legacyPath)
+    return store
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2 or sys.argv[1] != 'import':
+        sys.exit('usage: python3 scores.py import [highscores.txt]')
+    source = sys.argv[2] if len(sys.argv) > 2 else LEGACY_PATH
+    store = ScoreStore()
+    print('Imported ' + str(store.importTextFile(source)) + ' scores from ' + source + ' into ' + DEFAULT_PATH)
@@ -0,0 +1,319 @@
+# Word Search Mania is under the MIT License
+#
+# Copyright (c) 2018 Mihir Patel
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Host many word search games at once over TCP on localhost.
+
+Every game lives in its own session with its own size, directions and
+gamestate.GameState, so one server plays any number of configurations side
+by side. All sessions draw from one shared dictionary index, and puzzles
+come from the shared on-disk puzzle cache, with the most recent ones also
+kept in memory.
+
+Clients send one JSON object per line and get one JSON object per line
+back, in order. Every reply has "ok", and an "error" string when "ok" is
+false; an "id" in a request is echoed in its reply.
+
+    {"op": "new", "size": 20, "directions": "rows,diagonals", "dense": false}
+    {"op": "new", "code": "v2-20-RCFB-S-3f1e0a56-00c0ffee12345678"}
+        -> "session", "code", "rows" and "words" of a new game
+    {"op": "click", "session": 1, "row": 3, "col": 4}
+        -> "found" (the word completed by the click, or null), "progress",
+           "complete" and "seconds"
+    {"op": "clear", "session": 1}
+    {"op": "state", "session": 1}
+        -> "selected" cells, "foundWords", "progress", "complete" and "seconds"
+    {"op": "end", "session": 1}
+
+Sessions belong to the connection that started them and end when it closes.
+
+Usage:
+    python3 source1.py serve [--host 127.0.0.1] [--port 8765]
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import sys
+import time
+from collections import OrderedDict
+
+import batch
+import cache
+import dictionary
+import gamecode
+import gamestate
+
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+MIN_ROWS = 10
+MAX_ROWS = 500
+# Packing a dense puzzle takes seconds from about 200 rows, so dense games stop at the largest regular board
+MAX_DENSE_ROWS = 40
+
+# Puzzles kept in memory in front of the disk cache, for codes many players replay
+MEMORY_PUZZLES = 256
+
+# Longest request line accepted; replies of the largest boards are longer
+LINE_LIMIT = 1 << 16
+
+
+class Session:
+    """One game played over the network.
+
+    Attributes:
+        code: The gamecode.GameCode of the puzzle.
+        gameState: The gamestate.GameState of the game.
+        startedAt: A float for the time.monotonic() the game started at.
+    """
+
+    def __init__(self, code, puzzle):
+        """Start a game of puzzle."""
+        self.code = code
+        self.gameState = gamestate.GameState(puzzle)
+        self.startedAt = time.monotonic()
+
+    def seconds(self):
+        """Return the seconds played, which stop counting once every word is found."""
+        state = self.gameState
+        if not state.complete:
+            state.tick(int(time.monotonic() - self.startedAt) - state.elapsedSeconds)
+        return state.elapsedSeconds
+
+
+class GameServer:
+    """Sessions of any number of clients, sharing one dictionary and puzzle cache.
+
+    Attributes:
+        wordList: The dictionary.WordIndex new games draw their words from.
+        puzzleCache: The cache.PuzzleCache puzzles are loaded from and stored in.
+        sessions: A dict mapping session ids to Sessions.
+    """
+
+    def __init__(self, wordsPath='words_alpha.txt', cacheDirectory=cache.DEFAULT_DIRECTORY):
+        """Load the dictionary and open the puzzle cache."""
+        self.wordList = dictionary.loadDictionary(wordsPath)
+        self.puzzleCache = cache.PuzzleCache(cacheDirectory)
+        self.sessions = {}
+        self._recent = OrderedDict()
+        self._sessionIds = itertools.count(1)
+        self._handlers = {
+            'new': self.newGame,
+            'click': self.click,
+            'clear': self.clear,
+            'state': self.state,
+            'end': self.end,
+        }
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT, ready=None):
+        """Accept connections until cancelled, calling ready with the bound port once listening."""
+        server = await asyncio.start_server(self.handleConnection, host, port, limit=LINE_LIMIT)
+        if ready is not None:
+            ready(server.sockets[0].getsockname()[1])
+        async with server:
+            await server.serve_forever()
+
+    async def handleConnection(self, reader, writer):
+        """Answer the requests of one client and end its sessions when it disconnects."""
+        owned = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # The line is over LINE_LIMIT and cannot be resynchronized
+                    break
+                if not line:
+                    break
+                reply = await self.handle(line, owned)
+                writer.write(json.dumps(reply, separators=(',', ':')).encode('ascii') + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for sessionId in owned:
+                self.sessions.pop(sessionId, None)
+            writer.close()
+
+    async def handle(self, line, owned):
+        """Return the reply to one request line from a client owning the session ids in owned."""
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return {'ok': False, 'error': 'a request must be one line of JSON'}
+        if not isinstance(request, dict):
+            return {'ok': False, 'error': 'a request must be a JSON object'}
+        op = request.get('op')
+        # Only a string can name a handler; a list or object op would not even hash
+        handler = self._handlers.get(op) if isinstance(op, str) else None
+        try:
+            if handler is None:
+                raise ValueError('unknown op ' + repr(op))
+            reply = await handler(request, owned)
+        except ValueError as error:
+            reply = {'ok': False, 'error': str(error)}
+        if 'id' in request:
+            reply['id'] = request['id']
+        return reply
+
+    async def newGame(self, request, owned):
+        """Start a session for a game code or for a size, directions and engine."""
+        code = self.gameCode(request)
+        puzzle = await self.puzzle(code)
+        sessionId = next(self._sessionIds)
+        self.sessions[sessionId] = Session(code, puzzle)
+        owned.add(sessionId)
+        return {'ok': True, 'session': sessionId, 'code': gamecode.formatCode(code), 'rows': puzzle.rows(),
+                'words': puzzle.wordBank}
+
+    async def click(self, request, owned):
+        """Select or unselect a cell and report the word it completes."""
+        session = self._session(request, owned)
+        state = session.gameState
+        row = _integer(request, 'row', 0, state.nElements - 1)
+        col = _integer(request, 'col', 0, state.nElements - 1)
+        state.toggle(row, col)
+        placement = state.checkSelection()
+        return {'ok': True, 'found': placement.word if placement is not None else None, 'progress': state.progress,
+                'complete': state.complete, 'seconds': session.seconds()}
+
+    async def clear(self, request, owned):
+        """Unselect every cell."""
+        self._session(request, owned).gameState.clearSelection()
+        return {'ok': True}
+
+    async def state(self, request, owned):
+        """Report the selection, the words found and the time played."""
+        session = self._session(request, owned)
+        state = session.gameState
+        return {'ok': True, 'selected': state.selectedCells(), 'foundWords': state.foundWords,
+                'progress': state.progress, 'complete': state.complete, 'seconds': session.seconds()}
+
+    async def end(self, request, owned):
+        """End a session and report how far it got."""
+        session = self._session(request, owned)
+        sessionId = request['session']
+        del self.sessions[sessionId]
+        owned.discard(sessionId)
+        return {'ok': True, 'progress': session.gameState.progress, 'complete': session.gameState.complete,
+                'seconds': session.seconds()}
+
+    def gameCode(self, request):
+        """Return the GameCode a new game request asks for, with a fresh seed unless it gives a code.
+
+        Raises:
+            ValueError: The request asks for a game this server cannot make.
+        """
+        if 'code' in request:
+            if not isinstance(request['code'], str):
+                raise ValueError('code must be a string')
+            code = gamecode.parseCode(request['code'])
+            if not self.wordList.sourceHash.startswith(code.wordHash):
+                raise ValueError('this game code was made with a different word list')
+            if not MIN_ROWS <= code.nElements <= MAX_ROWS:
+                raise ValueError('size must be between {} and {}'.format(MIN_ROWS, MAX_ROWS))
+            if code.dense and code.nElements > MAX_DENSE_ROWS:
+                raise ValueError('dense games must have at most {} rows'.format(MAX_DENSE_ROWS))
+            return code
+        size = _integer(request, 'size', MIN_ROWS, MAX_ROWS, 20)
+        directions = request.get('directions', 'rows,columns,diagonals')
+        if not isinstance(directions, str):
+            raise ValueError('directions must be a comma separated string')
+        try:
+            directions = batch.parseDirections(directions)
+        except argparse.ArgumentTypeError as error:
+            raise ValueError(str(error)) from None
+        dense = request.get('dense', False)
+        if not isinstance(dense, bool):
+            raise ValueError('dense must be true or false')
+        if dense and size > MAX_DENSE_ROWS:
+            raise ValueError('dense games must have at most {} rows'.format(MAX_DENSE_ROWS))
+        return gamecode.GameCode(size, directions, dense, self.wordList.sourceHash, gamecode.newSeed())
+
+    async def puzzle(self, code):
+        """Return the puzzle of code from memory, the disk cache or a worker thread generating it."""
+        key = gamecode.formatCode(code)
+        puzzle = self._recent.get(key)
+        if puzzle is not None:
+            self._recent.move_to_end(key)
+            return puzzle
+        # Generation runs off the event loop so moves in other sessions keep being answered
+        puzzle = await asyncio.get_running_loop().run_in_executor(None, self.puzzleCache.load, code,
+                                                                  self.wordList)
+        self._recent[key] = puzzle
+        if len(self._recent) > MEMORY_PUZZLES:
+            self._recent.popitem(last=False)
+        return puzzle
+
+    def _session(self, request, owned):
+        """Return the Session a request names, if the client owns it.
+
+        Raises:
+            ValueError: The client has no such session.
+        """
+        sessionId = request.get('session')
+        if not isinstance(sessionId, int) or sessionId not in owned:
+            raise ValueError('unknown session ' + repr(sessionId))
+        return self.sessions[sessionId]
+
+
+def _integer(request, name, low, high, default=None):
+    """Return the integer field name of request, checking it is between low and high.
+
+    Raises:
+        ValueError: The field is missing, not an integer or out of range.
+    """
+    value = request.get(name, default)
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError(name + ' must be an integer')
+    if not low <= value <= high:
+        raise ValueError('{} must be between {} and {}'.format(name, low, high))
+    return value
+
+
+def main(argv=None):
+    """Run the serve command and return the process exit code."""
+    parser = argparse.ArgumentParser(prog='source1.py serve', description='Host word search games over TCP.')
+    parser.add_argument('--host', default=DEFAULT_HOST, help='address to listen on (default {})'.format(DEFAULT_HOST))
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT,
+                        help='port to listen on, or 0 for any free port (default {})'.format(DEFAULT_PORT))
+    parser.add_argument('--words', default='words_alpha.txt', help='word list to draw words from')
+    parser.add_argument('--cache', default=cache.DEFAULT_DIRECTORY,
+                        help='directory of the puzzle cache (default {})'.format(cache.DEFAULT_DIRECTORY))
+    args = parser.parse_args(argv)
+
+    server = GameServer(args.words, args.cache)
+
+    def ready(port):
+        print('Serving word search games on {}:{}'.format(args.host, port), flush=True)
+
+    try:
+        asyncio.run(server.serve(args.host, args.port, ready))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,327 @@
+# Word Search Mania is under the MIT License
+#
+# Copyright (c) 2018 Mihir Patel
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Find every occurrence of a list of words in a word search grid.
+
+All rows, columns and both diagonal families are joined into one text with
+a separator between lines, and the words and their reversals are loaded into
+one Aho-Corasick automaton. A single pass over the text then reports every
+occurrence in all eight reading directions.
+
+WindowSolver finds the same occurrences by looking up windows of the text
+in dicts instead. It needs no automaton, which makes it the faster choice
+for a word list that is searched once, such as a new puzzle's bank. When
+NumPy is installed the windows are matched as arrays of letter codes; the
+occurrences are the same either way.
+"""
+
+import bisect
+from collections import namedtuple, deque
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+_SEPARATOR = ord('\n')
+
+# WindowSolver looks up longer words by their first PREFIX_LENGTH letters
+PREFIX_LENGTH = 6
+
+
+class Occurrence(namedtuple('Occurrence', ['word', 'row', 'col', 'dRow', 'dCol'])):
+    """A word read from row, col stepping dRow, dCol per letter."""
+
+    __slots__ = ()
+
+    def cells(self):
+        """Return the (row, col) of every letter of the occurrence."""
+        return [(self.row + i * self.dRow, self.col + i * self.dCol) for i in range(len(self.word))]
+
+
+class Solver:
+    """Aho-Corasick automaton over a word list and the reversed words.
+
+    Transitions are memoized per state on first use, so scanning costs one
+    dict lookup per letter once the automaton has warmed up.
+
+    Attributes:
+        words: A list of the distinct lowercase words searched for.
+    """
+
+    def __init__(self, words):
+        """Build the automaton for words."""
+        self.words = sorted({word.lower() for word in words if word})
+        self.minLength = min((len(word) for word in self.words), default=0)
+        self.maxLength = max((len(word) for word in self.words), default=0)
+
+        goto = [{}]
+        outputs = [()]
+        for wordIndex, word in enumerate(self.words):
+            patterns = [(word, False)]
+            if word[::-1] != word:
+                patterns.append((word[::-1], True))
+            for pattern, reversed_ in patterns:
+                state = 0
+                for letter in pattern.encode('ascii'):
+                    nextState = goto[state].get(letter)
+                    if nextState is None:
+                        nextState = len(goto)
+                        goto[state][letter] = nextState
+                        goto.append({})
+                        outputs.append(())
+                    state = nextState
+                outputs[state] += ((len(pattern), wordIndex, reversed_),)
+
+        # Breadth first, so the failure state of a state is always finished first
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for letter, nextState in goto[state].items():
+                queue.append(nextState)
+                failState = fail[state]
+                while failState and letter not in goto[failState]:
+                    failState = fail[failState]
+                candidate = goto[failState].get(letter, 0)
+                fail[nextState] = candidate if candidate != nextState else 0
+                outputs[nextState] += outputs[fail[nextState]]
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+        self._transitions = [dict(edges) for edges in goto]
+
+    def _step(self, state, letter):
+        """Follow failure links to the transition of state on letter and memoize it."""
+        origin = state
+        while state and letter not in self._goto[state]:
+            state = self._fail[state]
+        nextState = self._goto[state].get(letter, 0)
+        self._transitions[origin][letter] = nextState
+        return nextState
+
+    def findAll(self, grid, nElements, throughCells=None):
+        """Return every Occurrence of the words in grid.
+
+        Args:
+            grid: A bytes-like object of nElements * nElements letters in row-major order.
+            nElements: An integer for the number of rows and columns of the grid.
+            throughCells: An optional collection of (row, col); only the
+                words running through one of these cells are sure to be found.
+        """
+        text, lines = _lines(bytes(grid).lower(), nElements, self.minLength, throughCells, self.maxLength)
+        lineStarts = [line[0] for line in lines]
+        transitions = self._transitions
+        outputs = self._outputs
+        step = self._step
+        matches = []
+
+        state = 0
+        for position, letter in enumerate(text):
+            nextState = transitions[state].get(letter)
+            if nextState is None:
+                nextState = 0 if letter == _SEPARATOR else step(state, letter)
+            state = nextState
+            if outputs[state]:
+                matches.append((position, state))
+
+        occurrences = []
+        for position, state in matches:
+            for length, wordIndex, reversed_ in outputs[state]:
+                occurrences.append(_occurrence(lines, lineStarts, position - length + 1, length,
+                                               self.words[wordIndex], reversed_))
+        return occurrences
+
+
+class WindowSolver:
+    """Dicts of the words and reversed words, looked up by windows of the text.
+
+    Words shorter than PREFIX_LENGTH letters are looked up whole, one pass
+    over the text per length. Longer ones are looked up by their first
+    PREFIX_LENGTH letters and then compared in full. Each pass slices and
+    hashes the text in C, which beats stepping an automaton once per letter
+    in Python, and building the dicts is far cheaper than building one.
+
+    Attributes:
+        words: A list of the distinct lowercase words searched for.
+    """
+
+    def __init__(self, words):
+        """Index words and their reversals by length and prefix."""
+        self.words = sorted({word.lower() for word in words if word})
+        self.minLength = min((len(word) for word in self.words), default=0)
+        self.maxLength = max((len(word) for word in self.words), default=0)
+        # Length to pattern to (word index, reversed), for words shorter than PREFIX_LENGTH
+        self._short = {}
+        # Prefix to (pattern, word index, reversed), for the rest
+        self._long = {}
+        for wordIndex, word in enumerate(self.words):
+            patterns = [(word, False)]
+            if word[::-1] != word:
+                patterns.append((word[::-1], True))
+            for pattern, reversed_ in patterns:
+                pattern = pattern.encode('ascii')
+                if len(pattern) < PREFIX_LENGTH:
+                    self._short.setdefault(len(pattern), {}).setdefault(pattern, []).append((wordIndex, reversed_))
+                else:
+                    self._long.setdefault(pattern[:PREFIX_LENGTH], []).append((pattern, wordIndex, reversed_))
+        # The letter codes of every key, per window length, when NumPy matches the windows
+        self._codes = {}
+        if numpy is not None:
+            for length, patterns in list(self._short.items()) + [(PREFIX_LENGTH, self._long)]:
+                self._codes[length] = numpy.array([_windowCode(pattern) for pattern in patterns], dtype=numpy.uint64)
+
+    def findAll(self, grid, nElements, throughCells=None):
+        """Return every Occurrence of the words in grid, ordered by where they start in the text.
+
+        Takes the same arguments as Solver.findAll.
+        """
+        text, lines = _lines(bytes(grid).lower(), nElements, self.minLength, throughCells, self.maxLength)
+        lineStarts = [line[0] for line in lines]
+        matches = []
+        for length, patterns in self._short.items():
+            for start in _windowStarts(text, length, patterns, self._codes.get(length)):
+                for wordIndex, reversed_ in patterns[text[start:start + length]]:
+                    matches.append((start, length, wordIndex, reversed_))
+        prefixes = self._long
+        if prefixes:
+            for start in _windowStarts(text, PREFIX_LENGTH, prefixes, self._codes.get(PREFIX_LENGTH)):
+                for pattern, wordIndex, reversed_ in prefixes[text[start:start + PREFIX_LENGTH]]:
+                    if text.startswith(pattern, start):
+                        matches.append((start, len(pattern), wordIndex, reversed_))
+        matches.sort()
+        return [_occurrence(lines, lineStarts, start, length, self.words[wordIndex], reversed_)
+                for start, length, wordIndex, reversed_ in matches]
+
+
+def _windowStarts(text, length, patterns, codes=None):
+    """Return the offsets of text, in order, where the length letters starting there are a key of patterns.
+
+    codes is a NumPy array of the _windowCode of every key, or None to compare the windows as bytes.
+    """
+    if codes is None:
+        return [i for i in range(len(text) - length + 1) if text[i:i + length] in patterns]
+    if len(text) < length:
+        return []
+    # Five bits per letter, with 0 for the line separator or any other byte, so a window of up
+    # to 12 letters is one integer and a window holding a 0 is never a key
+    letters = numpy.frombuffer(text, dtype=numpy.uint8).astype(numpy.uint64)
+    letters = numpy.where((letters >= ord('a')) & (letters <= ord('z')), letters - 96, 0)
+    count = len(text) - length + 1
+    windows = numpy.zeros(count, dtype=numpy.uint64)
+    for k in range(length):
+        windows = (windows << numpy.uint64(5)) | letters[k:k + count]
+    return numpy.flatnonzero(numpy.isin(windows, codes)).tolist()
+
+
+def _windowCode(pattern):
+    """Return the integer _windowStarts gives the window spelling pattern."""
+    code = 0
+    for letter in pattern:
+        code = code << 5 | (letter - 96)
+    return code
+
+
+def _occurrence(lines, lineStarts, start, length, word, reversed_):
+    """Return the Occurrence of word matched at offset start of the joined text."""
+    lineStart, row, col, dRow, dCol = lines[bisect.bisect_right(lineStarts, start) - 1]
+    offset = start - lineStart
+    if reversed_:
+        offset += length - 1
+        row, col = row + offset * dRow, col + offset * dCol
+        return Occurrence(word, row, col, -dRow, -dCol)
+    return Occurrence(word, row + offset * dRow, col + offset * dCol, dRow, dCol)
+
+
+def _lines(grid, n, minLength, throughCells=None, maxLength=None):
+    """Join the rows, columns and diagonals of grid into one text.
+
+    With throughCells, only the stretches of at most maxLength - 1 cells on
+    either side of those cells are joined, each as a line of its own.
+
+    Returns:
+        The text and a list of (text offset, row, col, dRow, dCol) per line.
+    """
+    parts = []
+    lines = []
+    offset = 0
+
+    wanted = None
+    if throughCells is not None:
+        # A line is identified by its first cell and its step, and maps to the positions along it
+        wanted = {}
+        for row, col in throughCells:
+            wanted.setdefault((row, 0, 0, 1), []).append(col)
+            wanted.setdefault((0, col, 1, 0), []).append(row)
+            wanted.setdefault((row - min(row, col), col - min(row, col), 1, 1), []).append(min(row, col))
+            back = min(row, n - 1 - col)
+            wanted.setdefault((row - back, col + back, 1, -1), []).append(back)
+
+    def add(line, row, col, dRow, dCol):
+        nonlocal offset
+        spans = [(0, len(line))]
+        if wanted is not None:
+            positions = wanted.get((row, col, dRow, dCol))
+            if positions is None:
+                return
+            spans = _spans(positions, len(line), maxLength)
+        for first, end in spans:
+            if end - first >= max(minLength, 1):
+                parts.append(line[first:end])
+                lines.append((offset, row + first * dRow, col + first * dCol, dRow, dCol))
+                offset += end - first + 1
+
+    for row in range(n):
+        add(grid[row * n:(row + 1) * n], row, 0, 0, 1)
+    for col in range(n):
+        add(grid[col::n], 0, col, 1, 0)
+    for col in range(n):
+        add(grid[col::n + 1][:n - col], 0, col, 1, 1)
+    for row in range(1, n):
+        add(grid[row * n::n + 1][:n - row], row, 0, 1, 1)
+    for col in range(n):
+        add(grid[col:col * n + 1:n - 1] if n > 1 else grid[col:col + 1], 0, col, 1, -1)
+    for row in range(1, n):
+        add(grid[row * n + n - 1::n - 1][:n - row], row, n - 1, 1, -1)
+
+    return b'\n'.join(parts), lines
+
+
+def _spans(positions, size, maxLength):
+    """Return the merged (first, end) ranges of a line of size cells within maxLength - 1 of positions."""
+    if maxLength is None:
+        return [(0, size)]
+    spans = []
+    for position in sorted(positions):
+        first, end = max(0, position - maxLength + 1), min(size, position + maxLength)
+        if spans and first <= spans[-1][1]:
+            spans[-1] = (spans[-1][0], max(spans[-1][1], end))
+        else:
+            spans.append((first, end))
+    return spans
+
+
+def solvePuzzle(puzzle):
+    """Return every Occurrence of the word bank of a generator.Puzzle in its grid."""
+    return Solver(puzzle.wordBank).findAll(puzzle.grid, puzzle.nElements)
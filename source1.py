@@ -1,998 +1,1277 @@
-# Word Search Mania is under the MIT License
-#
-# Copyright (c) 2018 Mihir Patel
-#
-# Permission is hereby granted, free of charge, to any person obtaining a copy
-# of this software and associated documentation files (the "Software"), to deal
-# in the Software without restriction, including without limitation the rights
-# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
-# copies of the Software, and to permit persons to whom the Software is
-# furnished to do so, subject to the following conditions:
-#
-# The above copyright notice and this permission notice shall be included in all
-# copies or substantial portions of the Software.
-#
-# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
-# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
-# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
-# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
-# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
-# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
-# SOFTWARE.
-
-
-import sys
-import random
-import string
-import PyQt5.QtCore
-from PyQt5.QtGui import QPixmap, QFont, QColor, QBrush, QTextCursor
-from PyQt5.QtWidgets import QWidget, QSlider, QLabel, QPushButton, \
-    QVBoxLayout, QHBoxLayout, QGridLayout, QCheckBox, QMessageBox, \
-    QTextEdit, QTableWidget, QProgressBar, QAbstractScrollArea, \
-    QAbstractItemView, QLCDNumber, QTableWidgetItem, QApplication
-
-
-nElements = 20
-wordBoxChecked = False
-rowBoxChecked = False
-columnBoxChecked = False
-diagonalBoxChecked = False
-
-
-class StartMenu(QWidget):
-    """Display window to configure the word search.
-
-    Display options to:
-        1. Select the number of rows for the word search grid
-        2. Customize the game further
-        3. Start the game
-        4. Quit the game
-    """
-
-    def __init__(self):
-        """Initiate initUI."""
-        super().__init__()
-        self.initUI()
-
-    def initUI(self):
-        """Initiate UI elements."""
-        self.setWindowTitle("Word Search Mania")
-
-        self.slider = QSlider(PyQt5.QtCore.Qt.Horizontal)
-        self.sliderLabel = QLabel()
-        self.configSlider()
-        self.slider.valueChanged.connect(self.nRowDisplayChanged)
-
-        self.difficultyLevel = QLabel()
-        self.nRowDisplay = QLabel()
-        self.configElementDisplay()
-
-        buttonStart = QPushButton('Start')
-        buttonStart.clicked.connect(self.onClickStart)
-
-        buttonQuit = QPushButton('Quit')
-        buttonQuit.clicked.connect(self.onClickQuit)
-
-        buttonCustomize = QPushButton('Customize')
-        buttonCustomize.clicked.connect(self.onClickCustomize)
-
-        logoImage = QLabel()
-        logoImage.setGeometry(10, 10, 10, 10)
-        logoImage.setPixmap(QPixmap("logo.png").scaledToWidth(500))
-
-        hBox = QHBoxLayout()
-        hBox.addWidget(buttonQuit)
-        hBox.addWidget(buttonCustomize)
-        hBox.addWidget(buttonStart)
-
-        grid = QGridLayout()
-        self.setLayout(grid)
-        grid.addWidget(logoImage, 0, 0)
-        grid.addWidget(self.sliderLabel, 1, 0)
-        grid.addWidget(self.difficultyLevel, 2, 0)
-        grid.addWidget(self.slider, 3, 0)
-        grid.addWidget(self.nRowDisplay, 4, 0)
-        grid.addLayout(hBox, 5, 0)
-
-        self.show()
-
-    def configSlider(self):
-        """Configure slider attributes and slider label."""
-        self.slider.setTickPosition(QSlider.TicksBelow)
-        self.slider.setRange(10, 40)
-        self.slider.setTickInterval(5)
-        self.slider.setSingleStep(5)
-        self.slider.setValue(nElements)
-
-        self.sliderLabel.setText("How many rows would you like?")
-        self.sliderLabel.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
-        self.sliderLabel.setFont(QFont("Futura", 20))
-
-    def configElementDisplay(self):
-        """Configure difficulty label and display n row number."""
-        self.difficultyLevel.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
-        self.difficultyLevel.setText("Medium")
-        self.difficultyLevel.setStyleSheet("color: rgb(255, 193, 37)")
-
-        self.nRowDisplay.setText(str(self.slider.value()))
-        self.nRowDisplay.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
-        self.nRowDisplay.setFont(QFont("Futura", 30))
-        self.nRowDisplay.setStyleSheet("color: rgb(0, 170, 240)")
-
-    def getSliderValue(self):
-        """Get value from slider."""
-        global nElements
-        nElements = self.slider.value()
-
-    def nRowDisplayChanged(self):
-        """Change n row number to slider value and change difficulty label."""
-        self.nRowDisplay.setText(str(self.slider.value()))
-        if 10 <= self.slider.value() < 20:
-            self.difficultyLevel.setText("Easy")
-            self.difficultyLevel.setStyleSheet("color: rgb(67, 205, 128)")
-        elif 20 <= self.slider.value() < 30:
-            self.difficultyLevel.setText("Medium")
-            self.difficultyLevel.setStyleSheet("color: rgb(255, 193, 37)")
-        else:
-            self.difficultyLevel.setText("Hard")
-            self.difficultyLevel.setStyleSheet("color: rgb(255, 99, 71)")
-
-    def onClickStart(self):
-        """Open main app on button click start."""
-        self.getSliderValue()
-        self.close()
-        self.openApp = App()
-        self.openApp.show()
-
-    def onClickQuit(self):
-        """Exit window on button click button quit."""
-        sys.exit()
-
-    def onClickCustomize(self):
-        """Initiate customize menu on button click customize."""
-        self.close()
-        self.openCustomizeMenu = CustomizeMenu()
-        self.openCustomizeMenu.show()
-
-
-class CustomizeMenu(QWidget):
-    """Display window to customize the word search.
-
-    Display options to:
-        1. Add custom words
-        2. Configure how words are generated
-        3. Continue if done customizing
-
-    Raise pop-ups if configuration limits are not met.
-    """
-
-    def __init__(self):
-        """Initiate initUI."""
-        super().__init__()
-        self.initUI()
-
-    def initUI(self):
-        """Initiate UI elements."""
-        self.setWindowTitle("Customize")
-
-        self.cBoxWords = QCheckBox('Check to add custom words', self)
-        self.cBoxWords.stateChanged.connect(self.wordBoxChecked)
-        self.cBoxWords.setToolTip('Check to add custom words')
-
-        self.cBoxRows = QCheckBox('Rows')
-        self.cBoxRows.stateChanged.connect(self.rowBoxChecked)
-        self.cBoxRows.setToolTip('Check the "row" box to generate words horizontally')
-
-        self.cBoxColumns = QCheckBox('Columns')
-        self.cBoxColumns.stateChanged.connect(self.columnBoxChecked)
-        self.cBoxColumns.setToolTip('Check the "columns" box to generate words vertically')
-
-        self.cBoxDiagonals = QCheckBox('Diagonals')
-        self.cBoxDiagonals.stateChanged.connect(self.diagonalBoxChecked)
-        self.cBoxDiagonals.setToolTip('Check the "diagonals" box to generate words diagonally')
-
-        buttonContinue = QPushButton('Continue', self)
-        buttonContinue.clicked.connect(self.onClickContinue)
-
-        # Head title
-        title = QLabel()
-        title.setText('Customize')
-        title.setFont(QFont("Futura", 50))
-        title.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
-
-        # Horizontal box that contains the title
-        titleBox = QHBoxLayout()
-        titleBox.addWidget(title)
-
-        # Description above right hand checkboxes
-        cBoxDescription = QLabel()
-        cBoxDescription.setText('How would you like\nthe words to be generated?')
-
-        # Text box to add custom words
-        self.addWordBox = QTextEdit()
-        self.addWordBox.setMaximumWidth(200)
-        self.addWordBox.setMaximumHeight(150)
-        self.addWordBox.setToolTip('Words must be at least 3 characters long!')
-        self.addWordBox.setReadOnly(True)
-
-        vBox = QVBoxLayout()
-        vBox.addWidget(cBoxDescription)
-        vBox.addWidget(self.cBoxRows)
-        vBox.addWidget(self.cBoxColumns)
-        vBox.addWidget(self.cBoxDiagonals)
-        vBox.addWidget(buttonContinue)
-
-        vBox2 = QVBoxLayout()
-        vBox2.addWidget(self.cBoxWords)
-        vBox2.addWidget(self.addWordBox)
-
-        grid = QGridLayout()
-        grid.addLayout(vBox2, 1, 0)
-        grid.addLayout(vBox, 1, 1)
-
-        vBoxOuter = QVBoxLayout()
-        self.setLayout(vBoxOuter)
-        vBoxOuter.addWidget(title)
-        vBoxOuter.addLayout(grid)
-
-        self.show()
-
-    def wordBoxChecked(self):
-        """Allow text to be entered into word box if checked."""
-        global wordBoxChecked
-        if self.cBoxWords.isChecked():
-            self.addWordBox.setReadOnly(False)
-            wordBoxChecked = True
-        else:
-            self.addWordBox.setReadOnly(True)
-            wordBoxChecked = False
-
-    def rowBoxChecked(self):
-        """Set row generation to true if checked."""
-        global rowBoxChecked
-        if self.cBoxRows.isChecked():
-            rowBoxChecked = True
-        else:
-            rowBoxChecked = False
-
-    def columnBoxChecked(self):
-        """Set column generation to true if checked."""
-        global columnBoxChecked
-        if self.cBoxWords.isChecked():
-            columnBoxChecked = True
-        else:
-            columnBoxChecked = False
-
-    def diagonalBoxChecked(self):
-        """Set diagonal generation to true if checked."""
-        global diagonalBoxChecked
-        if self.cBoxWords.isChecked():
-            diagonalBoxChecked = True
-        else:
-            diagonalBoxChecked = False
-
-    def onClickContinue(self):
-        """Open main app window if limits met; raise pop-ups otherwise."""
-        if not self.cBoxRows.isChecked() and not self.cBoxColumns.isChecked() and not self.cBoxDiagonals.isChecked():
-            self.popUp()
-
-        elif self.cBoxWords.isChecked():
-            customWords = self.addWordBox.toPlainText()
-            wordList = customWords.split()
-            for x in wordList:
-                if len(x) < 3:
-                    self.popUp4()
-                elif x.isalpha():
-                    x = x.lower()
-                    with open('custom_word_bank.txt', 'w') as customWordFile:
-                        customWordFile.write(x + '\n')
-                else:
-                    self.popUp2()
-
-            if len(wordList) < 5:
-                self.popUp3()
-            else:
-                self.close()
-                openApp = App()
-                openApp.show()
-        else:
-            self.close()
-            self.openApp = App()
-            self.openApp.show()
-
-    def popUp(self):
-        """Raise pop-up when no generation direction is checked."""
-        popup = QMessageBox()
-        popup.warning("Error", 'Please select at least one direction to generate words', QMessageBox.Ok)
-        if popup == QMessageBox.Ok:
-            pass
-
-    def popUp2(self):
-        """Raise pop-up when non-alphanumeric characters are used."""
-        popup2 = QMessageBox()
-        popup2.warning("Error", 'Only alphanumeric characters are aloud!', QMessageBox.Ok)
-        if popup2 == QMessageBox.Ok:
-            pass
-
-    def popUp3(self):
-        """Raise pop-up when less than 5 words are entered."""
-        popup3 = QMessageBox()
-        popup3.warning("Error", 'You must enter in at least 5 words!', QMessageBox.Ok)
-        if popup3 == QMessageBox.Ok:
-            pass
-
-    def popUp4(self):
-        """Raise pop-up when custom words contain less than 3 characters."""
-        popup4 = QMessageBox()
-        popup4.warning("Error", 'Custom words must be contain at least 3 characters!', QMessageBox.Ok)
-        if popup4 == QMessageBox.Ok:
-            pass
-
-
-class App(QWidget):
-    """Display window for the main game and start the timer.
-
-    Display options to:
-        1. Select letters on the table
-        2. Pause/Resume the game
-        3. Quit the game
-
-    Attributes:
-        wordBank: A string of the words to find in the word search.
-        wordBankSplit: A list of strings of words to find in the word search.
-        wordSelected: A string to hold the current word selected.
-        xVisited: A list of integers to hold the current row values of the letters selected.
-        yVisited: A list of integers to hold the current column values of the letters selected.
-        inRow: An integer to determine if the letters selected are in consecutive fashion.
-        progressValue: An integer to keep track of the words found.
-        wordsCompleted: A list of strings of the words found.
-        timeFlag: A time flag to keep track of the timer if the game has been paused or resumed.
-    """
-
-    def __init__(self):
-        """Initiate initUI."""
-        super().__init__()
-        self.wordBank = ""
-        self.wordBankSplit = []
-        self.wordSelected = ""
-        self.xVisited = []
-        self.yVisited = []
-        self.inRow = 0
-        self.progressValue = 0
-        self.wordsCompleted = []
-        self.timeFlag = 2
-        self.initUI()
-
-    def initUI(self):
-        """Initiate UI elements."""
-        title = 'Word Search Mania'
-        self.setWindowTitle(title)
-
-        self.wordBankBox = QTextEdit()
-        self.tableWidget = QTableWidget()
-        self.progress = QProgressBar()
-        self.timer = PyQt5.QtCore.QTimer()
-
-        self.createTable()
-        self.createWordBank()
-        self.createProgressBar()
-        self.createTimer()
-        self.mouseTracking()
-
-        wordBankTitle = QLabel()
-        wordBankTitle.setText("       Word Bank")
-        font = QFont()
-        font.setBold(True)
-        wordBankTitle.setFont(font)
-
-        buttonClear = QPushButton('Clear', self)
-        buttonClear.setToolTip('This clears your word selection.')
-        buttonClear.clicked.connect(self.onClickClear)
-
-        buttonQuit = QPushButton('Quit', self)
-        buttonQuit.setToolTip('This will buttonQuit your game. You will loose all progress.')
-        buttonQuit.clicked.connect(self.onClickQuit)
-
-        self.buttonPause = QPushButton('Pause')
-        self.buttonPause.setToolTip('This pauses the game.')
-        self.buttonPause.clicked.connect(self.onClickPause)
-
-        vBox = QVBoxLayout()
-        vBox.addWidget(wordBankTitle)
-        vBox.addWidget(self.wordBankBox)
-        vBox.addWidget(buttonClear)
-        vBox.addWidget(self.buttonPause)
-        vBox.addWidget(buttonQuit)
-
-        self.grid = QGridLayout()
-        self.grid.addLayout(vBox, 0, 1)
-        self.grid.addWidget(self.tableWidget, 0, 0)
-        self.grid.addWidget(self.progress, 1, 0)
-        self.grid.addWidget(self.LCD, 1, 1)
-
-        self.setLayout(self.grid)
-
-        self.tableWidget.setSizeAdjustPolicy(QAbstractScrollArea.AdjustToContents)
-
-        self.show()
-
-    def createTable(self):
-        """Generate the word search table."""
-        generateAll = False
-
-        global wordBoxChecked
-        global rowBoxChecked
-        global columnBoxChecked
-        global diagonalBoxChecked
-
-        if wordBoxChecked:
-            f = open('custom_word_bank.txt', "r")
-            wordBoxChecked = False
-        else:
-            f = open('words_alpha.txt', "r")
-            generateAll = True
-
-        wordFileContent = f.readlines()
-        wordFileContent = [x.strip() for x in wordFileContent]
-
-        self.tableWidget.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.tableWidget.setRowCount(nElements)
-        self.tableWidget.setColumnCount(nElements)
-
-        # Populate table with random letters
-        for y in range(0, nElements):
-            for x in range(0, nElements):
-                self.tableWidget.setItem(x, y, QTableWidgetItem(random.choice(string.ascii_uppercase)))
-                self.tableWidget.setColumnWidth(x, 20)
-                self.tableWidget.setRowHeight(y, 20)
-
-        # Implements words across rows
-        def generateRow(self):
-            col = 0
-            row = 0
-            lastColPosition = 0
-            wordDuplicate = False
-            while row < nElements:
-                while col < nElements:
-                    col = random.randint(lastColPosition, nElements)
-                    word = wordFileContent[random.randint(0, len(wordFileContent) - 1)]
-                    while len(word) < 3:
-                        word = wordFileContent[random.randint(0, len(wordFileContent) - 1)]
-                    for x in self.wordBank.split():
-                        if x == word:
-                            wordDuplicate = True
-                    if not wordDuplicate:
-                        if nElements - col > len(word):
-                            lastColPosition = len(word) + col
-                            self.wordBank += word + "\n"
-                            for x in word:
-                                self.tableWidget.setItem(row, col, QTableWidgetItem(x))
-                                col += 1
-                            col = nElements
-                    wordDuplicate = False
-                row += 3
-                col = 0
-                lastColPosition = 0
-
-        # Implements words down each column
-        def generateCol(self):
-            col = 0
-            row = 0
-            lastRowPosition = 0
-            decide = 0
-            wordDuplicate = False
-            while col < nElements:
-                while row < nElements:
-                    row = random.randint(lastRowPosition, nElements)
-                    word = wordFileContent[random.randint(0, len(wordFileContent) - 1)]
-                    while len(word) < 3:
-                        word = wordFileContent[random.randint(0, len(wordFileContent) - 1)]
-                    for x in self.wordBank.split():
-                        if x == word:
-                            wordDuplicate = True
-                    if not wordDuplicate:
-                        if nElements - row > len(word):
-                            for k in range(row, row + len(word)):
-                                if self.tableWidget.item(k, col).text().islower():
-                                    decide += 1
-                            if decide == 0:
-                                lastRowPosition = len(word) + row
-                                self.wordBank += word + "\n"
-                                for y in word:
-                                    self.tableWidget.setItem(row, col, QTableWidgetItem(y))
-                                    row += 1
-                            decide = 0
-                    wordDuplicate = False
-                col += 3
-                row = 0
-                lastRowPosition = 0
-
-        # Implements words down each diagonal in forward
-        def generateForwardDiag(self):
-            col = 0
-            row = 0
-            wordCount = 0
-            decide = 0
-            wordDuplicate = False
-            while row < nElements:
-                while col < nElements:
-                    word = wordFileContent[random.randint(0, len(wordFileContent) - 1)]
-                    while len(word) < 3:
-                        word = wordFileContent[random.randint(0, len(wordFileContent) - 1)]
-                    for x in self.wordBank.split():
-                        if x == word:
-                            wordDuplicate = True
-                    if not wordDuplicate:
-                        tempRow = row
-                        tempCol = col
-                        while tempRow < nElements and tempCol < nElements and wordCount < len(word):
-                            if self.tableWidget.item(tempRow, tempCol).text().islower():
-                                decide += 1
-                            tempRow += 1
-                            tempCol += 1
-                            wordCount += 1
-                        tempRow = row
-                        tempCol = col
-                        if decide == 0 and (len(word) + tempCol) < nElements and (len(word) + tempRow) < nElements:
-                            self.wordBank += word + "\n"
-                            for y in word:
-                                self.tableWidget.setItem(tempRow, tempCol, QTableWidgetItem(y))
-                                tempCol += 1
-                                tempRow += 1
-                    decide = 0
-                    wordCount = 0
-                    col += 1
-                    wordDuplicate = False
-                row += 1
-                col = 0
-
-        # Implements words down each diagonal in backward
-        def generateBackwardDiag(self):
-            col = nElements - 1
-            row = 0
-            wordCount = 0
-            decide = 0
-            wordDuplicate = False
-            while row < nElements:
-                while col >= 0:
-                    word = wordFileContent[random.randint(0, len(wordFileContent) - 1)]
-                    while len(word) < 3:
-                        word = wordFileContent[random.randint(0, len(wordFileContent) - 1)]
-                    for x in self.wordBank.split():
-                        if x == word:
-                            wordDuplicate = True
-                    if not wordDuplicate:
-                        tempRow = row
-                        tempCol = col
-                        while tempRow < nElements and tempCol >= 0 and wordCount < len(word):
-                            if self.tableWidget.item(tempRow, tempCol).text().islower():
-                                decide += 1
-                            tempRow += 1
-                            tempCol -= 1
-                            wordCount += 1
-                        tempRow = row
-                        tempCol = col
-                        if decide == 0 and (tempCol - len(word)) > 0 and (len(word) + tempRow) < nElements:
-                            self.wordBank += word + "\n"
-                            for y in word:
-                                self.tableWidget.setItem(tempRow, tempCol, QTableWidgetItem(y))
-                                tempRow += 1
-                                tempCol -= 1
-                    decide = 0
-                    wordCount = 0
-                    col -= 1
-                    wordDuplicate = False
-                row += 1
-                col = nElements - 1
-
-        if generateAll:
-            generateRow(self)
-            generateCol(self)
-            generateForwardDiag(self)
-            generateBackwardDiag(self)
-        else:
-            if rowBoxChecked:
-                generateRow(self)
-                rowBoxChecked = False
-            if columnBoxChecked:
-                generateCol(self)
-                columnBoxChecked = False
-            if diagonalBoxChecked:
-                generateForwardDiag(self)
-                generateBackwardDiag(self)
-                diagonalBoxChecked = False
-
-        for y in range(0, nElements):
-            for x in range(0, nElements):
-                letter = self.tableWidget.item(x, y).text().lower()
-                self.tableWidget.setItem(x, y, QTableWidgetItem(letter))
-                self.tableWidget.item(x, y).setTextAlignment(PyQt5.QtCore.Qt.AlignCenter)
-
-        self.tableWidget.horizontalHeader().hide()
-        self.tableWidget.verticalHeader().hide()
-        self.tableWidget.setShowGrid(False)
-        self.tableWidget.clicked.connect(self.onClickLetter)
-
-    def createWordBank(self):
-        """Generate a word bank of the words to be found."""
-        self.wordBankSplit = self.wordBank.split()
-        self.wordBankSplit.sort()
-        for x in self.wordBankSplit:
-            self.wordBankBox.append(x)
-        self.wordBankBox.setReadOnly(True)
-        self.wordBankBox.setMaximumWidth(120)
-        font = QFont()
-        font.setFamily('Arial')
-        self.wordBankBox.setFont(font)
-        self.wordBankBox.moveCursor(QTextCursor.Start)
-
-    def strikeWord(self, word):
-        """Strike word with a line if the word is found."""
-        newWord = ""
-        for x in word:
-            newWord += x + '\u0336'
-        self.wordBankSplit = [newWord if i == word else i for i in self.wordBankSplit]
-        self.wordBankBox.setText("")
-        for x in self.wordBankSplit:
-            self.wordBankBox.append(x)
-        self.wordBankBox.show()
-        self.wordBankBox.moveCursor(QTextCursor.Start)
-
-    def mouseTracking(self):
-        """Track mouse movement of the table."""
-        self.currentHover = [0, 0]
-        self.tableWidget.setMouseTracking(True)
-        self.tableWidget.cellEntered.connect(self.cellHover)
-
-    def cellHover(self, row, column):
-        """Highlight letter if mouse is hovering over it."""
-        item = self.tableWidget.item(row, column)
-        oldItem = self.tableWidget.item(self.currentHover[0], self.currentHover[1])
-        mouseTracker1 = True
-        mouseTracker2 = True
-        for x in range(len(self.xVisited)):
-            if self.xVisited[x] == row and self.yVisited[x] == column:
-                mouseTracker1 = False
-            if self.currentHover[0] == self.xVisited[x] and self.currentHover[1] == self.yVisited[x]:
-                mouseTracker2 = False
-        if mouseTracker1:
-            if self.currentHover != [row, column]:
-                if item.text().islower():
-                    item.setBackground(QBrush(QColor('yellow')))
-                if oldItem.text().islower() and mouseTracker2:
-                    oldItem.setBackground(QBrush(QColor('white')))
-        elif mouseTracker2:
-            oldItem.setBackground(QBrush(QColor('white')))
-        self.currentHover = [row, column]
-
-    def onClickLetter(self):
-        """Highlight letters on selection and highlight word green if found on click."""
-        self.wordSelected = ""
-        wordBankSplitOriginal = self.wordBank.split()
-        selectionTracker = True
-        selectionCorrectness = 0
-        word = ""
-        listX = []
-        listY = []
-
-        for currentQTableWidgetItem in self.tableWidget.selectedItems():
-            if self.tableWidget.item(currentQTableWidgetItem.row(), currentQTableWidgetItem.column()).text().isupper():
-                letter = self.tableWidget.item(currentQTableWidgetItem.row(),
-                                               currentQTableWidgetItem.column()).text().lower()
-                self.tableWidget.setItem(currentQTableWidgetItem.row(), currentQTableWidgetItem.column(),
-                                         QTableWidgetItem(letter))
-                self.tableWidget.clearSelection()
-            else:
-                for currentQTableWidgetItem in self.tableWidget.selectedItems():
-                    for x in range(0, len(self.xVisited)):
-                        if currentQTableWidgetItem.row() == self.xVisited[x] and currentQTableWidgetItem.column() == \
-                                self.yVisited[x]:
-                            selectionTracker = False
-                    if selectionTracker:
-                        letter = self.tableWidget.item(currentQTableWidgetItem.row(),
-                                                       currentQTableWidgetItem.column()).text().upper()
-                        self.tableWidget.setItem(currentQTableWidgetItem.row(), currentQTableWidgetItem.column(),
-                                                 QTableWidgetItem(letter))
-                for currentQTableWidgetItem in self.tableWidget.selectedItems():
-                    if selectionTracker:
-                        self.tableWidget.item(currentQTableWidgetItem.row(),
-                                              currentQTableWidgetItem.column()).setBackground(QColor(216, 191, 216))
-                for currentQTableWidgetItem in self.tableWidget.selectedItems():
-                    if selectionTracker:
-                        self.tableWidget.item(currentQTableWidgetItem.row(),
-                                              currentQTableWidgetItem.column()).setTextAlignment(
-                            PyQt5.QtCore.Qt.AlignCenter)
-                    self.tableWidget.clearSelection()
-
-        for x in range(0, nElements):
-            for y in range(0, nElements):
-                if self.tableWidget.item(x, y).text().isupper():
-                    self.wordSelected += self.tableWidget.item(x, y).text()
-                    listX.append(x)
-                    listY.append(y)
-        for x in wordBankSplitOriginal:
-            if x == self.wordSelected.lower():
-                selectionCorrectness += 1
-                word = x
-        if selectionCorrectness == 1:  # Makes sure the word is in a row
-            for i in range(1, len(listY)):
-                if listY[i - 1] == listY[i] - 1 and listX[i - 1] == listX[i]:
-                    self.inRow += 1
-                if self.inRow == len(listY) - 1:
-                    selectionCorrectness += 1
-                    self.inRow = 0
-        if selectionCorrectness == 1:  # Makes sure the word is in a single column
-            for i in range(1, len(listY)):
-                if listX[i - 1] == listX[i] - 1 and listY[i - 1] == listY[i]:
-                    self.inRow += 1
-                if self.inRow == len(listY) - 1:
-                    selectionCorrectness += 1
-                    self.inRow = 0
-        if selectionCorrectness == 1:  # Makes sure the word is in a forward diagonal
-            for i in range(1, len(listY)):
-                if listX[i - 1] == listX[i] - 1 and listY[i - 1] == listY[i] - 1:
-                    self.inRow += 1
-                if self.inRow == len(listY) - 1:
-                    selectionCorrectness += 1
-                    self.inRow = 0
-        if selectionCorrectness == 1:  # Makes sure the word is in a backward diagonal
-            for i in range(1, len(listY)):
-                if listX[i - 1] == listX[i] - 1 and listY[i - 1] == listY[i] + 1:
-                    self.inRow += 1
-                if self.inRow == len(listY) - 1:
-                    selectionCorrectness += 1
-                    self.inRow = 0
-
-        if selectionCorrectness == 2:
-            wordIndex = self.wordSelected.find(word)
-            self.progressValue += 1
-            self.setProgressBar()
-            self.strikeWord(word)
-            self.wordsCompleted.append(word)
-            for i in range(wordIndex, wordIndex + len(word)):
-                letterI = self.tableWidget.item(listX[i], listY[i]).text().lower()
-                self.tableWidget.setItem(listX[i], listY[i], QTableWidgetItem(letterI))
-            for i in range(wordIndex, wordIndex + len(word)):
-                self.tableWidget.item(listX[i], listY[i]).setBackground(QColor(144, 238, 144))
-                self.xVisited.append(listX[i])
-                self.yVisited.append(listY[i])
-            for i in range(wordIndex, wordIndex + len(word)):
-                self.tableWidget.item(listX[i], listY[i]).setTextAlignment(PyQt5.QtCore.Qt.AlignCenter)
-
-    def onClickClear(self):
-        """Clear word selection on button click."""
-        self.wordSelected = ""
-        for x in range(0, nElements):
-            for y in range(0, nElements):
-                if self.tableWidget.item(x, y).text().isupper():
-                    letterI = self.tableWidget.item(x, y).text().lower()
-                    self.tableWidget.setItem(x, y, QTableWidgetItem(letterI))
-                    self.tableWidget.item(x, y).setTextAlignment(PyQt5.QtCore.Qt.AlignCenter)
-
-    def onClickQuit(self):
-        """Display option to quit the app on button click."""
-        quitMessage = QMessageBox()
-        quitMessage = QMessageBox.question(self, "Quit", "Are you sure you would like to buttonQuit?",
-                                           QMessageBox.No | QMessageBox.Yes)
-        if quitMessage == QMessageBox.Yes:
-            sys.exit()
-        else:
-            pass
-
-    def createProgressBar(self):
-        """Generate progress bar of with the progress of the words found until completion."""
-        self.progress.setRange(0, len(self.wordBank.split()))
-        self.progress.setToolTip("Shows your word completion progress.")
-
-    def setProgressBar(self):
-        """Set value for the progress bar."""
-        self.progress.setValue(self.progressValue)
-
-    def createTimer(self):
-        """Generate a timer."""
-        self.timer.timeout.connect(self.Time)
-        self.timer.start(1000)
-        self.time = PyQt5.QtCore.QTime(0, 0, 0)
-
-        self.LCD = QLCDNumber()
-        self.LCD.display(self.time.toString("hh:mm:ss"))
-        self.LCD.setSegmentStyle(QLCDNumber.Flat)
-
-    def Time(self):
-        """Increment timer by a second."""
-        self.time = self.time.addSecs(1)
-        self.LCD.display(self.time.toString("hh:mm:ss"))
-
-        if len(self.wordsCompleted) == len(self.wordBankSplit):
-            self.timer.stop()
-            self.endTime = self.time.toString("hh:mm:ss")
-            self.addHighScore()
-            self.close()
-            self.openHighscoreMenu = HighScoreMenu()
-            self.openHighscoreMenu.show()
-
-    def onClickPause(self):
-        """Pause and resume the game on button click."""
-        if self.timeFlag % 2 == 0:
-            self.timer.stop()
-            self.timeFlag += 1
-            self.tableWidget.hide()
-            self.buttonPause.setText("Unpause")
-        else:
-            self.timer.start()
-            self.timeFlag += 1
-            self.tableWidget.show()
-            self.tableWidget.clearSelection()
-            self.buttonPause.setText("Pause")
-
-    def addHighScore(self):
-        """Save highScore to WS_Highscores text file."""
-        with open("highscores.txt", "a") as highscoreFile:
-            if 10 <= nElements <= 19:
-                highscoreFile.write("Easy\n")
-            elif 20 <= nElements <= 29:
-                highscoreFile.write("Medium\n")
-            else:
-                highscoreFile.write("Hard\n")
-            highscoreFile.write(str(self.endTime) + "\n")
-
-
-class HighScoreMenu(QWidget):
-    """Display window to report current and previous high scores
-
-    Display options to:
-        1. Start new game
-        2. Quit the game
-    """
-    def __init__(self):
-        """Initiate initUI."""
-        super().__init__()
-
-        self.initUI()
-
-    def initUI(self):
-        """Initiate UI elements."""
-        self.setWindowTitle("Word Search Mania")
-
-        self.contents = ""
-
-        with open("highscores.txt", "r") as highscoreFile:
-            self.contents = highscoreFile.readlines()
-            self.contents = [x.strip() for x in self.contents]
-
-        self.easyBoard = QTextEdit()
-        self.easyBoard.setReadOnly(True)
-        self.easyBoard.setMaximumWidth(150)
-        self.easyBoard.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
-        self.mediumBoard = QTextEdit()
-        self.mediumBoard.setReadOnly(True)
-        self.mediumBoard.setMaximumWidth(150)
-        self.mediumBoard.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
-        self.hardBoard = QTextEdit()
-        self.hardBoard.setReadOnly(True)
-        self.hardBoard.setMaximumWidth(150)
-        self.hardBoard.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
-
-        titleLabel = QLabel()
-        titleLabel.setText("High Scores")
-        titleLabel.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
-        titleLabel.setFont(QFont("Futura", 30))
-        easyLabel = QLabel()
-        easyLabel.setText("Easy Mode")
-        easyLabel.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
-        easyLabel.setToolTip("The game is in easy mode if you chose rows 10 - 19.")
-        mediumLabel = QLabel()
-        mediumLabel.setText("Medium Mode")
-        mediumLabel.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
-        mediumLabel.setToolTip("The game is in medium mode if you chose rows 20 - 29.")
-        hardLabel = QLabel()
-        hardLabel.setText("Hard Mode")
-        hardLabel.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
-        hardLabel.setToolTip("The game is in hard mode if you chose rows 30 - 40.")
-
-        for x in range(0, len(self.contents), 2):
-            if self.contents[x] == "Easy":
-                self.addEasyBoard(self.contents[x + 1])
-            if self.contents[x] == "Medium":
-                self.addMediumBoard(self.contents[x + 1])
-            if self.contents[x] == "Hard":
-                self.addHardBoard(self.contents[x + 1])
-
-        self.buttonStartOver = QPushButton()
-        self.buttonStartOver.setText("Play Again")
-        self.buttonStartOver.clicked.connect(self.onClickStartOver)
-
-        self.buttonQuit = QPushButton()
-        self.buttonQuit.setText("Quit")
-        self.buttonQuit.clicked.connect(self.onClickQuit)
-
-
-        self.createHighScoreDisplay()
-
-        HBoxLabel = QHBoxLayout()
-        HBoxLabel.addWidget(easyLabel)
-        HBoxLabel.addWidget(mediumLabel)
-        HBoxLabel.addWidget(hardLabel)
-        HBox = QHBoxLayout()
-        HBox.addWidget(self.easyBoard)
-        HBox.addWidget(self.mediumBoard)
-        HBox.addWidget(self.hardBoard)
-        HBoxButton = QHBoxLayout()
-        HBoxButton.addWidget(self.buttonQuit)
-        HBoxButton.addWidget(self.buttonStartOver)
-        self.grid = QGridLayout()
-        self.setLayout(self.grid)
-        self.grid.addWidget(titleLabel, 0, 0)
-        self.grid.addLayout(HBoxLabel, 1, 0)
-        self.grid.addLayout(HBox, 2, 0)
-        self.grid.addWidget(self.currentScore, 3, 0)
-        self.grid.addWidget(self.highScore, 4, 0)
-        self.grid.addLayout(HBoxButton, 5, 0)
-
-        self.show()
-
-    def addEasyBoard(self, score):
-        """Populate scores score to easy section of the board."""
-        self.easyBoard.append(score)
-
-    def addMediumBoard(self, score):
-        """Populate scores score to medium section of the board."""
-        self.mediumBoard.append(score)
-
-    def addHardBoard(self, score):
-        """Populate scores to hard section of the board."""
-        self.hardBoard.append(score)
-
-    def onClickStartOver(self):
-        """Open main app on button click start over."""
-        self.close()
-        self.openStartMenu = StartMenu()
-        self.openStartMenu.show()
-
-    def onClickQuit(self):
-        """Display option to quit the app on button click."""
-        self.quitMessage = QMessageBox()
-        self.quitMessage = QMessageBox.question(self, "Quit", "Are you sure you would like to buttonQuit?",
-                                                QMessageBox.No | QMessageBox.Yes)
-        if self.quitMessage == QMessageBox.Yes:
-            sys.exit()
-        else:
-            pass
-
-    def createHighScoreDisplay(self):
-        self.currentScore = QLabel()
-        self.currentScore.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
-        self.currentScore.setFont(QFont("Futura", 14))
-
-        self.highScore = QLabel()
-        self.highScore.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
-        self.highScore.setFont(QFont("Futura", 14))
-
-        highestScore = self.contents[len(self.contents) - 1]
-
-        if int(highestScore[1]) > 0 or int(highestScore[0]) > 0:
-            time = " hours"
-        elif int(highestScore[4]) > 0 or int(highestScore[3]) > 0:
-            time = " minutes"
-        else:
-            time = " seconds"
-
-        self.currentScore.setText("You beat the word search in " + self.contents[len(self.contents) - 1]
-                                  + time + " in " + self.contents[len(self.contents) - 2] + " Mode.")
-
-        mode = self.contents[len(self.contents) - 2]
-
-        for x in range(1, len(self.contents), 2):
-            if highestScore > self.contents[x] and self.contents[x - 1] == mode:
-                highestScore = self.contents[x]
-        if highestScore == self.contents[len(self.contents) - 1]:
-            self.highScore.setText("You beat your high score!")
-        else:
-            self.highScore.setText("You did not beat your high score of " + highestScore + " .")
-
-
-if __name__ == '__main__':
-    app = QApplication(sys.argv)
-    main = StartMenu()
-    main.show()
-    sys.exit(app.exec_())
+# Word Search Mania is under the MIT License
+#
+# Copyright (c) 2018 Mihir Patel
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import sys
+import time
+from collections import namedtuple
+
+_importStart = time.perf_counter()
+
+import PyQt5.QtCore
+from PyQt5.QtCore import QAbstractListModel, QAbstractTableModel, QModelIndex, QEvent, QObject, QTimer
+from PyQt5.QtGui import QPixmap, QFont, QColor, QBrush
+from PyQt5.QtWidgets import QWidget, QSlider, QLabel, QPushButton, \
+    QVBoxLayout, QHBoxLayout, QGridLayout, QCheckBox, QMessageBox, \
+    QLineEdit, QTextEdit, QFileDialog, QTableView, QProgressBar, QAbstractScrollArea, \
+    QAbstractItemView, QLCDNumber, QHeaderView, QListView, QStyledItemDelegate, \
+    QStackedWidget, QSizePolicy, QApplication
+
+import gamestate
+import prefetch
+import tracing
+
+if __name__ == '__main__':
+    # Spans are decided when functions are decorated, so this runs before any class is defined
+    tracing.enableFromArgs(sys.argv)
+
+# generator, dictionary and scores are imported where they are first used so
+# the start menu does not wait for them.
+
+_importsFinished = time.perf_counter()
+
+DICTIONARY_FILE = 'words_alpha.txt'
+
+MIN_ROWS = 10
+MAX_ROWS = 40
+MARATHON_MIN_ROWS = 50
+MARATHON_MAX_ROWS = 500
+CELL_SIZE = 20
+LOGO_WIDTH = 500
+TOP_SCORES = 10
+
+nElements = 20
+wordBoxChecked = False
+rowBoxChecked = False
+columnBoxChecked = False
+diagonalBoxChecked = False
+denseBoxChecked = False
+customWordBank = None
+replaySettings = None
+
+
+GameSettings = namedtuple('GameSettings', ['nElements', 'directions', 'wordSource', 'dense', 'seed'])
+
+
+def currentSettings():
+    """Return the GameSettings chosen in the start and customize menus, or those of a game being replayed."""
+    import generator
+    if replaySettings is not None:
+        return replaySettings
+    directions = []
+    if rowBoxChecked:
+        directions.append(generator.ROW)
+    if columnBoxChecked:
+        directions.append(generator.COLUMN)
+    if diagonalBoxChecked:
+        directions.append(generator.FORWARD_DIAGONAL)
+        directions.append(generator.BACKWARD_DIAGONAL)
+    if not directions:
+        directions = generator.ALL_DIRECTIONS
+    wordSource = customWordBank if wordBoxChecked and customWordBank is not None else DICTIONARY_FILE
+    return GameSettings(nElements, tuple(directions), wordSource, denseBoxChecked, None)
+
+
+def loadWords(wordSource):
+    """Return the words of a dictionary file path or a wordbank.CustomWordBank, and their hex SHA-1."""
+    if isinstance(wordSource, str):
+        import dictionary
+        wordIndex = dictionary.loadDictionary(wordSource)
+        return wordIndex, wordIndex.sourceHash
+    return wordSource.words, wordSource.wordHash
+
+
+@tracing.span('buildPuzzle')
+def buildPuzzle(settings):
+    """Generate a puzzle for settings and return its GameCode with it.
+
+    Settings without a seed get a fresh one, so every game can be replayed
+    from its code. Puzzles are kept in the puzzle cache, so replaying a code
+    loads its puzzle instead of generating it again.
+    """
+    import gamecode
+    wordList, wordHash = loadWords(settings.wordSource)
+    seed = settings.seed if settings.seed is not None else gamecode.newSeed()
+    code = gamecode.GameCode(settings.nElements, settings.directions, settings.dense, wordHash, seed)
+    try:
+        puzzles = puzzleCache()
+    except OSError:
+        return code, gamecode.generate(code, wordList)
+    return code, puzzles.load(code, wordList)
+
+
+_puzzleCache = None
+
+
+def puzzleCache():
+    """Return the shared PuzzleCache, opening it on first use."""
+    global _puzzleCache
+    if _puzzleCache is None:
+        import cache
+        _puzzleCache = cache.PuzzleCache()
+    return _puzzleCache
+
+
+prefetcher = prefetch.PuzzlePrefetcher(buildPuzzle)
+
+
+_scoreStore = None
+
+
+def scoreStore():
+    """Return the shared ScoreStore, opening it on first use."""
+    global _scoreStore
+    if _scoreStore is None:
+        import scores
+        _scoreStore = scores.openScores()
+    return _scoreStore
+
+
+_logo = None
+
+
+def logoPixmap():
+    """Return logo.png scaled to the start menu width, decoding it on first use."""
+    global _logo
+    if _logo is None:
+        _logo = QPixmap("logo.png").scaledToWidth(LOGO_WIDTH)
+    return _logo
+
+
+def prefetchNextGame():
+    """Start building the puzzle for the current menu settings in the background.
+
+    Custom word banks are only known once the customize menu is done, right
+    before the game starts, so only dictionary games are prefetched.
+    """
+    settings = currentSettings()
+    if settings.wordSource == DICTIONARY_FILE:
+        prefetcher.request(settings)
+
+
+class StartMenu(QWidget):
+    """Display window to configure the word search.
+
+    Display options to:
+        1. Select the number of rows for the word search grid
+        2. Customize the game further
+        3. Start the game
+        4. Quit the game
+
+    Attributes:
+        mainWindow: The MainWindow showing this screen.
+    """
+
+    def __init__(self, mainWindow):
+        """Initiate initUI."""
+        super().__init__()
+        self.mainWindow = mainWindow
+        self.initUI()
+
+    def initUI(self):
+        """Initiate UI elements."""
+        self.setWindowTitle("Word Search Mania")
+
+        self.slider = QSlider(PyQt5.QtCore.Qt.Horizontal)
+        self.sliderLabel = QLabel()
+        self.configSlider()
+        self.slider.valueChanged.connect(self.nRowDisplayChanged)
+
+        self.cBoxMarathon = QCheckBox('Marathon')
+        self.cBoxMarathon.setToolTip('Check to play on a huge board of up to '
+                                     + str(MARATHON_MAX_ROWS) + ' rows')
+        self.cBoxMarathon.setChecked(nElements > MAX_ROWS)
+        self.cBoxMarathon.stateChanged.connect(self.marathonBoxChecked)
+
+        self.difficultyLevel = QLabel()
+        self.nRowDisplay = QLabel()
+        self.configElementDisplay()
+        self.getSliderValue()
+        self.showRowDisplay()
+
+        self.gameCodeEdit = QLineEdit()
+        self.gameCodeEdit.setPlaceholderText('Game code (optional)')
+        self.gameCodeEdit.setToolTip('Enter the code of a game to play the exact same puzzle again')
+        self.gameCodeEdit.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
+
+        buttonStart = QPushButton('Start')
+        buttonStart.clicked.connect(self.onClickStart)
+
+        buttonQuit = QPushButton('Quit')
+        buttonQuit.clicked.connect(self.onClickQuit)
+
+        buttonCustomize = QPushButton('Customize')
+        buttonCustomize.clicked.connect(self.onClickCustomize)
+
+        logoImage = QLabel()
+        logoImage.setGeometry(10, 10, 10, 10)
+        logoImage.setPixmap(logoPixmap())
+
+        hBox = QHBoxLayout()
+        hBox.addWidget(buttonQuit)
+        hBox.addWidget(buttonCustomize)
+        hBox.addWidget(buttonStart)
+
+        grid = QGridLayout()
+        self.setLayout(grid)
+        grid.addWidget(logoImage, 0, 0)
+        grid.addWidget(self.sliderLabel, 1, 0)
+        grid.addWidget(self.difficultyLevel, 2, 0)
+        grid.addWidget(self.slider, 3, 0)
+        grid.addWidget(self.nRowDisplay, 4, 0)
+        grid.addWidget(self.cBoxMarathon, 5, 0, PyQt5.QtCore.Qt.AlignCenter)
+        grid.addWidget(self.gameCodeEdit, 6, 0)
+        grid.addLayout(hBox, 7, 0)
+
+    def reset(self):
+        """Show the board size of the last game without prefetching it again."""
+        self.slider.blockSignals(True)
+        self.cBoxMarathon.setChecked(nElements > MAX_ROWS)
+        self.configSliderRange(nElements > MAX_ROWS)
+        self.slider.setValue(nElements)
+        self.slider.blockSignals(False)
+        self.showRowDisplay()
+        self.gameCodeEdit.clear()
+
+    def configSlider(self):
+        """Configure slider attributes and slider label."""
+        self.slider.setTickPosition(QSlider.TicksBelow)
+        self.configSliderRange(nElements > MAX_ROWS)
+        self.slider.setValue(nElements)
+
+        self.sliderLabel.setText("How many rows would you like?")
+        self.sliderLabel.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
+        self.sliderLabel.setFont(QFont("Futura", 20))
+
+    def configSliderRange(self, marathon):
+        """Set the slider range to the regular or the marathon board sizes."""
+        if marathon:
+            self.slider.setRange(MARATHON_MIN_ROWS, MARATHON_MAX_ROWS)
+            self.slider.setTickInterval(50)
+            self.slider.setSingleStep(50)
+            self.slider.setPageStep(50)
+        else:
+            self.slider.setRange(MIN_ROWS, MAX_ROWS)
+            self.slider.setTickInterval(5)
+            self.slider.setSingleStep(5)
+            self.slider.setPageStep(5)
+
+    def marathonBoxChecked(self):
+        """Switch the slider between regular and marathon board sizes."""
+        self.configSliderRange(self.cBoxMarathon.isChecked())
+
+    def configElementDisplay(self):
+        """Configure difficulty label and display n row number."""
+        self.difficultyLevel.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
+        self.difficultyLevel.setText("Medium")
+        self.difficultyLevel.setStyleSheet("color: rgb(255, 193, 37)")
+
+        self.nRowDisplay.setText(str(self.slider.value()))
+        self.nRowDisplay.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
+        self.nRowDisplay.setFont(QFont("Futura", 30))
+        self.nRowDisplay.setStyleSheet("color: rgb(0, 170, 240)")
+
+    def getSliderValue(self):
+        """Get value from slider."""
+        global nElements
+        nElements = self.slider.value()
+
+    def nRowDisplayChanged(self):
+        """Change n row number to slider value and change difficulty label."""
+        self.getSliderValue()
+        prefetchNextGame()
+        self.showRowDisplay()
+
+    def showRowDisplay(self):
+        """Show the slider value and its difficulty label."""
+        self.nRowDisplay.setText(str(self.slider.value()))
+        if 10 <= self.slider.value() < 20:
+            self.difficultyLevel.setText("Easy")
+            self.difficultyLevel.setStyleSheet("color: rgb(67, 205, 128)")
+        elif 20 <= self.slider.value() < 30:
+            self.difficultyLevel.setText("Medium")
+            self.difficultyLevel.setStyleSheet("color: rgb(255, 193, 37)")
+        elif self.slider.value() <= MAX_ROWS:
+            self.difficultyLevel.setText("Hard")
+            self.difficultyLevel.setStyleSheet("color: rgb(255, 99, 71)")
+        else:
+            self.difficultyLevel.setText("Marathon")
+            self.difficultyLevel.setStyleSheet("color: rgb(147, 112, 219)")
+
+    def onClickStart(self):
+        """Open main app on button click start."""
+        self.getSliderValue()
+        if self.gameCodeEdit.text().strip() and not self.replayGameCode(self.gameCodeEdit.text()):
+            return
+        self.mainWindow.showScreen(App)
+
+    def replayGameCode(self, text):
+        """Set up the next game to replay the game code text; return whether it can be replayed."""
+        import gamecode
+        global replaySettings
+        try:
+            code = gamecode.parseCode(text)
+        except ValueError as error:
+            QMessageBox.warning(self, "Error", "That game code cannot be replayed: " + str(error) + ".", QMessageBox.Ok)
+            return False
+        if not MIN_ROWS <= code.nElements <= MARATHON_MAX_ROWS:
+            QMessageBox.warning(self, "Error", "Game codes must have between " + str(MIN_ROWS) + " and "
+                                + str(MARATHON_MAX_ROWS) + " rows.", QMessageBox.Ok)
+            return False
+        if code.dense and code.nElements > MAX_ROWS:
+            QMessageBox.warning(self, "Error", "Dense game codes must have at most " + str(MAX_ROWS) + " rows.",
+                                QMessageBox.Ok)
+            return False
+
+        for wordSource in (DICTIONARY_FILE, customWordBank):
+            if wordSource is None:
+                continue
+            try:
+                wordHash = loadWords(wordSource)[1]
+            except FileNotFoundError:
+                continue
+            if wordHash.startswith(code.wordHash):
+                replaySettings = GameSettings(code.nElements, code.directions, wordSource, code.dense, code.seed)
+                return True
+        QMessageBox.warning(self, "Error", "This game code was made with a different word list.", QMessageBox.Ok)
+        return False
+
+    def onClickQuit(self):
+        """Exit window on button click button quit."""
+        sys.exit()
+
+    def onClickCustomize(self):
+        """Initiate customize menu on button click customize."""
+        self.mainWindow.showScreen(CustomizeMenu)
+
+
+class CustomizeMenu(QWidget):
+    """Display window to customize the word search.
+
+    Display options to:
+        1. Add custom words
+        2. Configure how words are generated
+        3. Continue if done customizing
+
+    Raise pop-ups if configuration limits are not met.
+
+    Attributes:
+        mainWindow: The MainWindow showing this screen.
+        importedWords: A list of the valid words of the imported word file.
+    """
+
+    def __init__(self, mainWindow):
+        """Initiate initUI."""
+        super().__init__()
+        self.mainWindow = mainWindow
+        self.initUI()
+
+    def initUI(self):
+        """Initiate UI elements."""
+        self.setWindowTitle("Customize")
+
+        self.cBoxWords = QCheckBox('Check to add custom words', self)
+        self.cBoxWords.stateChanged.connect(self.wordBoxChecked)
+        self.cBoxWords.setToolTip('Check to add custom words')
+
+        self.cBoxRows = QCheckBox('Rows')
+        self.cBoxRows.stateChanged.connect(self.rowBoxChecked)
+        self.cBoxRows.setToolTip('Check the "row" box to generate words horizontally')
+
+        self.cBoxColumns = QCheckBox('Columns')
+        self.cBoxColumns.stateChanged.connect(self.columnBoxChecked)
+        self.cBoxColumns.setToolTip('Check the "columns" box to generate words vertically')
+
+        self.cBoxDiagonals = QCheckBox('Diagonals')
+        self.cBoxDiagonals.stateChanged.connect(self.diagonalBoxChecked)
+        self.cBoxDiagonals.setToolTip('Check the "diagonals" box to generate words diagonally')
+
+        self.cBoxDense = QCheckBox('Dense')
+        self.cBoxDense.stateChanged.connect(self.denseBoxChecked)
+        self.cBoxDense.setToolTip('Check the "dense" box to pack the grid with words that may cross and share letters')
+
+        buttonContinue = QPushButton('Continue', self)
+        buttonContinue.clicked.connect(self.onClickContinue)
+
+        # Head title
+        title = QLabel()
+        title.setText('Customize')
+        title.setFont(QFont("Futura", 50))
+        title.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
+
+        # Horizontal box that contains the title
+        titleBox = QHBoxLayout()
+        titleBox.addWidget(title)
+
+        # Description above right hand checkboxes
+        cBoxDescription = QLabel()
+        cBoxDescription.setText('How would you like\nthe words to be generated?')
+
+        # Text box to add custom words
+        self.addWordBox = QTextEdit()
+        self.addWordBox.setMaximumWidth(200)
+        self.addWordBox.setMaximumHeight(150)
+        self.addWordBox.setReadOnly(True)
+
+        # Import of a whole word file, one or more words per line
+        self.buttonImport = QPushButton('Import Words...')
+        self.buttonImport.setToolTip('Add every word of a text file to the custom words')
+        self.buttonImport.clicked.connect(self.onClickImport)
+        self.buttonImport.setEnabled(False)
+        self.importLabel = QLabel()
+
+        vBox = QVBoxLayout()
+        vBox.addWidget(cBoxDescription)
+        vBox.addWidget(self.cBoxRows)
+        vBox.addWidget(self.cBoxColumns)
+        vBox.addWidget(self.cBoxDiagonals)
+        vBox.addWidget(self.cBoxDense)
+        vBox.addWidget(buttonContinue)
+
+        vBox2 = QVBoxLayout()
+        vBox2.addWidget(self.cBoxWords)
+        vBox2.addWidget(self.addWordBox)
+        vBox2.addWidget(self.buttonImport)
+        vBox2.addWidget(self.importLabel)
+
+        grid = QGridLayout()
+        grid.addLayout(vBox2, 1, 0)
+        grid.addLayout(vBox, 1, 1)
+
+        vBoxOuter = QVBoxLayout()
+        self.setLayout(vBoxOuter)
+        vBoxOuter.addWidget(title)
+        vBoxOuter.addLayout(grid)
+
+    def reset(self):
+        """Match the checkboxes to the current settings and empty the word box."""
+        global denseBoxChecked
+        # Packing a marathon board takes tens of seconds, so dense puzzles stop at the largest regular board
+        marathon = nElements > MAX_ROWS
+        if marathon:
+            denseBoxChecked = False
+        self.cBoxDense.setEnabled(not marathon)
+        for box, checked in ((self.cBoxWords, wordBoxChecked), (self.cBoxRows, rowBoxChecked),
+                             (self.cBoxColumns, columnBoxChecked), (self.cBoxDiagonals, diagonalBoxChecked),
+                             (self.cBoxDense, denseBoxChecked)):
+            box.blockSignals(True)
+            box.setChecked(checked)
+            box.blockSignals(False)
+        self.addWordBox.clear()
+        self.addWordBox.setReadOnly(not wordBoxChecked)
+        self.addWordBox.setToolTip('Words must be 3 to ' + str(nElements) + ' characters long!')
+        self.buttonImport.setEnabled(wordBoxChecked)
+        self.importedWords = []
+        self.importLabel.clear()
+
+    def wordBoxChecked(self):
+        """Allow text to be entered into word box if checked."""
+        global wordBoxChecked
+        if self.cBoxWords.isChecked():
+            self.addWordBox.setReadOnly(False)
+            wordBoxChecked = True
+        else:
+            self.addWordBox.setReadOnly(True)
+            wordBoxChecked = False
+        self.buttonImport.setEnabled(wordBoxChecked)
+        prefetchNextGame()
+
+    def rowBoxChecked(self):
+        """Set row generation to true if checked."""
+        global rowBoxChecked
+        if self.cBoxRows.isChecked():
+            rowBoxChecked = True
+        else:
+            rowBoxChecked = False
+        prefetchNextGame()
+
+    def columnBoxChecked(self):
+        """Set column generation to true if checked."""
+        global columnBoxChecked
+        if self.cBoxColumns.isChecked():
+            columnBoxChecked = True
+        else:
+            columnBoxChecked = False
+        prefetchNextGame()
+
+    def diagonalBoxChecked(self):
+        """Set diagonal generation to true if checked."""
+        global diagonalBoxChecked
+        if self.cBoxDiagonals.isChecked():
+            diagonalBoxChecked = True
+        else:
+            diagonalBoxChecked = False
+        prefetchNextGame()
+
+    def denseBoxChecked(self):
+        """Set dense generation to true if checked."""
+        global denseBoxChecked
+        if self.cBoxDense.isChecked():
+            denseBoxChecked = True
+        else:
+            denseBoxChecked = False
+        prefetchNextGame()
+
+    def onClickImport(self):
+        """Validate the words of a chosen text file and report the skipped ones all at once."""
+        import wordbank
+        path, _ = QFileDialog.getOpenFileName(self, "Import Words", "", "Text files (*.txt);;All files (*)")
+        if not path:
+            return
+        importer = wordbank.WordBankImporter(nElements)
+        try:
+            importer.feedFile(path)
+        except OSError as error:
+            QMessageBox.warning(self, "Error", "Could not read " + path + ": " + error.strerror, QMessageBox.Ok)
+            return
+        self.importedWords = importer.words
+        self.importLabel.setText(str(len(self.importedWords)) + ' words imported')
+        if importer.rejectCount:
+            self.popUpRejects(importer)
+
+    def onClickContinue(self):
+        """Open main app window if limits met; raise pop-ups otherwise."""
+        global customWordBank
+        if not self.cBoxRows.isChecked() and not self.cBoxColumns.isChecked() and not self.cBoxDiagonals.isChecked():
+            self.popUp()
+
+        elif self.cBoxWords.isChecked():
+            import wordbank
+            importer = wordbank.WordBankImporter(nElements)
+            importer.feed(self.addWordBox.toPlainText().splitlines())
+            if importer.rejectCount:
+                self.popUpRejects(importer)
+                return
+            # The imported words were validated on import; only duplicates of the typed words are dropped
+            importer.feed(self.importedWords)
+            if len(importer.words) < wordbank.MIN_WORDS:
+                self.popUp3()
+            else:
+                customWordBank = importer.wordBank()
+                self.mainWindow.showScreen(App)
+        else:
+            self.mainWindow.showScreen(App)
+
+    def popUp(self):
+        """Raise pop-up when no generation direction is checked."""
+        QMessageBox.warning(self, "Error", 'Please select at least one direction to generate words', QMessageBox.Ok)
+
+    def popUp3(self):
+        """Raise pop-up when less than 5 words are entered."""
+        QMessageBox.warning(self, "Error", 'You must enter in at least 5 words!', QMessageBox.Ok)
+
+    def popUpRejects(self, importer):
+        """Raise one pop-up listing every custom word that was not accepted."""
+        popup = QMessageBox(QMessageBox.Warning, "Error", importer.summary(), QMessageBox.Ok, self)
+        popup.setDetailedText(importer.details())
+        popup.exec_()
+
+class BoardModel(QAbstractTableModel):
+    """Table model painting the puzzle letters and the cell flags of a GameState.
+
+    Cells are only looked up when the view paints them, and flag changes are
+    announced as dataChanged ranges, so no per-cell item objects are ever created.
+
+    Attributes:
+        gameState: The gamestate.GameState whose flags are painted.
+        nElements: An integer for the number of rows and columns.
+        letters: A bytearray of the lowercase letters in row-major order.
+        state: The bytearray of the flags of every cell, shared with gameState.
+    """
+
+    SELECTED = gamestate.SELECTED
+    FOUND = gamestate.FOUND
+    HOVER = gamestate.HOVER
+
+    foundBrush = QBrush(QColor(144, 238, 144))
+    selectedBrush = QBrush(QColor(216, 191, 216))
+    hoverBrush = QBrush(QColor('yellow'))
+
+    def __init__(self, gameState, parent=None):
+        """Initiate the model over the flags of gameState."""
+        super().__init__(parent)
+        self.gameState = gameState
+        self.nElements = gameState.nElements
+        self.letters = gameState.puzzle.grid
+        self.state = gameState.state
+
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of rows of the grid."""
+        return 0 if parent.isValid() else self.nElements
+
+    def columnCount(self, parent=QModelIndex()):
+        """Return the number of columns of the grid."""
+        return 0 if parent.isValid() else self.nElements
+
+    def data(self, index, role=PyQt5.QtCore.Qt.DisplayRole):
+        """Return the letter, alignment or background of a cell."""
+        i = index.row() * self.nElements + index.column()
+        if role == PyQt5.QtCore.Qt.DisplayRole:
+            if self.state[i] & self.SELECTED:
+                return chr(self.letters[i]).upper()
+            return chr(self.letters[i])
+        if role == PyQt5.QtCore.Qt.TextAlignmentRole:
+            return PyQt5.QtCore.Qt.AlignCenter
+        if role == PyQt5.QtCore.Qt.BackgroundRole:
+            flags = self.state[i]
+            if flags & self.SELECTED:
+                return self.selectedBrush
+            if flags & self.FOUND:
+                return self.foundBrush
+            if flags & self.HOVER:
+                return self.hoverBrush
+        return None
+
+    def hasFlag(self, row, col, flag):
+        """Return True if the cell at row, col has flag set."""
+        return self.gameState.hasFlag(row, col, flag)
+
+    def setFlag(self, row, col, flag, on=True):
+        """Set or clear flag on the cell at row, col."""
+        self.updateCells([(row, col)], flag if on else 0, 0 if on else flag)
+
+    def updateCells(self, cells, setFlags=0, clearFlags=0):
+        """Set and clear flags on a list of (row, col) cells and announce one changed range."""
+        self.announce(self.gameState.updateCells(cells, setFlags, clearFlags))
+
+    def announce(self, cells):
+        """Announce that the flags of a list of (row, col) cells changed, as one range."""
+        if cells:
+            rows = [row for row, col in cells]
+            cols = [col for row, col in cells]
+            self.dataChanged.emit(self.index(min(rows), min(cols)), self.index(max(rows), max(cols)))
+
+    def selectedCells(self):
+        """Return the (row, col) of every selected cell in row-major order."""
+        return self.gameState.selectedCells()
+
+
+class WordBankModel(QAbstractListModel):
+    """List model of the word bank with a found flag per word.
+
+    Attributes:
+        words: A sorted list of strings of the words to find.
+        found: A bytearray with a 1 for every found word, parallel to words.
+    """
+
+    FoundRole = PyQt5.QtCore.Qt.UserRole
+
+    def __init__(self, words, parent=None):
+        """Initiate the model with no word found."""
+        super().__init__(parent)
+        self.words = sorted(words)
+        self.found = bytearray(len(self.words))
+        self.rows = {word: row for row, word in enumerate(self.words)}
+
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of words in the bank."""
+        return 0 if parent.isValid() else len(self.words)
+
+    def data(self, index, role=PyQt5.QtCore.Qt.DisplayRole):
+        """Return the word or whether it has been found."""
+        if role == PyQt5.QtCore.Qt.DisplayRole:
+            return self.words[index.row()]
+        if role == self.FoundRole:
+            return bool(self.found[index.row()])
+        return None
+
+    def markFound(self, word):
+        """Flag word as found and announce the change of its row only."""
+        row = self.rows[word]
+        self.found[row] = 1
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [self.FoundRole])
+
+
+class StrikeDelegate(QStyledItemDelegate):
+    """Draw found words of a WordBankModel with a line through them."""
+
+    def initStyleOption(self, option, index):
+        """Strike the font of found words."""
+        super().initStyleOption(option, index)
+        if index.data(WordBankModel.FoundRole):
+            option.font.setStrikeOut(True)
+
+
+class App(QWidget):
+    """Display window for the main game and start the timer.
+
+    Display options to:
+        1. Select letters on the table
+        2. Pause/Resume the game
+        3. Quit the game
+
+    Attributes:
+        mainWindow: The MainWindow showing this screen.
+        gameCode: The gamecode.GameCode that regenerates the puzzle.
+        puzzle: The generator.Puzzle being played.
+        gameState: The gamestate.GameState holding the selection, found words and time played.
+        boardModel: The BoardModel rendering the puzzle in the table view.
+        wordBankModel: The WordBankModel listing the words and whether they are found.
+    """
+
+    def __init__(self, mainWindow):
+        """Initiate initUI."""
+        super().__init__()
+        self.mainWindow = mainWindow
+        self.gameCode = None
+        self.puzzle = None
+        self.gameState = None
+        self.boardModel = None
+        self.wordBankModel = None
+        self.initUI()
+
+    def initUI(self):
+        """Initiate UI elements."""
+        title = 'Word Search Mania'
+        self.setWindowTitle(title)
+
+        self.wordBankBox = QListView()
+        self.tableView = QTableView()
+        self.progress = QProgressBar()
+        self.timer = PyQt5.QtCore.QTimer()
+
+        self.createTable()
+        self.createWordBank()
+        self.createProgressBar()
+        self.createTimer()
+        self.mouseTracking()
+
+        wordBankTitle = QLabel()
+        wordBankTitle.setText("       Word Bank")
+        font = QFont()
+        font.setBold(True)
+        wordBankTitle.setFont(font)
+
+        buttonClear = QPushButton('Clear', self)
+        buttonClear.setToolTip('This clears your word selection.')
+        buttonClear.clicked.connect(self.onClickClear)
+
+        buttonQuit = QPushButton('Quit', self)
+        buttonQuit.setToolTip('This will buttonQuit your game. You will loose all progress.')
+        buttonQuit.clicked.connect(self.onClickQuit)
+
+        self.buttonPause = QPushButton('Pause')
+        self.buttonPause.setToolTip('This pauses the game.')
+        self.buttonPause.clicked.connect(self.onClickPause)
+
+        self.gameCodeLabel = QLabel()
+        self.gameCodeLabel.setTextInteractionFlags(PyQt5.QtCore.Qt.TextSelectableByMouse)
+        self.gameCodeLabel.setToolTip('Enter this code in the start menu to play the same puzzle again.')
+
+        vBox = QVBoxLayout()
+        vBox.addWidget(wordBankTitle)
+        vBox.addWidget(self.wordBankBox)
+        vBox.addWidget(buttonClear)
+        vBox.addWidget(self.buttonPause)
+        vBox.addWidget(buttonQuit)
+
+        self.grid = QGridLayout()
+        self.grid.addLayout(vBox, 0, 1)
+        self.grid.addWidget(self.tableView, 0, 0)
+        self.grid.addWidget(self.progress, 1, 0)
+        self.grid.addWidget(self.LCD, 1, 1)
+        self.grid.addWidget(self.gameCodeLabel, 2, 0, 1, 2)
+
+        self.setLayout(self.grid)
+
+    @tracing.span('App.reset')
+    def reset(self):
+        """Start a new game on the next puzzle, reusing the widgets of the last one."""
+        global wordBoxChecked
+        global rowBoxChecked
+        global columnBoxChecked
+        global diagonalBoxChecked
+        global denseBoxChecked
+        global replaySettings
+
+        self.gameCode, self.puzzle = prefetcher.take(currentSettings())
+        wordBoxChecked = False
+        rowBoxChecked = False
+        columnBoxChecked = False
+        diagonalBoxChecked = False
+        denseBoxChecked = False
+        replaySettings = None
+        prefetchNextGame()
+
+        if not self.puzzle.placements:
+            # Nothing to find would count as a win on the first tick
+            self.timer.stop()
+            QMessageBox.warning(self, "Error", 'None of the words could be hidden on this board!', QMessageBox.Ok)
+            QTimer.singleShot(0, lambda: self.mainWindow.showScreen(StartMenu))
+            return
+
+        import gamecode
+        self.gameCodeLabel.setText("Game code: " + gamecode.formatCode(self.gameCode))
+
+        self.gameState = gamestate.GameState(self.puzzle)
+
+        self.boardModel = BoardModel(self.gameState, self.tableView)
+        replaceModel(self.tableView, self.boardModel)
+        self.wordBankModel = WordBankModel(self.puzzle.wordBank, self.wordBankBox)
+        replaceModel(self.wordBankBox, self.wordBankModel)
+
+        if self.puzzle.nElements > MAX_ROWS:
+            # Marathon boards scroll inside a viewport the size of the largest regular board
+            viewportSize = MAX_ROWS * CELL_SIZE + 2 * self.tableView.frameWidth()
+            self.tableView.setSizeAdjustPolicy(QAbstractScrollArea.AdjustIgnored)
+            self.tableView.setMinimumSize(viewportSize, viewportSize)
+        else:
+            self.tableView.setMinimumSize(0, 0)
+            self.tableView.setSizeAdjustPolicy(QAbstractScrollArea.AdjustToContents)
+
+        self.progress.setRange(0, self.gameState.wordCount)
+        self.setProgressBar()
+        self.tableView.show()
+        self.buttonPause.setText("Pause")
+
+        self.showTime()
+        self.timer.start(1000)
+
+    def createTable(self):
+        """Configure the word search table."""
+        self.tableView.setEditTriggers(QAbstractItemView.NoEditTriggers)
+
+        # Uniform fixed sections let the view compute the visible cells
+        # directly, so only those are ever asked for data and painted
+        for header in (self.tableView.horizontalHeader(), self.tableView.verticalHeader()):
+            header.setMinimumSectionSize(CELL_SIZE)
+            header.setDefaultSectionSize(CELL_SIZE)
+            header.setSectionResizeMode(QHeaderView.Fixed)
+
+        self.tableView.horizontalHeader().hide()
+        self.tableView.verticalHeader().hide()
+        self.tableView.setShowGrid(False)
+        self.tableView.clicked.connect(self.letterClicked)
+
+    def createWordBank(self):
+        """Configure the word bank of the words to be found."""
+        self.wordBankBox.setItemDelegate(StrikeDelegate(self.wordBankBox))
+        self.wordBankBox.setUniformItemSizes(True)
+        self.wordBankBox.setSelectionMode(QAbstractItemView.NoSelection)
+        self.wordBankBox.setMaximumWidth(120)
+        font = QFont()
+        font.setFamily('Arial')
+        self.wordBankBox.setFont(font)
+
+    @tracing.span('App.strikeWord')
+    def strikeWord(self, word):
+        """Strike word with a line if the word is found."""
+        self.wordBankModel.markFound(word)
+
+    def mouseTracking(self):
+        """Track mouse movement of the table."""
+        self.tableView.setMouseTracking(True)
+        self.tableView.entered.connect(self.cellEntered)
+
+    def cellEntered(self, index):
+        """Forward the cell the mouse entered to cellHover."""
+        self.cellHover(index.row(), index.column())
+
+    @tracing.span('App.cellHover')
+    def cellHover(self, row, column):
+        """Highlight letter if mouse is hovering over it.
+
+        Only the previously hovered cell and the entered cell are touched;
+        whether a cell is found or selected comes straight from its state flags.
+        """
+        for cell in self.gameState.hover(row, column):
+            self.boardModel.announce([cell])
+
+    def letterClicked(self, index):
+        """Forward a click on the table to onClickLetter."""
+        self.onClickLetter()
+
+    @tracing.span('App.onClickLetter')
+    def onClickLetter(self):
+        """Highlight letters on selection and highlight word green if found on click."""
+        toggled = []
+        for index in self.tableView.selectionModel().selectedIndexes():
+            self.gameState.toggle(index.row(), index.column())
+            toggled.append((index.row(), index.column()))
+        self.tableView.clearSelection()
+        self.boardModel.announce(toggled)
+
+        placement = self.gameState.checkSelection()
+        if placement is None:
+            return
+
+        self.setProgressBar()
+        self.strikeWord(placement.word)
+        self.boardModel.announce(self.puzzle.cells(placement))
+
+    def onClickClear(self):
+        """Clear word selection on button click."""
+        self.boardModel.announce(self.gameState.clearSelection())
+
+    def onClickQuit(self):
+        """Display option to quit the app on button click."""
+        quitMessage = QMessageBox()
+        quitMessage = QMessageBox.question(self, "Quit", "Are you sure you would like to buttonQuit?",
+                                           QMessageBox.No | QMessageBox.Yes)
+        if quitMessage == QMessageBox.Yes:
+            sys.exit()
+        else:
+            pass
+
+    def createProgressBar(self):
+        """Generate progress bar of with the progress of the words found until completion."""
+        self.progress.setToolTip("Shows your word completion progress.")
+
+    def setProgressBar(self):
+        """Set value for the progress bar."""
+        self.progress.setValue(self.gameState.progress)
+
+    def createTimer(self):
+        """Generate a timer."""
+        self.timer.timeout.connect(self.Time)
+
+        self.LCD = QLCDNumber()
+        self.LCD.setSegmentStyle(QLCDNumber.Flat)
+
+    @tracing.span('App.Time')
+    def Time(self):
+        """Increment timer by a second."""
+        self.gameState.tick()
+        self.showTime()
+
+        if self.gameState.complete:
+            self.timer.stop()
+            self.addHighScore()
+            self.mainWindow.showScreen(HighScoreMenu)
+
+    def showTime(self):
+        """Show the time played on the LCD."""
+        time = PyQt5.QtCore.QTime(0, 0, 0).addSecs(self.gameState.elapsedSeconds)
+        self.LCD.display(time.toString("hh:mm:ss"))
+
+    def onClickPause(self):
+        """Pause and resume the game on button click."""
+        if not self.gameState.paused:
+            self.timer.stop()
+            self.gameState.pause()
+            self.tableView.hide()
+            self.buttonPause.setText("Unpause")
+        else:
+            self.timer.start()
+            self.gameState.resume()
+            self.tableView.show()
+            self.tableView.clearSelection()
+            self.buttonPause.setText("Pause")
+
+    def addHighScore(self):
+        """Save highScore to the score store."""
+        size = self.gameState.nElements
+        if 10 <= size <= 19:
+            mode = "Easy"
+        elif 20 <= size <= 29:
+            mode = "Medium"
+        elif size <= MAX_ROWS:
+            mode = "Hard"
+        else:
+            mode = "Marathon"
+        scoreStore().addScore(mode, self.gameState.elapsedSeconds)
+
+
+class HighScoreMenu(QWidget):
+    """Display window to report current and previous high scores
+
+    Display options to:
+        1. Start new game
+        2. Quit the game
+
+    Attributes:
+        mainWindow: The MainWindow showing this screen.
+    """
+    def __init__(self, mainWindow):
+        """Initiate initUI."""
+        super().__init__()
+        self.mainWindow = mainWindow
+        self.initUI()
+
+    def initUI(self):
+        """Initiate UI elements."""
+        self.setWindowTitle("Word Search Mania")
+
+        self.scores = scoreStore()
+
+        self.easyBoard = QTextEdit()
+        self.easyBoard.setReadOnly(True)
+        self.easyBoard.setMaximumWidth(150)
+        self.easyBoard.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
+        self.mediumBoard = QTextEdit()
+        self.mediumBoard.setReadOnly(True)
+        self.mediumBoard.setMaximumWidth(150)
+        self.mediumBoard.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
+        self.hardBoard = QTextEdit()
+        self.hardBoard.setReadOnly(True)
+        self.hardBoard.setMaximumWidth(150)
+        self.hardBoard.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
+        self.marathonBoard = QTextEdit()
+        self.marathonBoard.setReadOnly(True)
+        self.marathonBoard.setMaximumWidth(150)
+        self.marathonBoard.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
+
+        titleLabel = QLabel()
+        titleLabel.setText("High Scores")
+        titleLabel.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
+        titleLabel.setFont(QFont("Futura", 30))
+        easyLabel = QLabel()
+        easyLabel.setText("Easy Mode")
+        easyLabel.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
+        easyLabel.setToolTip("The game is in easy mode if you chose rows 10 - 19.")
+        mediumLabel = QLabel()
+        mediumLabel.setText("Medium Mode")
+        mediumLabel.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
+        mediumLabel.setToolTip("The game is in medium mode if you chose rows 20 - 29.")
+        hardLabel = QLabel()
+        hardLabel.setText("Hard Mode")
+        hardLabel.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
+        hardLabel.setToolTip("The game is in hard mode if you chose rows 30 - 40.")
+        marathonLabel = QLabel()
+        marathonLabel.setText("Marathon Mode")
+        marathonLabel.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
+        marathonLabel.setToolTip("The game is in marathon mode if you chose more than 40 rows.")
+
+        self.buttonStartOver = QPushButton()
+        self.buttonStartOver.setText("Play Again")
+        self.buttonStartOver.clicked.connect(self.onClickStartOver)
+
+        self.buttonQuit = QPushButton()
+        self.buttonQuit.setText("Quit")
+        self.buttonQuit.clicked.connect(self.onClickQuit)
+
+
+        self.createHighScoreDisplay()
+
+        HBoxLabel = QHBoxLayout()
+        HBoxLabel.addWidget(easyLabel)
+        HBoxLabel.addWidget(mediumLabel)
+        HBoxLabel.addWidget(hardLabel)
+        HBoxLabel.addWidget(marathonLabel)
+        HBox = QHBoxLayout()
+        HBox.addWidget(self.easyBoard)
+        HBox.addWidget(self.mediumBoard)
+        HBox.addWidget(self.hardBoard)
+        HBox.addWidget(self.marathonBoard)
+        HBoxButton = QHBoxLayout()
+        HBoxButton.addWidget(self.buttonQuit)
+        HBoxButton.addWidget(self.buttonStartOver)
+        self.grid = QGridLayout()
+        self.setLayout(self.grid)
+        self.grid.addWidget(titleLabel, 0, 0)
+        self.grid.addLayout(HBoxLabel, 1, 0)
+        self.grid.addLayout(HBox, 2, 0)
+        self.grid.addWidget(self.currentScore, 3, 0)
+        self.grid.addWidget(self.highScore, 4, 0)
+        self.grid.addLayout(HBoxButton, 5, 0)
+
+    def reset(self):
+        """Refill the boards and messages from the score store."""
+        import scores
+        for board in (self.easyBoard, self.mediumBoard, self.hardBoard, self.marathonBoard):
+            board.clear()
+        for score in self.scores.topScores("Easy", TOP_SCORES):
+            self.addEasyBoard(scores.formatTime(score.seconds))
+        for score in self.scores.topScores("Medium", TOP_SCORES):
+            self.addMediumBoard(scores.formatTime(score.seconds))
+        for score in self.scores.topScores("Hard", TOP_SCORES):
+            self.addHardBoard(scores.formatTime(score.seconds))
+        for score in self.scores.topScores("Marathon", TOP_SCORES):
+            self.addMarathonBoard(scores.formatTime(score.seconds))
+        self.showLatestScore()
+
+    def addEasyBoard(self, score):
+        """Populate scores score to easy section of the board."""
+        self.easyBoard.append(score)
+
+    def addMediumBoard(self, score):
+        """Populate scores score to medium section of the board."""
+        self.mediumBoard.append(score)
+
+    def addHardBoard(self, score):
+        """Populate scores to hard section of the board."""
+        self.hardBoard.append(score)
+
+    def addMarathonBoard(self, score):
+        """Populate scores to marathon section of the board."""
+        self.marathonBoard.append(score)
+
+    def onClickStartOver(self):
+        """Open main app on button click start over."""
+        self.mainWindow.showScreen(StartMenu)
+
+    def onClickQuit(self):
+        """Display option to quit the app on button click."""
+        self.quitMessage = QMessageBox()
+        self.quitMessage = QMessageBox.question(self, "Quit", "Are you sure you would like to buttonQuit?",
+                                                QMessageBox.No | QMessageBox.Yes)
+        if self.quitMessage == QMessageBox.Yes:
+            sys.exit()
+        else:
+            pass
+
+    def createHighScoreDisplay(self):
+        self.currentScore = QLabel()
+        self.currentScore.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
+        self.currentScore.setFont(QFont("Futura", 14))
+
+        self.highScore = QLabel()
+        self.highScore.setAlignment(PyQt5.QtCore.Qt.AlignCenter)
+        self.highScore.setFont(QFont("Futura", 14))
+
+    def showLatestScore(self):
+        """Report the latest score and whether it beat the high score of its mode."""
+        import scores
+        latestScore = self.scores.latestScore()
+        if latestScore is None:
+            self.currentScore.clear()
+            self.highScore.clear()
+            return
+        currentTime = scores.formatTime(latestScore.seconds)
+
+        if latestScore.seconds >= 3600:
+            time = " hours"
+        elif latestScore.seconds >= 60:
+            time = " minutes"
+        else:
+            time = " seconds"
+
+        self.currentScore.setText("You beat the word search in " + currentTime
+                                  + time + " in " + latestScore.mode + " Mode.")
+
+        highestScore = self.scores.bestScore(latestScore.mode)
+        if highestScore.seconds == latestScore.seconds:
+            self.highScore.setText("You beat your high score!")
+        else:
+            self.highScore.setText("You did not beat your high score of "
+                                   + scores.formatTime(highestScore.seconds) + " .")
+
+
+class MainWindow(QStackedWidget):
+    """Single top-level window showing one screen at a time.
+
+    Each screen is built the first time it is shown and reset, rather than
+    rebuilt, every time after that.
+
+    Attributes:
+        screens: A dict of the screens built so far, keyed by their class.
+    """
+
+    def __init__(self):
+        """Show the start menu."""
+        super().__init__()
+        self.screens = {}
+        self.showScreen(StartMenu)
+
+    def showScreen(self, screenClass):
+        """Reset the screen of screenClass, building it on first use, and bring it to the front."""
+        screen = self.screens.get(screenClass)
+        if screen is None:
+            screen = screenClass(self)
+            self.screens[screenClass] = screen
+            self.addWidget(screen)
+        screen.reset()
+
+        # Hidden screens are ignored so the window fits the current one
+        for index in range(self.count()):
+            policy = QSizePolicy.Preferred if self.widget(index) is screen else QSizePolicy.Ignored
+            self.widget(index).setSizePolicy(policy, policy)
+        self.setCurrentWidget(screen)
+        self.setWindowTitle(screen.windowTitle())
+        screen.layout().invalidate()
+        self.layout().invalidate()
+        self.adjustSize()
+
+
+def replaceModel(view, model):
+    """Show model in view and release the model and selection model it replaces."""
+    oldModel = view.model()
+    oldSelectionModel = view.selectionModel()
+    view.setModel(model)
+    for old in (oldModel, oldSelectionModel):
+        if old is not None:
+            old.deleteLater()
+
+
+class FirstPaintFilter(QObject):
+    """Call a function once, after the watched widget is first painted.
+
+    Attributes:
+        callback: A callable taking no arguments.
+    """
+
+    def __init__(self, callback):
+        """Store the callback."""
+        super().__init__()
+        self.callback = callback
+
+    def eventFilter(self, watched, event):
+        """Schedule the callback for after the first paint event and stop watching."""
+        if event.type() == QEvent.Paint:
+            watched.removeEventFilter(self)
+            QTimer.singleShot(0, self.callback)
+        return False
+
+
+def printStartupReport(phases):
+    """Print the duration of each startup phase and their total in milliseconds."""
+    for name, seconds in phases:
+        print('{:<14}{:>9.1f} ms'.format(name, seconds * 1000))
+    print('{:<14}{:>9.1f} ms'.format('total', sum(seconds for name, seconds in phases) * 1000))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == 'generate':
+        import batch
+        sys.exit(batch.main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == 'serve':
+        import server
+        sys.exit(server.main(sys.argv[2:]))
+
+    startupReport = '--startup-report' in sys.argv
+    if startupReport:
+        sys.argv.remove('--startup-report')
+
+    phases = [('imports', _importsFinished - _importStart)]
+    phaseStart = time.perf_counter()
+    app = QApplication(sys.argv)
+    phases.append(('QApplication', time.perf_counter() - phaseStart))
+
+    phaseStart = time.perf_counter()
+    main = MainWindow()
+    main.show()
+    phases.append(('start menu', time.perf_counter() - phaseStart))
+
+    phaseStart = time.perf_counter()
+
+    def onFirstPaint():
+        """Prefetch the first game once the start menu is on screen."""
+        phases.append(('first paint', time.perf_counter() - phaseStart))
+        prefetchNextGame()
+        if startupReport:
+            printStartupReport(phases)
+            app.quit()
+
+    firstPaint = FirstPaintFilter(onFirstPaint)
+    main.installEventFilter(firstPaint)
+    sys.exit(app.exec_())
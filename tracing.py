@@ -0,0 +1,125 @@
+# Word Search Mania is under the MIT License
+#
+# Copyright (c) 2018 Mihir Patel
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Record where the time goes as Chrome trace events.
+
+Tracing is off unless the WSM_TRACE environment variable names the file to
+write (or is 1, for trace.json), or enable() is called before the traced
+modules are imported. Functions are traced with the span decorator:
+
+    @tracing.span('generatePuzzle')
+    def generatePuzzle(...):
+
+While tracing is off, span returns the function itself, so untraced code
+runs exactly as if it were not decorated. When the process exits the
+recorded spans are written as a trace that chrome://tracing or
+https://ui.perfetto.dev can open.
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+
+
+DEFAULT_PATH = 'trace.json'
+
+ENABLED = False
+_path = None
+_events = []
+_threadNames = {}
+_pid = os.getpid()
+
+
+def enable(path=DEFAULT_PATH):
+    """Start recording spans and write them to path when the process exits."""
+    global ENABLED, _path
+    if not ENABLED:
+        atexit.register(_saveAtExit)
+        # Spawned worker processes see this and leave the file to us
+        os.environ.setdefault('WSM_TRACE_PID', str(os.getpid()))
+    ENABLED = True
+    _path = path
+
+
+def enableFromArgs(argv):
+    """Enable tracing if argv has --trace or --trace=PATH, removing the option from argv."""
+    for argument in list(argv):
+        if argument == '--trace':
+            argv.remove(argument)
+            enable()
+        elif argument.startswith('--trace='):
+            argv.remove(argument)
+            enable(argument[len('--trace='):])
+
+
+def span(name):
+    """Return a decorator recording each call of a function as a span called name."""
+    def decorate(function):
+        if not ENABLED:
+            return function
+
+        @functools.wraps(function)
+        def traced(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                _record(name, start, time.perf_counter())
+        return traced
+    return decorate
+
+
+def _record(name, start, end):
+    thread = threading.current_thread()
+    if thread.ident not in _threadNames:
+        _threadNames[thread.ident] = thread.name
+    _events.append((name, start, end, thread.ident))
+
+
+def events():
+    """Return the spans recorded so far as Chrome trace events."""
+    trace = [{'name': 'thread_name', 'ph': 'M', 'pid': _pid, 'tid': ident, 'args': {'name': threadName}}
+             for ident, threadName in list(_threadNames.items())]
+    for name, start, end, ident in list(_events):
+        trace.append({'name': name, 'cat': 'wsm', 'ph': 'X', 'pid': _pid, 'tid': ident,
+                      'ts': start * 1e6, 'dur': (end - start) * 1e6})
+    return trace
+
+
+def save(path=None):
+    """Write the recorded spans to path, or the path tracing was enabled with."""
+    with open(path or _path, 'w') as traceFile:
+        json.dump({'traceEvents': events(), 'displayTimeUnit': 'ms'}, traceFile)
+
+
+def _saveAtExit():
+    # Worker processes inherit tracing; only the process that enabled it writes the file
+    if str(os.getpid()) == os.environ.get('WSM_TRACE_PID'):
+        save()
+
+
+_environmentPath = os.environ.get('WSM_TRACE')
+if _environmentPath:
+    enable(DEFAULT_PATH if _environmentPath == '1' else _environmentPath)
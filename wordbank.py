@@ -0,0 +1,141 @@
+# Word Search Mania is under the MIT License
+#
+# Copyright (c) 2018 Mihir Patel
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Validate custom word banks, from the customize menu or from large word files.
+
+Words are checked one at a time as lines stream in, so a file is never held
+in memory, only the words kept from it. Every rejected word is counted by
+reason, and the first MAX_REPORTED_REJECTS are kept with their line numbers
+for the report shown to the player.
+
+Usage:
+    python3 wordbank.py WORDFILE
+"""
+
+import hashlib
+import sys
+from collections import namedtuple
+
+
+MIN_LENGTH = 3
+# Placements store word lengths in one byte
+MAX_LENGTH = 255
+MIN_WORDS = 5
+MAX_REPORTED_REJECTS = 50
+
+TOO_SHORT = 'shorter than ' + str(MIN_LENGTH) + ' letters'
+TOO_LONG = 'longer than ' + str(MAX_LENGTH) + ' letters'
+NOT_ALPHABETIC = 'not only the letters a to z'
+DUPLICATE = 'a duplicate'
+
+_LETTERS = frozenset('abcdefghijklmnopqrstuvwxyz')
+
+
+CustomWordBank = namedtuple('CustomWordBank', ['words', 'wordHash'])
+Reject = namedtuple('Reject', ['source', 'lineNumber', 'word', 'reason'])
+
+
+class WordBankImporter:
+    """Collect valid, distinct words from any number of sources in a single pass each.
+
+    Attributes:
+        maxLength: An integer for the length of the longest word accepted.
+        words: A list of the accepted lowercase words in the order they were read.
+        rejects: A list of the first MAX_REPORTED_REJECTS Rejects.
+        rejectCounts: A dict of the number of rejected words per reason.
+    """
+
+    def __init__(self, maxLength=MAX_LENGTH):
+        """Start with no words, accepting words of up to maxLength letters, such as the board size."""
+        self.maxLength = min(maxLength, MAX_LENGTH)
+        self._tooLong = TOO_LONG if self.maxLength == MAX_LENGTH else 'longer than ' + str(self.maxLength) + ' letters'
+        self.words = []
+        self.rejects = []
+        self.rejectCounts = {}
+        self._seen = set()
+
+    def feed(self, lines, source=''):
+        """Validate every whitespace-separated word of the lines of an iterable."""
+        for lineNumber, line in enumerate(lines, 1):
+            for word in line.split():
+                word = word.lower()
+                if len(word) < MIN_LENGTH:
+                    self._reject(source, lineNumber, word, TOO_SHORT)
+                elif len(word) > self.maxLength:
+                    self._reject(source, lineNumber, word, self._tooLong)
+                elif not _LETTERS.issuperset(word):
+                    self._reject(source, lineNumber, word, NOT_ALPHABETIC)
+                elif word in self._seen:
+                    self._reject(source, lineNumber, word, DUPLICATE)
+                else:
+                    self._seen.add(word)
+                    self.words.append(word)
+
+    def feedFile(self, path):
+        """Validate every word of the text file at path, reading it a line at a time."""
+        with open(path, 'r', encoding='utf-8', errors='replace') as wordFile:
+            self.feed(wordFile, path)
+
+    @property
+    def rejectCount(self):
+        """Return the number of rejected words."""
+        return sum(self.rejectCounts.values())
+
+    def wordBank(self):
+        """Return the accepted words as a CustomWordBank."""
+        words = tuple(self.words)
+        return CustomWordBank(words, hashlib.sha1('\n'.join(words).encode('ascii')).hexdigest())
+
+    def summary(self):
+        """Return the number of rejected words per reason, for the player."""
+        lines = [str(self.rejectCount) + ' words were skipped:']
+        for reason, count in sorted(self.rejectCounts.items()):
+            lines.append('    ' + reason + ': ' + str(count))
+        return '\n'.join(lines)
+
+    def details(self):
+        """Return where each reported rejected word was found and why it was rejected."""
+        lines = []
+        for reject in self.rejects:
+            location = 'line ' + str(reject.lineNumber)
+            if reject.source:
+                location = reject.source + ', ' + location
+            lines.append(location + ': "' + reject.word + '" is ' + reject.reason)
+        if self.rejectCount > len(self.rejects):
+            lines.append('and ' + str(self.rejectCount - len(self.rejects)) + ' more')
+        return '\n'.join(lines)
+
+    def _reject(self, source, lineNumber, word, reason):
+        self.rejectCounts[reason] = self.rejectCounts.get(reason, 0) + 1
+        if len(self.rejects) < MAX_REPORTED_REJECTS:
+            self.rejects.append(Reject(source, lineNumber, word, reason))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        sys.exit('usage: python3 wordbank.py WORDFILE')
+    importer = WordBankImporter()
+    importer.feedFile(sys.argv[1])
+    print(str(len(importer.words)) + ' words accepted')
+    if importer.rejectCount:
+        print(importer.summary())
+        print(importer.details())